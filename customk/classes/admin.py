@@ -1,11 +1,25 @@
 from typing import Any, Dict, Optional
 
 from django.contrib import admin, messages
+from django.db import transaction
+from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse
 
+from common.services.uploads import (
+    delete_uploaded_objects,
+    file_extension,
+    store_objects,
+)
+
 from .forms import ClassImagesForm
 from .models import Category, Class, ClassDate, ClassImages, ExchangeRate, Genre
-from .utils import upload_image_to_object_storage
+from .services import get_unviewed_class_count, mark_class_viewed
+
+ADMIN_IMAGE_FIELDS = {
+    "thumbnail_image": "thumbnail_image_urls",
+    "description_image": "description_image_urls",
+    "detail_image": "detail_image_urls",
+}
 
 
 class ClassDateInline(admin.TabularInline):  # type: ignore
@@ -28,11 +42,19 @@ class ClassAdmin(admin.ModelAdmin):  # type: ignore
         "price",
         "price_in_usd",
         "address",
+        "genre",
         "is_viewed_badge",
     )
+    list_select_related = ("genre",)
+    # 검색 결과마다 전체 개수를 다시 세는 COUNT(*) 를 생략합니다.
+    show_full_result_count = False
     filter_horizontal = ("category",)
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Class]:
+        return super().get_queryset(request).defer("search_vector")
+
     def price_in_usd(self, obj: Class) -> Optional[float]:
+        # 환율은 프로세스 캐시에서 읽으므로 행마다 쿼리하지 않습니다.
         usd_price = obj.get_price_in_usd()
         return usd_price
 
@@ -49,7 +71,7 @@ class ClassAdmin(admin.ModelAdmin):  # type: ignore
     def changelist_view(
         self, request: HttpRequest, extra_context: Optional[Dict[str, Any]] = None
     ) -> HttpResponse:
-        unviewed_classes_count = Class.objects.filter(is_viewed=False).count()
+        unviewed_classes_count = get_unviewed_class_count()
 
         if unviewed_classes_count > 0:
             messages.warning(
@@ -66,10 +88,8 @@ class ClassAdmin(admin.ModelAdmin):  # type: ignore
         form_url: str = "",
         extra_context: Optional[Dict[str, Any]] = None,
     ) -> HttpResponse:
-        course = self.get_object(request, object_id)
-        if course and not course.is_viewed:
-            course.is_viewed = True
-            course.save()
+        if object_id.isdigit():
+            mark_class_viewed(int(object_id))
 
         return super().change_view(request, object_id, form_url, extra_context)
 
@@ -91,35 +111,30 @@ class ClassImagesAdmin(admin.ModelAdmin):
         "detail_image_urls",
     ]
     search_fields = ["class_id"]
+    list_select_related = ["class_id"]
+    show_full_result_count = False
 
     def save_model(self, request, obj, form, change):
-        super().save_model(request, obj, form, change)
-
-        # Handle thumbnail image
-        if form.cleaned_data.get("thumbnail_image"):
-            thumbnail_image = form.cleaned_data["thumbnail_image"]
-            thumbnail_url = upload_image_to_object_storage(thumbnail_image)
-            thumbnail_image_urls = obj.thumbnail_image_urls or []
-            thumbnail_image_urls.append(thumbnail_url)
-            obj.thumbnail_image_urls = thumbnail_image_urls
-
-        # Handle description image
-        if form.cleaned_data.get("description_image"):
-            description_image = form.cleaned_data["description_image"]
-            description_url = upload_image_to_object_storage(description_image)
-            description_image_urls = obj.description_image_urls or []
-            description_image_urls.append(description_url)
-            obj.description_image_urls = description_image_urls
-
-        # Handle detail image
-        if form.cleaned_data.get("detail_image"):
-            detail_image = form.cleaned_data["detail_image"]
-            detail_url = upload_image_to_object_storage(detail_image)
-            detail_image_urls = obj.detail_image_urls or []
-            detail_image_urls.append(detail_url)
-            obj.detail_image_urls = detail_image_urls
-
-        obj.save()
+        # 선택된 이미지를 한 번에 병렬 업로드한 뒤 한 번만 저장합니다.
+        images = [
+            (url_field, form.cleaned_data[form_field])
+            for form_field, url_field in ADMIN_IMAGE_FIELDS.items()
+            if form.cleaned_data.get(form_field)
+        ]
+        image_urls = store_objects(
+            [(image, file_extension(image)) for _, image in images], "class-images"
+        )
+        for (url_field, _), image_url in zip(images, image_urls):
+            setattr(obj, url_field, [*(getattr(obj, url_field) or []), image_url])
+
+        try:
+            # admin 은 요청 전체를 트랜잭션으로 감싸므로, 세이브포인트로 실패를 되돌려야
+            # 같은 연결에서 업로드한 객체의 참조를 해제할 수 있습니다.
+            with transaction.atomic():
+                super().save_model(request, obj, form, change)
+        except Exception:
+            delete_uploaded_objects(image_urls)
+            raise
 
 
 @admin.register(Genre)
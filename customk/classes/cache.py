@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from common.cache import bump_cache_version, get_cache_versions, shared_cache_timeout
+
+from .models import ExchangeRate
+
+CLASS_DETAIL_CACHE_TIMEOUT = shared_cache_timeout(60 * 10)
+GLOBAL_VERSION_KEY = "class-detail-version:global"
+HITS_KEY = "class-detail-cache:hits"
+MISSES_KEY = "class-detail-cache:misses"
+
+
+def _version_key(class_id: int) -> str:
+    return f"class-detail-version:{class_id}"
+
+
+def _count(key: str) -> None:
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+def get_class_detail_cache_key(class_id: int, is_popular: bool) -> str:
+    """
+    DB 를 읽기 전에 호출해야 합니다. 조회 도중 무효화가 일어나면 결과가
+    이전 버전 키에 저장되어 다시 읽히지 않습니다.
+    인기 여부와 날짜(is_new), 환율은 시그널 없이 바뀌므로 키에 직접 포함합니다.
+    """
+    versions = get_cache_versions([GLOBAL_VERSION_KEY, _version_key(class_id)])
+    global_version = versions[GLOBAL_VERSION_KEY]
+    class_version = versions[_version_key(class_id)]
+    return (
+        f"class-detail:{class_id}:{global_version}:{class_version}:"
+        f"{ExchangeRate.get_usd_rate()}:{int(is_popular)}:{timezone.localdate()}"
+    )
+
+
+def get_cached_class_detail(cache_key: str) -> Optional[dict[str, Any]]:
+    entry = cache.get(cache_key)
+    _count(MISSES_KEY if entry is None else HITS_KEY)
+    return entry
+
+
+def cache_class_detail(
+    cache_key: str, data: Any, etag: str, last_modified: Optional[datetime]
+) -> dict[str, Any]:
+    entry = {"data": data, "etag": etag, "last_modified": last_modified}
+    cache.set(cache_key, entry, timeout=CLASS_DETAIL_CACHE_TIMEOUT)
+    return entry
+
+
+def invalidate_class_detail(class_id: int) -> None:
+    bump_cache_version(_version_key(class_id))
+
+
+def invalidate_all_class_details() -> None:
+    bump_cache_version(GLOBAL_VERSION_KEY)
+
+
+def get_class_detail_cache_stats() -> dict[str, Any]:
+    counters = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = counters.get(HITS_KEY, 0)
+    misses = counters.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else None,
+        # 공유 캐시가 아니면 요청을 처리한 워커 한 곳의 집계입니다.
+        "scope": "shared" if settings.SHARED_CACHE else "worker",
+    }
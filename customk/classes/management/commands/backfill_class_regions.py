@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from classes.services import backfill_class_regions
+
+
+class Command(BaseCommand):
+    help = "클래스 주소에서 도/시/구 지역 컬럼을 다시 추출해 채웁니다."
+
+    def handle(self, *args, **options):
+        updated = backfill_class_regions()
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 클래스의 지역 정보를 갱신했습니다.")
+        )
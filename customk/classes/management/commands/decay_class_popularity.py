@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from classes.services import decay_class_payment_stats
+
+
+class Command(BaseCommand):
+    help = "인기 클래스 집계에서 30일이 지난 결제 통계를 삭제합니다. (매일 실행)"
+
+    def handle(self, *args, **options):
+        deleted = decay_class_payment_stats()
+        self.stdout.write(
+            self.style.SUCCESS(f"{deleted}개의 결제 통계를 삭제했습니다.")
+        )
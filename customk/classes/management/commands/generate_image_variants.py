@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from classes.models import ClassImages
+from classes.services import class_images_need_variants, generate_class_image_variants
+from common.services.images import needs_image_variants
+from reviews.models import ReviewImage
+from reviews.services import generate_review_image_variants
+
+
+class Command(BaseCommand):
+    help = "파생 이미지(WebP 썸네일)가 없는 클래스/리뷰 이미지를 찾아 생성합니다."
+
+    def handle(self, *args, **options):
+        class_count = 0
+        for class_images in ClassImages.objects.iterator():
+            if class_images_need_variants(class_images):
+                generate_class_image_variants(class_images.id)
+                class_count += 1
+
+        review_count = 0
+        for review_image in ReviewImage.objects.iterator():
+            if needs_image_variants(
+                review_image.image_url, review_image.image_variants
+            ):
+                generate_review_image_variants(review_image.id)
+                review_count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"클래스 이미지 {class_count}건, 리뷰 이미지 {review_count}건의 "
+                "파생 이미지를 생성했습니다."
+            )
+        )
@@ -0,0 +1,233 @@
+import csv
+import json
+import os
+import time
+from datetime import date
+from datetime import time as dt_time
+from itertools import islice
+from typing import Any, Iterator
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from classes.models import (
+    Category,
+    Class,
+    ClassDate,
+    ClassImages,
+    ClassImportProgress,
+    Genre,
+)
+from classes.services import (
+    invalidate_class_calendars,
+    invalidate_class_facets,
+    invalidate_class_region_tree,
+    invalidate_unviewed_class_count,
+)
+from classes.utils import parse_region
+
+CLASS_FIELDS = (
+    "title",
+    "description",
+    "max_person",
+    "require_person",
+    "price",
+    "address",
+    "discount_rate",
+)
+INT_FIELDS = ("max_person", "require_person", "price", "discount_rate")
+LIST_FIELDS = (
+    "class_type",
+    "category",
+    "thumbnail_image_urls",
+    "description_image_urls",
+    "detail_image_urls",
+)
+IMAGE_FIELDS = ("thumbnail_image_urls", "description_image_urls", "detail_image_urls")
+CSV_LIST_SEPARATOR = "|"
+
+
+def read_jsonl(path: str) -> Iterator[dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_csv(path: str) -> Iterator[dict[str, Any]]:
+    """
+    목록 컬럼은 '|' 로 구분하고, dates 컬럼은 JSON 배열 문자열로 받습니다.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            record: dict[str, Any] = {
+                k: v for k, v in row.items() if v not in ("", None)
+            }
+            for field in LIST_FIELDS:
+                if field in record:
+                    record[field] = record[field].split(CSV_LIST_SEPARATOR)
+            if "dates" in record:
+                record["dates"] = json.loads(record["dates"])
+            yield record
+
+
+def parse_record(record: dict[str, Any]) -> dict[str, Any]:
+    if not record.get("title") or not record.get("address"):
+        raise ValueError("title and address are required")
+
+    fields = {name: record[name] for name in CLASS_FIELDS if name in record}
+    for name in INT_FIELDS:
+        if name in fields:
+            fields[name] = int(fields[name])
+
+    dates = [
+        {
+            "start_date": date.fromisoformat(item["start_date"]),
+            "start_time": dt_time.fromisoformat(item["start_time"]),
+            "end_time": dt_time.fromisoformat(item["end_time"]),
+            "person": int(item.get("person", 0)),
+        }
+        for item in record.get("dates", [])
+    ]
+    images = {name: list(record.get(name, [])) for name in IMAGE_FIELDS}
+
+    return {
+        "fields": fields,
+        # bulk_create 는 Class.save() 를 거치지 않으므로 지역을 미리 계산합니다.
+        "region": parse_region(fields["address"]),
+        "class_type": list(record.get("class_type", [])),
+        "genre": record.get("genre") or None,
+        "category": list(record.get("category", [])),
+        "dates": dates,
+        "images": images if any(images.values()) else None,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV/JSONL 파일의 클래스를 bulk_create 로 일괄 등록합니다. "
+        "배치와 같은 트랜잭션에서 진행 상황을 DB 에 기록하므로 중단 후 다시 실행하면 "
+        "이어서 진행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="가져올 .csv 또는 .jsonl 파일 경로")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--source", help="진행 상황을 기록할 원본 이름 (기본값: 파일의 절대 경로)"
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="기록된 진행 상황을 무시하고 처음부터",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        batch_size = options["batch_size"]
+        source = options["source"] or os.path.abspath(path)
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive")
+
+        if path.endswith(".csv"):
+            records = read_csv(path)
+        elif path.endswith((".jsonl", ".ndjson")):
+            records = read_jsonl(path)
+        else:
+            raise CommandError("Only .csv and .jsonl files are supported")
+
+        progress, _ = ClassImportProgress.objects.get_or_create(source=source)
+        if options["restart"]:
+            progress.processed = 0
+            progress.save(update_fields=["processed", "updated_at"])
+        processed = progress.processed
+        if processed:
+            self.stdout.write(f"{processed}번째 레코드 이후부터 이어서 가져옵니다.")
+        records = islice(records, processed, None)
+
+        self.genres = {genre.name: genre for genre in Genre.objects.all()}
+        self.categories = {
+            category.name: category for category in Category.objects.all()
+        }
+
+        started = time.monotonic()
+        class_count = date_count = 0
+        while True:
+            batch: list[dict[str, Any]] = []
+            try:
+                for record in islice(records, batch_size):
+                    batch.append(parse_record(record))
+            except (KeyError, TypeError, ValueError) as e:
+                raise CommandError(f"Invalid record #{processed + len(batch) + 1}: {e}")
+            if not batch:
+                break
+
+            processed += len(batch)
+            date_count += self.import_batch(batch, progress, processed)
+            class_count += len(batch)
+
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f"{processed}개 처리 (클래스 {class_count}, 일정 {date_count}, "
+                f"{elapsed:.1f}s)"
+            )
+
+        invalidate_class_region_tree()
+        invalidate_unviewed_class_count()
+        invalidate_class_facets()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"클래스 {class_count}개, 일정 {date_count}개를 가져왔습니다. "
+                "썸네일 파생 이미지는 generate_image_variants 로 생성하세요."
+            )
+        )
+
+    def _get_genre(self, name: str) -> Genre:
+        if name not in self.genres:
+            self.genres[name], _ = Genre.objects.get_or_create(name=name)
+        return self.genres[name]
+
+    def _get_category(self, name: str) -> Category:
+        if name not in self.categories:
+            self.categories[name], _ = Category.objects.get_or_create(name=name)
+        return self.categories[name]
+
+    @transaction.atomic
+    def import_batch(
+        self, batch: list[dict[str, Any]], progress: ClassImportProgress, processed: int
+    ) -> int:
+        classes = Class.objects.bulk_create(
+            Class(
+                **item["fields"],
+                **dict(zip(("province", "city", "district"), item["region"])),
+                class_type=item["class_type"],
+                genre=self._get_genre(item["genre"]) if item["genre"] else None,
+            )
+            for item in batch
+        )
+
+        category_through = Class.category.through
+        category_through.objects.bulk_create(
+            category_through(class_id=klass.id, category_id=self._get_category(name).id)
+            for klass, item in zip(classes, batch)
+            for name in dict.fromkeys(item["category"])
+        )
+        dates = ClassDate.objects.bulk_create(
+            (
+                ClassDate(class_id=klass, **date_data)
+                for klass, item in zip(classes, batch)
+                for date_data in item["dates"]
+            ),
+            batch_size=5000,
+        )
+        ClassImages.objects.bulk_create(
+            ClassImages(class_id=klass, **item["images"])
+            for klass, item in zip(classes, batch)
+            if item["images"]
+        )
+        # 진행 상황을 배치와 함께 커밋해야 중단 후 같은 배치를 다시 가져오지 않습니다.
+        progress.processed = processed
+        progress.save(update_fields=["processed", "updated_at"])
+
+        invalidate_class_calendars(class_date.start_date for class_date in dates)
+        return len(dates)
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from classes.services import rebuild_class_ratings
+
+
+class Command(BaseCommand):
+    help = "리뷰 테이블을 기준으로 클래스 평점 집계 컬럼을 다시 계산합니다. (최근 30일 집계 갱신을 위해 매일 실행)"
+
+    def handle(self, *args, **options):
+        updated = rebuild_class_ratings()
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 클래스의 평점 집계를 갱신했습니다.")
+        )
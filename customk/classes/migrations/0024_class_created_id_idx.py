@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-18 07:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("classes", "0023_remove_class_category_alter_class_genre_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="class",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="class_created_id_idx"
+            ),
+        ),
+    ]
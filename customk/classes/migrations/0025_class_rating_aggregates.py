@@ -0,0 +1,69 @@
+# Generated by Django 5.1 on 2026-10-18 07:09
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    Class = apps.get_model("classes", "Class")
+    Review = apps.get_model("reviews", "Review")
+
+    def aggregate(queryset, expression, output_field):
+        subquery = (
+            queryset.filter(class_id=OuterRef("pk"))
+            .order_by()
+            .values("class_id")
+            .annotate(value=expression)
+            .values("value")
+        )
+        return Coalesce(Subquery(subquery), Value(0), output_field=output_field)
+
+    reviews = Review.objects.all()
+    recent_reviews = reviews.filter(created_at__gte=timezone.now() - timedelta(days=30))
+    sum_field = Class._meta.get_field("rating_sum")
+    count_field = Class._meta.get_field("rating_count")
+    Class.objects.update(
+        rating_sum=aggregate(reviews, Sum("rating"), sum_field),
+        rating_count=aggregate(reviews, Count("id"), count_field),
+        recent_rating_sum=aggregate(recent_reviews, Sum("rating"), sum_field),
+        recent_rating_count=aggregate(recent_reviews, Count("id"), count_field),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("classes", "0024_class_created_id_idx"),
+        ("reviews", "0006_alter_reviewimage_image_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="class",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="class",
+            name="rating_sum",
+            field=models.DecimalField(
+                decimal_places=1, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="class",
+            name="recent_rating_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="class",
+            name="recent_rating_sum",
+            field=models.DecimalField(
+                decimal_places=1, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
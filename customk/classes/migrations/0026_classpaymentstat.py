@@ -0,0 +1,62 @@
+# Generated by Django 5.1 on 2026-10-18 07:15
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def backfill_class_payment_stats(apps, schema_editor):
+    ClassPaymentStat = apps.get_model("classes", "ClassPaymentStat")
+    Payment = apps.get_model("payments", "Payment")
+
+    daily_payments = (
+        Payment.objects.filter(created_at__gte=timezone.now() - timedelta(days=30))
+        .annotate(date=TruncDate("created_at"))
+        .values("class_id", "date")
+        .annotate(payment_count=Count("id"))
+        .order_by()
+    )
+    ClassPaymentStat.objects.bulk_create(
+        ClassPaymentStat(**row) for row in daily_payments
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("classes", "0025_class_rating_aggregates"),
+        ("payments", "0002_payment_refunded_amount"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClassPaymentStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("class_id", models.IntegerField()),
+                ("date", models.DateField()),
+                ("payment_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["date"], name="class_payment_stat_date_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("class_id", "date"), name="unique_class_payment_stat"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_class_payment_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.1 on 2026-10-18 07:17
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+TRIGRAM_INDEXES = {
+    "class_title_trgm_idx": "title",
+    "class_description_trgm_idx": "description",
+    "class_address_trgm_idx": "address",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # 한글 검색(icontains)은 UPPER(col::text) LIKE 로 실행되므로 같은 식에 trigram 인덱스를 생성합니다.
+    # pg_trgm 확장이 없는 환경에서는 인덱스 없이 순차 탐색으로 동작합니다.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "classes_class" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("classes", "0026_classpaymentstat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="class",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.SearchVector(
+                            "title", config="simple", weight="A"
+                        ),
+                        "||",
+                        django.contrib.postgres.search.SearchVector(
+                            "description", config="simple", weight="B"
+                        ),
+                        django.contrib.postgres.search.SearchConfig("simple"),
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "address", config="simple", weight="C"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="class",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="class_search_vector_idx"
+            ),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
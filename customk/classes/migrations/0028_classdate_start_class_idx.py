@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-18 07:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("classes", "0027_class_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="classdate",
+            index=models.Index(
+                fields=["start_date", "class_id"], name="classdate_start_class_idx"
+            ),
+        ),
+    ]
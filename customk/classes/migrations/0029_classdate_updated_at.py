@@ -0,0 +1,21 @@
+# Generated by Django 5.1 on 2026-10-18 07:25
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("classes", "0028_classdate_start_class_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="classdate",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
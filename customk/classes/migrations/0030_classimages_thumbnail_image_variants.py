@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-18 07:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("classes", "0029_classdate_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="classimages",
+            name="thumbnail_image_variants",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
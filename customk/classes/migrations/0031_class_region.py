@@ -0,0 +1,39 @@
+# Generated by Django 5.1 on 2026-10-18 07:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("classes", "0030_classimages_thumbnail_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="class",
+            name="city",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=50
+            ),
+        ),
+        migrations.AddField(
+            model_name="class",
+            name="district",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=50
+            ),
+        ),
+        migrations.AddField(
+            model_name="class",
+            name="province",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=50
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="class",
+            index=models.Index(
+                fields=["province", "city", "district"], name="class_region_idx"
+            ),
+        ),
+    ]
@@ -2,12 +2,17 @@ import math
 from decimal import Decimal
 from typing import Optional
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
-from django.db.models import Avg, JSONField
+from django.db.models import JSONField
 
+from common.cache import ProcessCache
 from common.models import CommonModel
 
+from .utils import parse_region
+
 
 class ExchangeRate(models.Model):
     currency = models.CharField(max_length=10, default="USD")
@@ -16,6 +21,22 @@ class ExchangeRate(models.Model):
     def __str__(self) -> str:
         return f"{self.currency}: {self.rate}"
 
+    @classmethod
+    def get_usd_rate(cls) -> Optional[Decimal]:
+        return usd_rate_cache.get()
+
+
+def _load_usd_rate() -> Optional[Decimal]:
+    return (
+        ExchangeRate.objects.filter(currency="USD")
+        .values_list("rate", flat=True)
+        .first()
+    )
+
+
+# ExchangeRate 저장/삭제 시 classes.signals 에서 invalidate 됩니다.
+usd_rate_cache: ProcessCache[Optional[Decimal]] = ProcessCache(_load_usd_rate, ttl=60)
+
 
 class Genre(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -44,29 +65,107 @@ class Class(CommonModel):
     genre = models.ForeignKey("Genre", on_delete=models.CASCADE, null=True, blank=True)
     category = models.ManyToManyField("Category", blank=True)  # type: ignore
     discount_rate = models.PositiveIntegerField(default=0)
+    # address 에서 파싱한 지역. save() 에서 갱신되며 backfill_class_regions 로 일괄 채웁니다.
+    province = models.CharField(max_length=50, blank=True, default="", editable=False)
+    city = models.CharField(max_length=50, blank=True, default="", editable=False)
+    district = models.CharField(max_length=50, blank=True, default="", editable=False)
     is_viewed = models.BooleanField(default=False)
+    # 리뷰 작성/수정/삭제 시그널에서 F() 로 갱신되는 평점 집계 컬럼
+    rating_sum = models.DecimalField(
+        max_digits=12, decimal_places=1, default=0, editable=False
+    )
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    # 최근 30일 리뷰 집계. rebuild_class_ratings 커맨드가 주기적으로 윈도우를 갱신합니다.
+    recent_rating_sum = models.DecimalField(
+        max_digits=12, decimal_places=1, default=0, editable=False
+    )
+    recent_rating_count = models.PositiveIntegerField(default=0, editable=False)
+    # 전문 검색용 tsvector. DB 가 저장 시점에 계산하므로 bulk_create/update 에도 반영됩니다.
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config="simple")
+        + SearchVector("description", weight="B", config="simple")
+        + SearchVector("address", weight="C", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="class_created_id_idx"),
+            GinIndex(fields=["search_vector"], name="class_search_vector_idx"),
+            models.Index(
+                fields=["province", "city", "district"], name="class_region_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title
 
-    def get_price_in_usd(self) -> Optional[float]:
-        exchange_rate: Optional[ExchangeRate] = ExchangeRate.objects.filter(
-            currency="USD"
-        ).first()
-        if not exchange_rate:
+    def save(self, *args, **kwargs):
+        self.set_region()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "address" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "province", "city", "district"}
+        super().save(*args, **kwargs)
+
+    def set_region(self) -> None:
+        self.province, self.city, self.district = parse_region(self.address)
+
+    @property
+    def average_rating(self) -> Optional[float]:
+        if not self.rating_count:
+            return None
+        return float(self.rating_sum / self.rating_count)
+
+    @property
+    def recent_average_rating(self) -> float:
+        if not self.recent_rating_count:
+            return 0
+        return float(self.recent_rating_sum / self.recent_rating_count)
+
+    def get_price_in_usd(self, rate: Optional[Decimal] = None) -> Optional[float]:
+        if rate is None:
+            rate = ExchangeRate.get_usd_rate()
+        if not rate:
             return None
 
-        price_in_usd = Decimal(self.price) / Decimal(exchange_rate.rate)
+        price_in_usd = Decimal(self.price) / Decimal(rate)
         rounded_price = math.ceil(price_in_usd)
         return rounded_price
 
 
+class ClassPaymentStat(models.Model):
+    # 결제 생성 시 payments.signals 에서 증가하는 클래스별 일별 결제 건수
+    class_id = models.IntegerField()
+    date = models.DateField()
+    payment_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["class_id", "date"], name="unique_class_payment_stat"
+            )
+        ]
+        indexes = [models.Index(fields=["date"], name="class_payment_stat_date_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.class_id} ({self.date}): {self.payment_count}"
+
+
 class ClassDate(models.Model):
     class_id = models.ForeignKey(Class, related_name="dates", on_delete=models.CASCADE)
     start_date = models.DateField(blank=False, null=False)
     start_time = models.TimeField(blank=False, null=False)
     end_time = models.TimeField(blank=False, null=False)
     person = models.PositiveIntegerField(blank=False, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["start_date", "class_id"], name="classdate_start_class_idx"
+            ),
+        ]
 
 
 class ClassImages(models.Model):
@@ -74,6 +173,18 @@ class ClassImages(models.Model):
     description_image_urls = JSONField(blank=True, default=list)
     detail_image_urls = JSONField(blank=True, default=list)
     thumbnail_image_urls = JSONField(blank=True, default=list)
+    # thumbnail_image_urls 와 같은 순서의 {"original", "320", "640", "1280"} WebP URL 목록
+    thumbnail_image_variants = JSONField(blank=True, default=list, editable=False)
 
     def __str__(self) -> str:
         return f"{self.class_id.title}"
+
+
+class ClassImportProgress(models.Model):
+    # import_classes 가 원본별로 처리한 레코드 수. 배치와 같은 트랜잭션에서 갱신됩니다.
+    source = models.CharField(max_length=500, unique=True)
+    processed = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.source}: {self.processed}"
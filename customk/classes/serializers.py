@@ -1,51 +1,55 @@
 import base64
-import uuid
 from datetime import timedelta
+from typing import Optional, Union
 
-from django.core.cache import cache
-from django.db.models import Avg, Count
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 
-from common.services.ncp_api_conf import ObjectStorage
+from common.serializers import (
+    DynamicFieldsMixin,
+    ImageUploadField,
+    parse_requested_fields,
+)
+from common.services.images import schedule_image_task
+from common.services.uploads import (
+    ObjectData,
+    delete_uploaded_objects,
+    file_extension,
+    store_objects,
+)
 from config.logger import logger
-from payments.models import Payment
 
 from .models import Category, Class, ClassDate, ClassImages
+from .services import (
+    class_images_need_variants,
+    generate_class_image_variants,
+    get_popular_class_ids,
+    invalidate_class_calendars,
+)
 
+CLASS_IMAGE_FIELDS = (
+    "thumbnail_image_urls",
+    "description_image_urls",
+    "detail_image_urls",
+)
 
-def upload_image_to_object_storage(base64_image: str) -> str:
-    obj_client = ObjectStorage()
+
+def decode_class_image(image: Union[str, UploadedFile]) -> tuple[ObjectData, str]:
+    if isinstance(image, UploadedFile):
+        return image, file_extension(image)
 
     try:
-        formatted, img_str = base64_image.split(";base64,")
+        formatted, img_str = image.split(";base64,")
         ext = formatted.split("/")[-1]
-        decoded_image = base64.b64decode(img_str)
+        return base64.b64decode(img_str), ext
     except (ValueError, IndexError) as e:
         logger.error(f"Invalid base64 image format: {str(e)}")
         raise serializers.ValidationError(
             {"class_image_base64": "Invalid base64 image format"}
         )
 
-    file_name = f"{uuid.uuid4()}.{ext}"
-
-    bucket_name = "customk-imagebucket"
-    object_name = f"class-images/{file_name}"
-    try:
-        status_code, image_url = obj_client.put_object(
-            bucket_name, object_name, decoded_image
-        )
-        if status_code != 200:
-            error_message = f"Failed to upload image. Status code: {status_code}"
-            logger.error(error_message)
-            raise serializers.ValidationError({"class_image": error_message})
-        return image_url
-    except Exception as e:
-        logger.error(f"Unexpected error during ObjectStorage upload: {str(e)}")
-        raise serializers.ValidationError(
-            {"class_image": "An unexpected error occurred"}
-        )
-
 
 class ClassDateSerializer(serializers.ModelSerializer):
     class_id = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -55,6 +59,11 @@ class ClassDateSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class ClassAvailabilitySerializer(ClassDateSerializer):
+    class_title = serializers.CharField(read_only=True)
+    remaining_seats = serializers.IntegerField(read_only=True)
+
+
 class ClassImagesSerializer(serializers.ModelSerializer):
     class_id = serializers.PrimaryKeyRelatedField(read_only=True)
 
@@ -70,7 +79,7 @@ class ClassImagesSerializer(serializers.ModelSerializer):
         }
 
 
-class ClassSerializer(serializers.ModelSerializer):
+class ClassSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     dates = ClassDateSerializer(many=True, required=False)
     images = ClassImagesSerializer(many=True, required=False)
     is_new = serializers.SerializerMethodField()
@@ -83,10 +92,20 @@ class ClassSerializer(serializers.ModelSerializer):
     average_rating = serializers.FloatField(read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
     is_popular = serializers.SerializerMethodField()
+    thumbnail = serializers.SerializerMethodField()
+    thumbnail_image_files = serializers.ListField(
+        child=ImageUploadField(), write_only=True, required=False
+    )
+    description_image_files = serializers.ListField(
+        child=ImageUploadField(), write_only=True, required=False
+    )
+    detail_image_files = serializers.ListField(
+        child=ImageUploadField(), write_only=True, required=False
+    )
 
     class Meta:
         model = Class
-        fields = "__all__"
+        exclude = ("search_vector",)
 
     def get_genre(self, obj):
         return obj.genre.name if obj.genre else None
@@ -98,81 +117,101 @@ class ClassSerializer(serializers.ModelSerializer):
         return timezone.now() - obj.created_at <= timedelta(days=30)
 
     def get_price_in_usd(self, obj):
+        # 목록 뷰는 get_prices_in_usd 로 환율을 한 번만 읽어 context 로 넘깁니다.
+        prices = self.context.get("prices_in_usd")
+        if prices is not None and obj.id in prices:
+            return prices[obj.id]
         usd_price = obj.get_price_in_usd()
         return usd_price
 
-    def get_average_rating(self, obj):
-        one_month_ago = timezone.now() - timedelta(days=30)
-        recent_reviews = obj.reviews.filter(created_at__gte=one_month_ago)
-
-        average_rating = recent_reviews.aggregate(average=Avg("rating"))["average"] or 0
-
-        return round(average_rating, 1)
-
     def get_is_best(self, obj):
-        one_month_ago = timezone.now() - timedelta(days=30)
-        recent_reviews = obj.reviews.filter(created_at__gte=one_month_ago)
-
-        average_rating = recent_reviews.aggregate(average=Avg("rating"))["average"] or 0
-
-        return average_rating >= 3.5
+        return obj.recent_average_rating >= 3.5
 
     def get_is_popular(self, obj):
-        popular_classes = cache.get("popular_classes", None)
-
-        if popular_classes is None:
-            one_month_ago = timezone.now() - timedelta(days=30)
-
-            classes_with_payments = (
-                Payment.objects.filter(created_at__gte=one_month_ago)
-                .values("class_id")
-                .annotate(payment_count=Count("id"))
-                .order_by("-payment_count")
-            )
-
-            total_classes = len(classes_with_payments)
-            top_20_percent_count = max(1, int(total_classes * 0.2))
-
-            popular_class_ids = [
-                entry["class_id"]
-                for entry in classes_with_payments[:top_20_percent_count]
-            ]
-
-            cache.set("popular_classes", popular_class_ids, timeout=60 * 60 * 24 * 14)
-            popular_classes = popular_class_ids
-
-        is_popular = obj.id in popular_classes
-        print(f"Class ID: {obj.id}, Is Popular: {is_popular}")
-        return is_popular
+        return obj.id in get_popular_class_ids()
+
+    def get_thumbnail(self, obj):
+        # 목록용 대표 이미지. 파생 이미지가 준비되어 있으면 320px WebP 를 사용합니다.
+        for images in obj.images.all():
+            if not images.thumbnail_image_urls:
+                continue
+            original = images.thumbnail_image_urls[0]
+            variants = images.thumbnail_image_variants
+            if variants and variants[0].get("original") == original:
+                return variants[0].get("320", original)
+            return original
+        return None
 
     def create(self, validated_data):
         dates_data = validated_data.pop("dates", [])
         images_data64 = validated_data.pop("images", [])
         categories_data = validated_data.pop("category", [])
+        # multipart 로 받은 파일 목록은 하나의 이미지 세트로 취급합니다.
+        image_files = {
+            field: validated_data.pop(field.replace("_urls", "_files"), [])
+            for field in CLASS_IMAGE_FIELDS
+        }
+        if any(image_files.values()):
+            images_data64.append(image_files)
+
+        # 업로드는 트랜잭션 밖에서 한 번에 병렬로 수행하고, 실패 시 올라간 객체는 정리합니다.
+        images = [
+            decode_class_image(image)
+            for image_data64 in images_data64
+            for field in CLASS_IMAGE_FIELDS
+            for image in image_data64.get(field, [])
+        ]
+        try:
+            uploaded_urls = iter(store_objects(images, "class-images"))
+        except Exception as e:
+            logger.error(f"Unexpected error during ObjectStorage upload: {str(e)}")
+            raise serializers.ValidationError(
+                {"class_image": "An unexpected error occurred"}
+            )
+        images_data = [
+            {
+                field: [next(uploaded_urls) for _ in image_data64.get(field, [])]
+                for field in CLASS_IMAGE_FIELDS
+            }
+            for image_data64 in images_data64
+        ]
+
+        try:
+            with transaction.atomic():
+                class_instance = Class.objects.create(**validated_data)
+                class_instance.category.set(categories_data)
+                class_dates = ClassDate.objects.bulk_create(
+                    ClassDate(class_id=class_instance, **date_data)
+                    for date_data in dates_data
+                )
+                invalidate_class_calendars(
+                    class_date.start_date for class_date in class_dates
+                )
+                class_images = ClassImages.objects.bulk_create(
+                    ClassImages(class_id=class_instance, **image_data)
+                    for image_data in images_data
+                )
+                # bulk_create 는 post_save 를 보내지 않으므로 파생 이미지 작업을 직접 예약합니다.
+                for image in class_images:
+                    if class_images_need_variants(image):
+                        schedule_image_task(generate_class_image_variants, image.id)
+        except Exception:
+            delete_uploaded_objects(
+                url
+                for image_data in images_data
+                for urls in image_data.values()
+                for url in urls
+            )
+            raise
 
-        class_instance = Class.objects.create(**validated_data)
-
-        class_instance.category.set(categories_data)
+        return class_instance
 
-        for date_data in dates_data:
-            ClassDate.objects.create(class_id=class_instance, **date_data)
 
-        for image_data64 in images_data64:
-            thumbnail_url = upload_image_to_object_storage(
-                image_data64["thumbnail_image_url"]
-            )
-            description_url = upload_image_to_object_storage(
-                image_data64["description_image_url"]
-            )
-            detail_image_url = upload_image_to_object_storage(
-                image_data64["detail_image_url"]
-            )
+CLASS_EXPANDABLE_FIELDS = ("dates", "images", "category")
 
-            ClassImages.objects.create(
-                class_id=class_instance,
-                thumbnail_image_url=thumbnail_url,
-                description_image_url=description_url,
-                detail_image_url=detail_image_url,
-            )
 
-        return class_instance
+def get_requested_class_fields(params) -> Optional[frozenset[str]]:
+    readable = [
+        name for name, field in ClassSerializer().fields.items() if not field.write_only
+    ]
+    return parse_requested_fields(params, readable, CLASS_EXPANDABLE_FIELDS)
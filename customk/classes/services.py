@@ -0,0 +1,770 @@
+import hashlib
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from itertools import chain
+from typing import Collection, Iterable, Optional
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    Max,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+from django.http import QueryDict
+from django.utils import timezone
+from django.utils.http import urlencode
+
+from common.cache import (
+    ProcessCache,
+    bump_cache_version,
+    get_cache_version,
+    shared_cache_timeout,
+)
+from common.conditional import make_etag
+from common.services.images import (
+    create_image_variants,
+    image_variant_urls,
+    needs_image_variants,
+    release_image_variants,
+)
+from reviews.models import Review
+
+from .cache import invalidate_class_detail
+from .models import Class, ClassDate, ClassImages, ClassPaymentStat, ExchangeRate
+
+RECENT_RATING_WINDOW = timedelta(days=30)
+POPULAR_CLASS_WINDOW = timedelta(days=30)
+POPULAR_CLASS_RATIO = 0.2
+HANGUL_PATTERN = re.compile(r"[\u3131-\u318e\uac00-\ud7a3]")
+CLASS_FILTER_PARAMS = (
+    "genre",
+    "category",
+    "min_price",
+    "max_price",
+    "class_type",
+    "region",
+)
+PRICE_BANDS: tuple[tuple[int, Optional[int]], ...] = (
+    (0, 30000),
+    (30000, 50000),
+    (50000, 100000),
+    (100000, None),
+)
+CLASS_FACETS_CACHE_TIMEOUT = 60 * 5
+CLASS_FACETS_VERSION_KEY = "class-facets-version"
+MAX_AVAILABILITY_WINDOW = timedelta(days=31)
+CLASS_CALENDAR_CACHE_TIMEOUT = 60 * 5
+UNVIEWED_CLASS_COUNT_CACHE_KEY = "class-unviewed-count"
+UNVIEWED_CLASS_COUNT_CACHE_TIMEOUT = shared_cache_timeout(60 * 10)
+CLASS_REGION_TREE_CACHE_KEY = "class-region-tree"
+CLASS_REGION_TREE_CACHE_TIMEOUT = 60 * 10
+# prefetch 대상 연관 관계와 그것을 사용하는 ClassSerializer 필드
+CLASS_FIELD_RELATIONS = {
+    "dates": {"dates"},
+    "images": {"images", "thumbnail"},
+    "category": {"category"},
+}
+
+
+def get_class_queryset(fields: Optional[Collection[str]] = None) -> QuerySet[Class]:
+    """
+    ClassSerializer 가 참조하는 연관 객체를 미리 불러오는 기본 쿼리셋입니다.
+    목록 크기와 관계없이 클래스 조회 1회 + prefetch 3회로 직렬화할 수 있습니다.
+    fields 를 지정하면 해당 필드에 필요한 연관 객체만 불러옵니다.
+    """
+    queryset = Class.objects.defer("search_vector")
+    if fields is None:
+        return queryset.select_related("genre").prefetch_related(
+            "dates", "images", "category"
+        )
+
+    if "genre" in fields:
+        queryset = queryset.select_related("genre")
+    if "description" not in fields:
+        queryset = queryset.defer("description")
+    prefetch = [
+        relation
+        for relation, needed_by in CLASS_FIELD_RELATIONS.items()
+        if needed_by & set(fields)
+    ]
+    return queryset.prefetch_related(*prefetch)
+
+
+def touch_class(class_id: int) -> None:
+    # 연관 객체 삭제처럼 updated_at 으로 드러나지 않는 변경을 클래스 버전에 반영합니다.
+    Class.objects.filter(id=class_id).update(updated_at=timezone.now())
+
+
+def get_unviewed_class_count() -> int:
+    # 관리자 목록 화면마다 COUNT 를 실행하지 않도록 캐시하고, 클래스 변경 시 무효화합니다.
+    count = cache.get(UNVIEWED_CLASS_COUNT_CACHE_KEY)
+    if count is None:
+        count = Class.objects.filter(is_viewed=False).count()
+        cache.set(
+            UNVIEWED_CLASS_COUNT_CACHE_KEY,
+            count,
+            timeout=UNVIEWED_CLASS_COUNT_CACHE_TIMEOUT,
+        )
+    return count
+
+
+def invalidate_unviewed_class_count() -> None:
+    cache.delete(UNVIEWED_CLASS_COUNT_CACHE_KEY)
+
+
+def mark_class_viewed(class_id: int) -> bool:
+    """
+    is_viewed 만 UPDATE 합니다. save() 를 거치지 않으므로 관련 캐시를 직접 무효화합니다.
+    """
+    updated = Class.objects.filter(id=class_id, is_viewed=False).update(
+        is_viewed=True, updated_at=timezone.now()
+    )
+    if updated:
+        invalidate_unviewed_class_count()
+        invalidate_class_detail(class_id)
+    return bool(updated)
+
+
+def _latest_updated_at(queryset: QuerySet) -> Subquery:
+    return Subquery(
+        queryset.filter(class_id=OuterRef("pk"))
+        .order_by()
+        .values("class_id")
+        .annotate(latest=Max("updated_at"))
+        .values("latest")
+    )
+
+
+def get_class_detail_validators(class_id: int) -> Optional[tuple[str, datetime]]:
+    """
+    클래스 상세 응답의 ETag 와 Last-Modified 를 한 번의 쿼리로 계산합니다.
+    Class.updated_at 과 연관 리뷰/일정의 최신 updated_at, 그리고 응답에 포함되는
+    환율/인기 여부/신규 여부를 버전에 반영합니다.
+    """
+    class_id = int(class_id)
+    row = (
+        Class.objects.filter(id=class_id)
+        .annotate(
+            reviews_updated_at=_latest_updated_at(Review.objects.all()),
+            dates_updated_at=_latest_updated_at(ClassDate.objects.all()),
+        )
+        .values("created_at", "updated_at", "reviews_updated_at", "dates_updated_at")
+        .first()
+    )
+    if row is None:
+        return None
+
+    last_modified = max(
+        value
+        for value in (
+            row["updated_at"],
+            row["reviews_updated_at"],
+            row["dates_updated_at"],
+        )
+        if value is not None
+    )
+    etag = make_etag(
+        class_id,
+        last_modified.isoformat(),
+        ExchangeRate.get_usd_rate(),
+        class_id in get_popular_class_ids(),
+        timezone.now() - row["created_at"] <= timedelta(days=30),
+    )
+    return etag, last_modified
+
+
+def get_class_page_validators(
+    page: Iterable[Class], next_cursor: Optional[str], full_path: str
+) -> tuple[str, Optional[datetime]]:
+    """
+    목록 응답의 ETag/Last-Modified 를 반환된 페이지 행만으로 계산합니다.
+    카탈로그 전체를 집계하지 않으므로 비용이 페이지 크기에만 비례합니다.
+    """
+    # 리뷰/이미지/카테고리/일정 삭제는 Class.updated_at 을 갱신하고, 일정 수정은
+    # 응답에 일정이 포함될 때(prefetch 된 경우)만 반영하면 됩니다.
+    timestamps = []
+    ids = []
+    for klass in page:
+        ids.append(klass.id)
+        timestamps.append(klass.updated_at)
+        if "dates" in getattr(klass, "_prefetched_objects_cache", {}):
+            timestamps.extend(class_date.updated_at for class_date in klass.dates.all())
+    last_modified = max(timestamps) if timestamps else None
+    etag = make_etag(
+        full_path,
+        ",".join(map(str, ids)),
+        next_cursor,
+        last_modified.isoformat() if last_modified else "",
+        ExchangeRate.get_usd_rate(),
+        hash(get_popular_class_ids()),
+        timezone.localdate(),
+    )
+    return etag, last_modified
+
+
+def _parse_price(value: Optional[str], name: str) -> Optional[int]:
+    if value in (None, ""):
+        return None
+    try:
+        price = int(value)  # type: ignore[arg-type]
+    except ValueError:
+        raise ValueError(f"Invalid {name}")
+    if price < 0:
+        raise ValueError(f"Invalid {name}")
+    return price
+
+
+def filter_classes(queryset: QuerySet[Class], params: QueryDict) -> QuerySet[Class]:
+    genres = params.getlist("genre")
+    if genres:
+        queryset = queryset.filter(genre__name__in=genres)
+
+    categories = params.getlist("category")
+    if categories:
+        # M2M 조인 후 distinct 를 거는 대신 through 테이블 서브쿼리로 필터링합니다.
+        queryset = queryset.filter(
+            id__in=Class.category.through.objects.filter(
+                category__name__in=categories
+            ).values("class_id")
+        )
+
+    min_price = _parse_price(params.get("min_price"), "min_price")
+    if min_price is not None:
+        queryset = queryset.filter(price__gte=min_price)
+
+    max_price = _parse_price(params.get("max_price"), "max_price")
+    if max_price is not None:
+        queryset = queryset.filter(price__lte=max_price)
+
+    class_types = params.getlist("class_type")
+    if class_types:
+        condition = Q()
+        for class_type in class_types:
+            condition |= Q(class_type__contains=[class_type])
+        queryset = queryset.filter(condition)
+
+    regions = params.getlist("region")
+    if regions:
+        condition = Q()
+        for region in regions:
+            condition |= _region_condition(region)
+        queryset = queryset.filter(condition)
+
+    return queryset
+
+
+def _region_condition(region: str) -> Q:
+    """
+    "도/시/구" 경로를 (province, city, district) 인덱스의 앞쪽 컬럼 조건으로 변환합니다.
+    특별시/광역시처럼 city 가 없는 지역은 "서울특별시//강남구" 로 표현됩니다.
+    """
+    parts = region.split("/")
+    if not parts[0] or len(parts) > 3:
+        raise ValueError("Invalid region")
+    return Q(**dict(zip(("province", "city", "district"), parts)))
+
+
+def _region_path(*parts: str) -> str:
+    return "/".join(parts)
+
+
+def _compute_class_region_tree() -> list[dict]:
+    rows = (
+        Class.objects.exclude(province="")
+        .values("province", "city", "district")
+        .annotate(count=Count("id"))
+        .order_by("province", "city", "district")
+    )
+
+    provinces: dict[str, dict] = {}
+    for row in rows:
+        province, city, district = row["province"], row["city"], row["district"]
+        province_node = provinces.setdefault(
+            province,
+            {"name": province, "region": province, "count": 0, "children": {}},
+        )
+        province_node["count"] += row["count"]
+        # city 가 없는 특별시/광역시는 구를 바로 하위에 둡니다.
+        parent = province_node
+        if city:
+            parent = province_node["children"].setdefault(
+                city,
+                {
+                    "name": city,
+                    "region": _region_path(province, city),
+                    "count": 0,
+                    "children": {},
+                },
+            )
+            parent["count"] += row["count"]
+        if district:
+            parent["children"][district] = {
+                "name": district,
+                "region": _region_path(province, city, district),
+                "count": row["count"],
+                "children": {},
+            }
+
+    def to_list(nodes: dict[str, dict]) -> list[dict]:
+        return [
+            {**node, "children": to_list(node["children"])} for node in nodes.values()
+        ]
+
+    return to_list(provinces)
+
+
+def get_class_region_tree() -> list[dict]:
+    """
+    도 > 시 > 구 지역 트리와 지역별 클래스 수. 클래스 저장/삭제 시 무효화됩니다.
+    """
+    tree = cache.get(CLASS_REGION_TREE_CACHE_KEY)
+    if tree is None:
+        tree = _compute_class_region_tree()
+        cache.set(CLASS_REGION_TREE_CACHE_KEY, tree, CLASS_REGION_TREE_CACHE_TIMEOUT)
+    return tree
+
+
+def invalidate_class_region_tree() -> None:
+    cache.delete(CLASS_REGION_TREE_CACHE_KEY)
+
+
+def backfill_class_regions(batch_size: int = 1000) -> int:
+    updated = []
+    classes = Class.objects.only("id", "address", "province", "city", "district")
+    for klass in classes.iterator(chunk_size=batch_size):
+        region = (klass.province, klass.city, klass.district)
+        klass.set_region()
+        if (klass.province, klass.city, klass.district) != region:
+            updated.append(klass)
+    Class.objects.bulk_update(
+        updated, ["province", "city", "district"], batch_size=batch_size
+    )
+    invalidate_class_region_tree()
+    return len(updated)
+
+
+def _parse_date(value: Optional[str], name: str) -> Optional[date]:
+    if value in (None, ""):
+        return None
+    try:
+        return date.fromisoformat(value)  # type: ignore[arg-type]
+    except ValueError:
+        raise ValueError(f"Invalid {name}")
+
+
+def get_available_class_dates(params: QueryDict) -> QuerySet[ClassDate]:
+    """
+    start_date ~ end_date 사이에 잔여 좌석이 있는 ClassDate 만 조회합니다.
+    잔여 좌석은 SQL 에서 Class.max_person - ClassDate.person 으로 계산합니다.
+    """
+    start_date = _parse_date(params.get("start_date"), "start_date")
+    if start_date is None:
+        raise ValueError("start_date is required")
+    end_date = _parse_date(params.get("end_date"), "end_date") or start_date
+    if end_date < start_date or end_date - start_date > MAX_AVAILABILITY_WINDOW:
+        raise ValueError("Invalid date window")
+
+    class_dates = ClassDate.objects.filter(
+        start_date__gte=start_date, start_date__lte=end_date
+    )
+
+    genres = params.getlist("genre")
+    if genres:
+        class_dates = class_dates.filter(class_id__genre__name__in=genres)
+
+    categories = params.getlist("category")
+    if categories:
+        class_dates = class_dates.filter(
+            class_id__in=Class.category.through.objects.filter(
+                category__name__in=categories
+            ).values("class_id")
+        )
+
+    return class_dates.annotate(
+        remaining_seats=ExpressionWrapper(
+            F("class_id__max_person") - F("person"), output_field=IntegerField()
+        ),
+        class_title=F("class_id__title"),
+    ).filter(remaining_seats__gt=0)
+
+
+def _parse_month(value: Optional[str]) -> date:
+    if not value:
+        return timezone.localdate().replace(day=1)
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise ValueError("Invalid month")
+
+
+def _calendar_cache_key(day: date) -> str:
+    # 모델에 문자열로 할당된 start_date 도 같은 키가 되도록 "YYYY-MM" 부분만 사용합니다.
+    return f"class-calendar:{str(day)[:7]}"
+
+
+def _compute_class_calendar(month: date) -> list[dict]:
+    next_month = (month + timedelta(days=32)).replace(day=1)
+    rows = (
+        ClassDate.objects.filter(start_date__gte=month, start_date__lt=next_month)
+        .values("start_date")
+        .annotate(
+            session_count=Count("id"),
+            available_count=Count("id", filter=Q(class_id__max_person__gt=F("person"))),
+        )
+    )
+    counts = {row["start_date"]: row for row in rows}
+
+    calendar = []
+    day = month
+    while day < next_month:
+        row = counts.get(day, {})
+        calendar.append(
+            {
+                "date": day,
+                "session_count": row.get("session_count", 0),
+                "available_count": row.get("available_count", 0),
+            }
+        )
+        day += timedelta(days=1)
+    return calendar
+
+
+def get_class_calendar(month_param: Optional[str]) -> list[dict]:
+    """
+    월의 날짜별 전체 일정 수와 잔여 좌석이 있는 일정 수를 한 번의 GROUP BY 로 계산하고
+    월 단위로 캐시합니다. 인원/일정 변경 시 invalidate_class_calendar 로 무효화됩니다.
+    """
+    month = _parse_month(month_param)
+    cache_key = _calendar_cache_key(month)
+    calendar = cache.get(cache_key)
+    if calendar is None:
+        calendar = _compute_class_calendar(month)
+        cache.set(cache_key, calendar, timeout=CLASS_CALENDAR_CACHE_TIMEOUT)
+    return calendar
+
+
+def invalidate_class_calendar(start_date: date) -> None:
+    # 커밋 전에 지우면 다른 요청이 이전 값으로 다시 채울 수 있으므로 커밋 후에 삭제합니다.
+    cache_key = _calendar_cache_key(start_date)
+    transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+def invalidate_class_calendars(start_dates: Iterable[date]) -> None:
+    """
+    시그널을 보내지 않는 bulk_create 뒤에 일정이 속한 월의 달력을 한 번씩 무효화합니다.
+    """
+    cache_keys = {_calendar_cache_key(start_date) for start_date in start_dates}
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+
+def _count_class_types(queryset: QuerySet[Class]) -> list[dict]:
+    ids_sql, params = queryset.order_by().values("id").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT t.value, COUNT(*) FROM classes_class c "
+            "CROSS JOIN LATERAL jsonb_array_elements_text("
+            "CASE WHEN jsonb_typeof(c.class_type) = 'array' "
+            "THEN c.class_type ELSE '[]'::jsonb END"
+            ") AS t(value) "
+            f"WHERE c.id IN ({ids_sql}) "
+            "GROUP BY t.value ORDER BY COUNT(*) DESC, t.value",
+            params,
+        )
+        return [{"name": name, "count": count} for name, count in cursor.fetchall()]
+
+
+def _compute_class_facets(queryset: QuerySet[Class]) -> dict[str, list[dict]]:
+    queryset = queryset.order_by()
+
+    genres = (
+        queryset.filter(genre__isnull=False)
+        .values("genre__name")
+        .annotate(count=Count("id"))
+        .order_by("-count", "genre__name")
+    )
+    categories = (
+        Class.category.through.objects.filter(class_id__in=queryset.values("id"))
+        .values("category__name")
+        .annotate(count=Count("class_id"))
+        .order_by("-count", "category__name")
+    )
+
+    band_filters = {}
+    for index, (min_price, max_price) in enumerate(PRICE_BANDS):
+        condition = Q(price__gte=min_price)
+        if max_price is not None:
+            condition &= Q(price__lt=max_price)
+        band_filters[f"band_{index}"] = Count("id", filter=condition)
+    band_counts = queryset.aggregate(**band_filters)
+
+    return {
+        "genre": [
+            {"name": row["genre__name"], "count": row["count"]} for row in genres
+        ],
+        "category": [
+            {"name": row["category__name"], "count": row["count"]} for row in categories
+        ],
+        "price": [
+            {
+                "min_price": min_price,
+                "max_price": max_price,
+                "count": band_counts[f"band_{index}"],
+            }
+            for index, (min_price, max_price) in enumerate(PRICE_BANDS)
+        ],
+        "class_type": _count_class_types(queryset),
+    }
+
+
+def get_class_facets(params: QueryDict) -> dict[str, list[dict]]:
+    """
+    현재 필터 조건에 대한 장르/카테고리/가격대/클래스 유형별 클래스 수를 고정된 4번의
+    집계 쿼리로 계산하고, 필터 파라미터 조합별로 캐시합니다.
+    """
+    filters = sorted(
+        (key, value)
+        for key in CLASS_FILTER_PARAMS
+        for value in params.getlist(key)
+        if value != ""
+    )
+    cache_key = (
+        f"class-facets:{get_cache_version(CLASS_FACETS_VERSION_KEY)}:"
+        + hashlib.sha1(urlencode(filters).encode()).hexdigest()
+    )
+
+    facets = cache.get(cache_key)
+    if facets is None:
+        facets = _compute_class_facets(filter_classes(Class.objects.all(), params))
+        cache.set(cache_key, facets, timeout=CLASS_FACETS_CACHE_TIMEOUT)
+    return facets
+
+
+def invalidate_class_facets() -> None:
+    """
+    필터 조합별로 저장된 집계를 한 번에 무효화하도록 키의 버전을 올립니다.
+    """
+    bump_cache_version(CLASS_FACETS_VERSION_KEY)
+
+
+def search_classes(queryset: QuerySet[Class], query: str) -> QuerySet[Class]:
+    """
+    search_vector(tsvector) 로 검색하고 관련도(rank) 순으로 정렬합니다.
+    'simple' 설정은 한국어 형태소를 분리하지 못하므로 한글 검색어는 부분 일치로 검색하며,
+    pg_trgm 이 설치된 환경에서는 trigram 인덱스를 사용합니다.
+    """
+    if not HANGUL_PATTERN.search(query):
+        search_query = SearchQuery(query, config="simple", search_type="websearch")
+        return (
+            queryset.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .order_by("-rank", "-id")
+        )
+
+    terms = query.split()
+    condition = Q()
+    rank = Value(0.0, output_field=FloatField())
+    for term in terms:
+        condition &= (
+            Q(title__icontains=term)
+            | Q(description__icontains=term)
+            | Q(address__icontains=term)
+        )
+        rank += Case(
+            When(title__icontains=term, then=Value(1.0)),
+            When(description__icontains=term, then=Value(0.4)),
+            default=Value(0.2),
+            output_field=FloatField(),
+        )
+    return queryset.filter(condition).annotate(rank=rank).order_by("-rank", "-id")
+
+
+def get_prices_in_usd(classes: Iterable[Class]) -> dict[int, Optional[float]]:
+    rate = ExchangeRate.get_usd_rate()
+    return {klass.id: klass.get_price_in_usd(rate) for klass in classes}
+
+
+def _is_recent(created_at: datetime) -> bool:
+    return created_at >= timezone.now() - RECENT_RATING_WINDOW
+
+
+def apply_review_ratings(
+    changes: Iterable[tuple[int, Decimal | str, datetime, int]],
+) -> None:
+    """
+    (class_id, rating, created_at, sign) 목록을 받아 Class 의 평점 집계 컬럼을
+    F() 표현식으로 증감합니다. 같은 클래스에 대한 변경은 UPDATE 한 번으로 합칩니다.
+    """
+    deltas: dict[int, dict[str, Decimal | int]] = defaultdict(
+        lambda: {
+            "rating_sum": Decimal(0),
+            "rating_count": 0,
+            "recent_rating_sum": Decimal(0),
+            "recent_rating_count": 0,
+        }
+    )
+    for class_id, rating, created_at, sign in changes:
+        value = Decimal(str(rating)) * sign
+        delta = deltas[class_id]
+        delta["rating_sum"] += value
+        delta["rating_count"] += sign
+        if _is_recent(created_at):
+            delta["recent_rating_sum"] += value
+            delta["recent_rating_count"] += sign
+
+    now = timezone.now()
+    with transaction.atomic():
+        for class_id, delta in deltas.items():
+            updates = {
+                field: F(field) + value for field, value in delta.items() if value
+            }
+            if not updates:
+                continue
+            Class.objects.filter(id=class_id).update(**updates, updated_at=now)
+
+
+def rebuild_class_ratings() -> int:
+    def aggregate(queryset: QuerySet[Review], expression, output_field) -> Coalesce:
+        subquery = (
+            queryset.filter(class_id=OuterRef("pk"))
+            .order_by()
+            .values("class_id")
+            .annotate(value=expression)
+            .values("value")
+        )
+        return Coalesce(Subquery(subquery), Value(0), output_field=output_field)
+
+    reviews = Review.objects.all()
+    recent_reviews = reviews.filter(
+        created_at__gte=timezone.now() - RECENT_RATING_WINDOW
+    )
+    sum_field = Class._meta.get_field("rating_sum")
+    count_field = Class._meta.get_field("rating_count")
+    return Class.objects.update(
+        rating_sum=aggregate(reviews, Sum("rating"), sum_field),
+        rating_count=aggregate(reviews, Count("id"), count_field),
+        recent_rating_sum=aggregate(recent_reviews, Sum("rating"), sum_field),
+        recent_rating_count=aggregate(recent_reviews, Count("id"), count_field),
+    )
+
+
+def record_class_payment(class_id: int, paid_at: datetime) -> None:
+    stats = ClassPaymentStat.objects.filter(
+        class_id=class_id, date=timezone.localdate(paid_at)
+    )
+    if stats.update(payment_count=F("payment_count") + 1):
+        return
+    try:
+        with transaction.atomic():
+            ClassPaymentStat.objects.create(
+                class_id=class_id, date=timezone.localdate(paid_at), payment_count=1
+            )
+    except IntegrityError:
+        # 동시에 같은 날짜의 첫 결제가 들어온 경우
+        stats.update(payment_count=F("payment_count") + 1)
+
+
+def decay_class_payment_stats() -> int:
+    expired_before = timezone.localdate() - POPULAR_CLASS_WINDOW
+    deleted, _ = ClassPaymentStat.objects.filter(date__lt=expired_before).delete()
+    popular_class_cache.invalidate()
+    return deleted
+
+
+def _load_popular_class_ids() -> frozenset[int]:
+    ranking = list(
+        ClassPaymentStat.objects.filter(
+            date__gte=timezone.localdate() - POPULAR_CLASS_WINDOW
+        )
+        .values("class_id")
+        .annotate(total=Sum("payment_count"))
+        .order_by("-total", "class_id")
+        .values_list("class_id", flat=True)
+    )
+    top_count = max(1, int(len(ranking) * POPULAR_CLASS_RATIO))
+    return frozenset(ranking[:top_count])
+
+
+popular_class_cache: ProcessCache[frozenset[int]] = ProcessCache(
+    _load_popular_class_ids, ttl=60
+)
+
+
+def get_popular_class_ids() -> frozenset[int]:
+    return popular_class_cache.get()
+
+
+def class_images_need_variants(class_images: ClassImages) -> bool:
+    urls = class_images.thumbnail_image_urls
+    variants = class_images.thumbnail_image_variants
+    return len(urls) != len(variants) or any(
+        needs_image_variants(url, variant) for url, variant in zip(urls, variants)
+    )
+
+
+def generate_class_image_variants(class_images_id: int) -> None:
+    """
+    썸네일 원본마다 WebP 파생 이미지를 만들어 thumbnail_image_variants 에 기록합니다.
+    처리 중 썸네일 목록이 바뀌었다면 덮어쓰지 않습니다.
+    """
+    class_images = ClassImages.objects.filter(id=class_images_id).first()
+    if class_images is None or not class_images_need_variants(class_images):
+        return
+
+    # 파생 이미지는 항목마다 참조를 잡으므로 같은 원본이 여러 번 있어도 하나씩만 재사용합니다.
+    existing = defaultdict(list)
+    for variant in class_images.thumbnail_image_variants:
+        existing[variant.get("original")].append(variant)
+    variants, created = [], []
+    for url in class_images.thumbnail_image_urls:
+        if existing[url]:
+            variants.append(existing[url].pop())
+        else:
+            created.append(create_image_variants(url, "class-images"))
+            variants.append(created[-1])
+
+    updated = ClassImages.objects.filter(
+        id=class_images_id, thumbnail_image_urls=class_images.thumbnail_image_urls
+    ).update(thumbnail_image_variants=variants)
+    # 처리 중 썸네일이 바뀌었으면 방금 올린 파생 이미지를, 아니면 목록에서 빠진 원본의
+    # 파생 이미지를 돌려줍니다.
+    released = created if not updated else chain.from_iterable(existing.values())
+    for variant in released:
+        release_image_variants(variant)
+    if not updated:
+        return
+
+    touch_class(class_images.class_id_id)
+    invalidate_class_detail(class_images.class_id_id)
+
+
+def class_images_object_urls(class_images: ClassImages) -> list[str]:
+    """
+    ClassImages 행이 참조하는 원본과 썸네일 파생 이미지 URL 목록.
+    """
+    return [
+        *class_images.description_image_urls,
+        *class_images.detail_image_urls,
+        *class_images.thumbnail_image_urls,
+        *(
+            url
+            for variant in class_images.thumbnail_image_variants
+            for url in image_variant_urls(variant)
+        ),
+    ]
@@ -0,0 +1,112 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from common.services.images import schedule_image_task
+from common.services.uploads import delete_uploaded_objects
+from reviews.models import Review
+
+from .cache import invalidate_all_class_details, invalidate_class_detail
+from .models import (
+    Category,
+    Class,
+    ClassDate,
+    ClassImages,
+    ExchangeRate,
+    Genre,
+    usd_rate_cache,
+)
+from .services import (
+    class_images_need_variants,
+    class_images_object_urls,
+    generate_class_image_variants,
+    invalidate_class_calendar,
+    invalidate_class_facets,
+    invalidate_class_region_tree,
+    invalidate_unviewed_class_count,
+    touch_class,
+)
+
+
+@receiver(post_save, sender=ExchangeRate)
+@receiver(post_delete, sender=ExchangeRate)
+def invalidate_exchange_rate_cache(sender, instance, **kwargs):
+    usd_rate_cache.invalidate()
+    invalidate_all_class_details()
+
+
+@receiver(post_save, sender=Class)
+@receiver(post_delete, sender=Class)
+def invalidate_class_detail_on_change(sender, instance, **kwargs):
+    invalidate_class_detail(instance.id)
+    invalidate_class_region_tree()
+    invalidate_unviewed_class_count()
+    invalidate_class_facets()
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_class_facets_on_name_change(sender, instance, **kwargs):
+    invalidate_class_facets()
+
+
+@receiver(post_save, sender=ClassDate)
+@receiver(post_delete, sender=ClassDate)
+@receiver(post_save, sender=ClassImages)
+@receiver(post_delete, sender=ClassImages)
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_class_detail_on_related_change(sender, instance, **kwargs):
+    invalidate_class_detail(instance.class_id_id)
+
+
+@receiver(post_delete, sender=ClassDate)
+@receiver(post_save, sender=ClassImages)
+@receiver(post_delete, sender=ClassImages)
+def touch_class_on_related_change(sender, instance, **kwargs):
+    touch_class(instance.class_id_id)
+
+
+@receiver(m2m_changed, sender=Class.category.through)
+def touch_class_on_category_change(sender, instance, action, reverse, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear") and not reverse:
+        touch_class(instance.id)
+        invalidate_class_detail(instance.id)
+        invalidate_class_facets()
+
+
+@receiver(post_save, sender=ClassImages)
+def schedule_class_image_variants(sender, instance, **kwargs):
+    if class_images_need_variants(instance):
+        schedule_image_task(generate_class_image_variants, instance.id)
+
+
+@receiver(post_delete, sender=ClassImages)
+def release_class_images_on_delete(sender, instance, **kwargs):
+    # 롤백되면 객체가 계속 참조되므로 커밋된 뒤에만 참조를 돌려줍니다.
+    urls = class_images_object_urls(instance)
+    transaction.on_commit(lambda: delete_uploaded_objects(urls))
+
+
+@receiver(pre_save, sender=ClassDate)
+def remember_previous_start_date(sender, instance, update_fields=None, **kwargs):
+    instance._previous_start_date = (
+        ClassDate.objects.filter(pk=instance.pk)
+        .values_list("start_date", flat=True)
+        .first()
+        if instance.pk and (update_fields is None or "start_date" in update_fields)
+        else None
+    )
+
+
+@receiver(post_save, sender=ClassDate)
+@receiver(post_delete, sender=ClassDate)
+def invalidate_class_calendar_on_change(sender, instance, **kwargs):
+    # payments.services 의 add/minus_class_date_person 도 save() 를 거치므로 여기서 처리됩니다.
+    invalidate_class_calendar(instance.start_date)
+    # 다른 월로 옮긴 일정은 이전 월의 달력에서도 빠져야 합니다.
+    previous = getattr(instance, "_previous_start_date", None)
+    if previous is not None and previous != instance.start_date:
+        invalidate_class_calendar(previous)
@@ -1,11 +1,23 @@
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from classes.models import Class
+from classes.models import Class, usd_rate_cache
+from classes.services import popular_class_cache
 from users.serializers.user_serializer import UserSerializer
 
 
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    usd_rate_cache.invalidate()
+    popular_class_cache.invalidate()
+    cache.clear()
+    yield
+    usd_rate_cache.invalidate()
+    popular_class_cache.invalidate()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
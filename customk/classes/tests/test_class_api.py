@@ -1,10 +1,36 @@
+import base64
+import hashlib
+from io import BytesIO
+from unittest.mock import patch
+
 import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import connection
 from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
 from rest_framework import status
 
-from classes.models import Category, Class
+from classes.models import (
+    Category,
+    Class,
+    ClassDate,
+    ClassImages,
+    ClassPaymentStat,
+    ExchangeRate,
+    Genre,
+)
+from classes.services import (
+    get_prices_in_usd,
+    get_unviewed_class_count,
+    popular_class_cache,
+)
+from common.models import StoredObject
+from common.services.uploads import release_object
+from payments.services import minus_class_date_person
+from reviews.models import Review
 
 
 @pytest.mark.django_db
@@ -42,6 +68,170 @@ def test_class_create(api_client_with_token):
     assert Class.objects.filter(title="Test Class").exists()
 
 
+@pytest.mark.django_db
+def test_class_create_invalidates_calendar(
+    api_client, api_client_with_token, django_capture_on_commit_callbacks
+):
+    calendar_url = reverse("class-calendar")
+    api_client.get(calendar_url, {"month": "2024-10"})
+
+    data = {
+        "title": "Dated Class",
+        "max_person": 10,
+        "require_person": 5,
+        "price": 50000,
+        "address": "서울시 강남구",
+        "category": [],
+        "dates": [
+            {"start_date": "2024-10-01", "start_time": "10:00", "end_time": "12:00"}
+        ],
+    }
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client_with_token.post(
+            reverse("class-list"), data, format="json"
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    calendar = api_client.get(calendar_url, {"month": "2024-10"}).data["data"]
+    assert calendar[0]["session_count"] == 1
+
+
+def _class_payload_with_images(image_sets, distinct=True):
+    counter = iter(range(1000))
+
+    def image():
+        content = f"image-{next(counter)}" if distinct else "image"
+        return "data:image/png;base64," + base64.b64encode(content.encode()).decode()
+
+    return {
+        "title": "Image Class",
+        "description": "Class with images",
+        "max_person": 10,
+        "require_person": 5,
+        "price": 50000,
+        "address": "서울시 강남구",
+        "category": [],
+        "images": [
+            {
+                "thumbnail_image_urls": [image()],
+                "description_image_urls": [image(), image()],
+                "detail_image_urls": [image()],
+            }
+            for _ in range(image_sets)
+        ],
+    }
+
+
+def _put_object(bucket, name, data):
+    return 200, f"https://storage/{name}"
+
+
+@pytest.mark.django_db
+def test_class_create_uploads_images(api_client_with_token):
+    url = reverse("class-list")
+    with patch(
+        "common.services.ncp_api_conf.ObjectStorage.put_object",
+        side_effect=_put_object,
+    ) as mock_put_object:
+        response = api_client_with_token.post(
+            url, _class_payload_with_images(3), format="json"
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert mock_put_object.call_count == 12
+    images = ClassImages.objects.filter(class_id__title="Image Class")
+    assert images.count() == 3
+    for image in images:
+        assert len(image.thumbnail_image_urls) == 1
+        assert len(image.description_image_urls) == 2
+        assert image.detail_image_urls[0].startswith("https://storage/class-images/")
+
+
+@pytest.mark.django_db
+def test_class_create_deduplicates_image_content(api_client_with_token):
+    url = reverse("class-list")
+    payload = _class_payload_with_images(2, distinct=False)
+    with patch(
+        "common.services.ncp_api_conf.ObjectStorage.put_object",
+        side_effect=_put_object,
+    ) as mock_put_object:
+        api_client_with_token.post(url, payload, format="json")
+        api_client_with_token.post(url, payload, format="json")
+
+    assert mock_put_object.call_count == 1
+    digest = hashlib.sha256(b"image").hexdigest()
+    stored = StoredObject.objects.get()
+    assert stored.object_name == f"class-images/{digest}.png"
+    assert stored.ref_count == 16
+
+    with patch(
+        "common.services.ncp_api_conf.ObjectStorage.delete_object",
+        return_value=204,
+    ) as mock_delete_object:
+        assert release_object(stored.url, 15) == 204
+        assert mock_delete_object.call_count == 0
+        assert release_object(stored.url) == 204
+        assert mock_delete_object.call_count == 1
+    assert not StoredObject.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url, deleted",
+    [
+        (
+            "https://kr.object.ncloudstorage.com/customk-imagebucket/class-images/"
+            "0f8fad5b-d9cb-469f-a165-70867728950e.png",
+            True,
+        ),
+        ("https://partner.example.com/customk-imagebucket/class-images/a.png", False),
+        (
+            "https://kr.object.ncloudstorage.com/customk-imagebucket/class-images/"
+            f"{hashlib.sha256(b'image').hexdigest()}.png",
+            False,
+        ),
+    ],
+)
+def test_release_object_only_deletes_legacy_bucket_objects(url, deleted):
+    with patch(
+        "common.services.ncp_api_conf.ObjectStorage.delete_object",
+        return_value=204,
+    ) as mock_delete_object:
+        assert release_object(url) == 204
+
+    assert mock_delete_object.called is deleted
+
+
+@pytest.mark.django_db
+def test_class_create_cleans_up_failed_uploads(api_client_with_token):
+    url = reverse("class-list")
+    calls = iter(range(100))
+
+    def put_object(bucket, name, data):
+        if next(calls) == 2:
+            return 500, f"https://storage/{name}"
+        return 200, f"https://storage/{name}"
+
+    with (
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.put_object",
+            side_effect=put_object,
+        ),
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.delete_object",
+            return_value=204,
+        ) as mock_delete_object,
+    ):
+        response = api_client_with_token.post(
+            url, _class_payload_with_images(2), format="json"
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not Class.objects.filter(title="Image Class").exists()
+    assert not StoredObject.objects.exists()
+    assert mock_delete_object.call_count == 7
+
+
 @pytest.mark.django_db
 def test_class_delete(api_client_with_token, sample_class):
     url = reverse("class-list")
@@ -66,3 +256,720 @@ def test_classes_view_queries(api_client_with_token):
     # 발생한 쿼리 수를 확인
     print(f"Total queries: {len(ctx.captured_queries)}")
     assert len(ctx.captured_queries) <= 9
+
+
+@pytest.mark.django_db
+def test_class_list_cursor_pagination(api_client):
+    url = reverse("class-list")
+    for i in range(5):
+        Class.objects.create(title=f"Class {i}", price=1000 * i, address="서울시")
+
+    first = api_client.get(url, {"size": 2})
+    assert first.status_code == status.HTTP_200_OK
+    assert [c["title"] for c in first.data["data"]] == ["Class 4", "Class 3"]
+    assert first.data["next_cursor"] is not None
+
+    second = api_client.get(url, {"size": 2, "cursor": first.data["next_cursor"]})
+    assert [c["title"] for c in second.data["data"]] == ["Class 2", "Class 1"]
+
+    last = api_client.get(url, {"size": 2, "cursor": second.data["next_cursor"]})
+    assert [c["title"] for c in last.data["data"]] == ["Class 0"]
+    assert last.data["next_cursor"] is None
+
+
+@pytest.mark.django_db
+def test_class_list_size_is_clamped(api_client):
+    url = reverse("class-list")
+    Class.objects.bulk_create(
+        Class(title=f"Class {i}", address="서울시") for i in range(105)
+    )
+
+    response = api_client.get(url, {"size": 1000000})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["data"]) == 100
+
+
+@pytest.mark.django_db
+def test_class_list_invalid_cursor(api_client):
+    url = reverse("class-list")
+    response = api_client.get(url, {"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_class_list_filters(api_client):
+    url = reverse("class-list")
+    cooking = Genre.objects.create(name="Cooking")
+    category = Category.objects.create(name="Kimchi")
+    matched = Class.objects.create(
+        title="Matched",
+        price=30000,
+        address="서울시",
+        genre=cooking,
+        class_type=["Offline"],
+    )
+    matched.category.add(category)
+    Class.objects.create(
+        title="Too expensive",
+        price=90000,
+        address="서울시",
+        genre=cooking,
+        class_type=["Offline"],
+    )
+    Class.objects.create(title="Other genre", price=30000, address="서울시")
+
+    response = api_client.get(
+        url,
+        {
+            "genre": "Cooking",
+            "category": "Kimchi",
+            "min_price": 10000,
+            "max_price": 50000,
+            "class_type": "Offline",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [c["title"] for c in response.data["data"]] == ["Matched"]
+
+    response = api_client.get(url, {"min_price": "abc"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_class_list_reads_exchange_rate_once(api_client):
+    url = reverse("class-list")
+    ExchangeRate.objects.create(currency="USD", rate="1000.0000")
+    for i in range(3):
+        Class.objects.create(title=f"Class {i}", price=5500, address="서울시")
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url)
+    rate_queries = [
+        q for q in ctx.captured_queries if "classes_exchangerate" in q["sql"]
+    ]
+    assert len(rate_queries) == 1
+    assert [c["price_in_usd"] for c in response.data["data"]] == [6, 6, 6]
+
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get(url)
+    assert not any("classes_exchangerate" in q["sql"] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_exchange_rate_save_invalidates_cache(sample_class):
+    rate = ExchangeRate.objects.create(currency="USD", rate="1000.0000")
+    assert get_prices_in_usd([sample_class]) == {sample_class.id: 50}
+
+    rate.rate = "500.0000"
+    rate.save()
+    assert sample_class.get_price_in_usd() == 100
+
+
+def _create_classes_with_relations(count):
+    genre, _ = Genre.objects.get_or_create(name="Cooking")
+    category, _ = Category.objects.get_or_create(name="Kimchi")
+    classes = []
+    for i in range(count):
+        klass = Class.objects.create(
+            title=f"Class {i}", price=1000, address="서울시", genre=genre
+        )
+        klass.category.add(category)
+        ClassDate.objects.create(
+            class_id=klass,
+            start_date="2024-09-01",
+            start_time="10:00",
+            end_time="12:00",
+        )
+        ClassImages.objects.create(class_id=klass, thumbnail_image_urls=["a.jpg"])
+        classes.append(klass)
+    return classes
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("count", [1, 10])
+def test_class_list_query_count_is_constant(api_client, count):
+    url = reverse("class-list")
+    _create_classes_with_relations(count)
+    api_client.get(url)  # 환율/인기 클래스 프로세스 캐시 적재
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url)
+
+    assert len(response.data["data"]) == count
+    # classes + dates + images + category (ETag 는 페이지 행으로 계산)
+    assert len(ctx.captured_queries) == 4
+
+
+@pytest.mark.django_db
+def test_class_detail_query_count(api_client):
+    klass = _create_classes_with_relations(1)[0]
+    url = reverse("class-detail", kwargs={"class_id": klass.id})
+    api_client.get(url)
+    cache.clear()  # 응답 캐시만 비우고 프로세스 캐시는 유지
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url)
+
+    assert response.data["data"]["genre"] == "Cooking"
+    # version + class + dates + images + category
+    assert len(ctx.captured_queries) == 5
+
+    with CaptureQueriesContext(connection) as ctx:
+        cached = api_client.get(url)
+    assert cached.data["data"] == response.data["data"]
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_class_search_ranks_title_matches_first(api_client):
+    url = reverse("class-search")
+    Class.objects.create(
+        title="Pottery basics", description="Learn kimchi later", address="Seoul"
+    )
+    Class.objects.create(title="Kimchi workshop", address="Busan")
+    Class.objects.create(title="Hanbok experience", address="Seoul")
+
+    response = api_client.get(url, {"q": "kimchi"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [c["title"] for c in response.data["data"]] == [
+        "Kimchi workshop",
+        "Pottery basics",
+    ]
+    assert "search_vector" not in response.data["data"][0]
+    assert response.data["has_next"] is False
+
+
+@pytest.mark.django_db
+def test_class_search_hangul(api_client):
+    url = reverse("class-search")
+    Class.objects.create(title="김치만들기 체험", address="서울시 강남구")
+    Class.objects.create(
+        title="한복 체험", description="김치 시식 포함", address="부산"
+    )
+    Class.objects.create(title="도자기 공방", address="서울시 종로구")
+
+    response = api_client.get(url, {"q": "김치", "size": 1})
+    assert [c["title"] for c in response.data["data"]] == ["김치만들기 체험"]
+    assert response.data["has_next"] is True
+
+    response = api_client.get(url, {"q": "김치", "size": 1, "page": 2})
+    assert [c["title"] for c in response.data["data"]] == ["한복 체험"]
+    assert response.data["has_next"] is False
+
+    response = api_client.get(url, {"q": ""})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_class_facets(api_client):
+    cache.clear()
+    url = reverse("class-facets")
+    cooking = Genre.objects.create(name="Cooking")
+    kimchi = Category.objects.create(name="Kimchi")
+    first = Class.objects.create(
+        title="A", price=20000, address="서울시", genre=cooking, class_type=["Offline"]
+    )
+    first.category.add(kimchi)
+    Class.objects.create(
+        title="B",
+        price=40000,
+        address="서울시",
+        genre=cooking,
+        class_type=["Offline", "Online"],
+    )
+    Class.objects.create(title="C", price=150000, address="서울시")
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url)
+    assert len(ctx.captured_queries) == 4
+
+    data = response.data["data"]
+    assert data["genre"] == [{"name": "Cooking", "count": 2}]
+    assert data["category"] == [{"name": "Kimchi", "count": 1}]
+    assert [band["count"] for band in data["price"]] == [1, 1, 0, 1]
+    assert data["class_type"] == [
+        {"name": "Offline", "count": 2},
+        {"name": "Online", "count": 1},
+    ]
+
+    response = api_client.get(url, {"genre": "Cooking", "max_price": 30000})
+    assert response.data["data"]["class_type"] == [{"name": "Offline", "count": 1}]
+
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get(url, {"max_price": 30000, "genre": "Cooking"})
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.django_db
+def test_class_facets_invalidated_on_class_change(api_client):
+    cache.clear()
+    url = reverse("class-facets")
+    cooking = Genre.objects.create(name="Cooking")
+    kimchi = Category.objects.create(name="Kimchi")
+    first = Class.objects.create(title="A", price=20000, address="서울시")
+    assert api_client.get(url).data["data"]["genre"] == []
+
+    first.genre = cooking
+    first.save()
+    assert api_client.get(url).data["data"]["genre"] == [
+        {"name": "Cooking", "count": 1}
+    ]
+
+    first.category.add(kimchi)
+    assert api_client.get(url).data["data"]["category"] == [
+        {"name": "Kimchi", "count": 1}
+    ]
+
+    kimchi.name = "Bibimbap"
+    kimchi.save()
+    assert api_client.get(url).data["data"]["category"] == [
+        {"name": "Bibimbap", "count": 1}
+    ]
+
+    first.delete()
+    assert api_client.get(url).data["data"]["category"] == []
+
+
+@pytest.mark.django_db
+def test_class_availability(api_client):
+    url = reverse("class-availability")
+    cooking = Genre.objects.create(name="Cooking")
+    open_class = Class.objects.create(
+        title="Open", max_person=10, address="서울시", genre=cooking
+    )
+    full_class = Class.objects.create(title="Full", max_person=5, address="서울시")
+    available = ClassDate.objects.create(
+        class_id=open_class,
+        start_date="2024-09-02",
+        start_time="10:00",
+        end_time="12:00",
+        person=7,
+    )
+    ClassDate.objects.create(
+        class_id=full_class,
+        start_date="2024-09-02",
+        start_time="09:00",
+        end_time="12:00",
+        person=5,
+    )
+    ClassDate.objects.create(
+        class_id=open_class,
+        start_date="2024-10-01",
+        start_time="10:00",
+        end_time="12:00",
+    )
+
+    response = api_client.get(
+        url, {"start_date": "2024-09-01", "end_date": "2024-09-30"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [d["id"] for d in response.data["data"]] == [available.id]
+    assert response.data["data"][0]["remaining_seats"] == 3
+    assert response.data["data"][0]["class_title"] == "Open"
+
+    response = api_client.get(url, {"start_date": "2024-09-02", "genre": "Other"})
+    assert response.data["data"] == []
+
+    response = api_client.get(
+        url, {"start_date": "2024-09-01", "end_date": "2024-12-31"}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def _make_popular(klass):
+    ClassPaymentStat.objects.create(
+        class_id=klass.id, date=timezone.localdate(), payment_count=1
+    )
+    popular_class_cache.invalidate()
+
+
+@pytest.mark.django_db
+def test_class_detail_conditional_get(api_client, sample_class):
+    url = reverse("class-detail", kwargs={"class_id": sample_class.id})
+    response = api_client.get(url)
+    etag = response["ETag"]
+    assert response["Last-Modified"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert len(ctx.captured_queries) == 0
+
+    ClassDate.objects.create(
+        class_id=sample_class,
+        start_date="2024-09-01",
+        start_time="10:00",
+        end_time="12:00",
+    )
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+    etag = response["ETag"]
+    sample_class.dates.all().delete()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_class_detail_conditional_get_tracks_popularity(api_client, sample_class):
+    url = reverse("class-detail", kwargs={"class_id": sample_class.id})
+    etag = api_client.get(url)["ETag"]
+
+    _make_popular(sample_class)
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["data"]["is_popular"] is True
+    assert response["ETag"] != etag
+
+    etag = response["ETag"]
+    ClassPaymentStat.objects.all().delete()
+    popular_class_cache.invalidate()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["data"]["is_popular"] is False
+
+
+@pytest.mark.django_db
+def test_class_list_conditional_get(api_client, sample_class):
+    url = reverse("class-list")
+    response = api_client.get(url)
+    etag = response["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = api_client.get(url, {"size": 5}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+    sample_class.title = "Renamed"
+    sample_class.save()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+    etag = response["ETag"]
+    class_date = ClassDate.objects.create(
+        class_id=sample_class,
+        start_date="2024-09-01",
+        start_time="10:00",
+        end_time="12:00",
+    )
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+    etag = response["ETag"]
+    class_date.person = 3
+    class_date.save()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_class_list_validators_do_not_scan_catalog(api_client):
+    url = reverse("class-list")
+    _create_classes_with_relations(30)
+    etag = api_client.get(url, {"size": 5})["ETag"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url, {"size": 5}, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    # 페이지 조회는 LIMIT 이 붙은 쿼리와 페이지 id 기준 prefetch 뿐입니다.
+    assert not any("MAX(" in q["sql"] for q in ctx.captured_queries)
+    class_queries = [
+        q["sql"] for q in ctx.captured_queries if 'FROM "classes_class"' in q["sql"]
+    ]
+    assert len(class_queries) == 1 and "LIMIT 6" in class_queries[0]
+
+
+@pytest.mark.django_db
+def test_class_detail_cache_invalidation(api_client, sample_class, sample_user):
+    url = reverse("class-detail", kwargs={"class_id": sample_class.id})
+    assert api_client.get(url).data["data"]["title"] == "Sample Class"
+
+    sample_class.title = "Renamed"
+    sample_class.save()
+    assert api_client.get(url).data["data"]["title"] == "Renamed"
+
+    ClassDate.objects.create(
+        class_id=sample_class,
+        start_date="2024-09-01",
+        start_time="10:00",
+        end_time="12:00",
+    )
+    assert len(api_client.get(url).data["data"]["dates"]) == 1
+
+    Review.objects.create(
+        class_id=sample_class, user=sample_user, review="Good", rating=4.0
+    )
+    assert api_client.get(url).data["data"]["average_rating"] == 4.0
+
+    ExchangeRate.objects.create(currency="USD", rate="1000.0000")
+    assert api_client.get(url).data["data"]["price_in_usd"] == 50
+
+
+@pytest.mark.django_db
+def test_class_detail_cache_reflects_popularity(api_client, sample_class):
+    url = reverse("class-detail", kwargs={"class_id": sample_class.id})
+    assert api_client.get(url).data["data"]["is_popular"] is False
+
+    _make_popular(sample_class)
+    assert api_client.get(url).data["data"]["is_popular"] is True
+
+
+@pytest.mark.django_db
+def test_class_detail_cache_stats(api_client, sample_class, sample_user):
+    url = reverse("class-detail", kwargs={"class_id": sample_class.id})
+    api_client.get(url)
+    api_client.get(url)
+    api_client.get(url)
+
+    stats_url = reverse("class-detail-cache-stats")
+    response = api_client.get(stats_url)
+    assert response.status_code in (
+        status.HTTP_401_UNAUTHORIZED,
+        status.HTTP_403_FORBIDDEN,
+    )
+
+    sample_user.is_staff = True
+    sample_user.save()
+    api_client.force_authenticate(sample_user)
+    response = api_client.get(stats_url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["data"] == {
+        "hits": 2,
+        "misses": 1,
+        "hit_ratio": 0.6667,
+        "scope": "worker",
+    }
+
+
+@pytest.mark.django_db
+def test_class_list_sparse_fieldsets(api_client):
+    url = reverse("class-list")
+    _create_classes_with_relations(3)
+    api_client.get(url)  # 환율/인기 클래스 프로세스 캐시 적재
+
+    params = {"fields": "id,title,price,thumbnail"}
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url, params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert all(
+        set(item) == {"id", "title", "price", "thumbnail"}
+        for item in response.data["data"]
+    )
+    assert response.data["data"][0]["thumbnail"] == "a.jpg"
+    # classes + images
+    assert len(ctx.captured_queries) == 2
+
+    response = api_client.get(url, {"fields": "id", "expand": "dates"})
+    assert set(response.data["data"][0]) == {"id", "dates"}
+
+    response = api_client.get(url, {"fields": "id,search_vector"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = api_client.get(url, {"fields": "id", "expand": "title"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_class_search_sparse_fieldsets(api_client):
+    Class.objects.create(title="Kimchi class", description="Make kimchi", address="S")
+    url = reverse("class-search")
+
+    response = api_client.get(url, {"q": "kimchi", "fields": "id,title"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [set(item) for item in response.data["data"]] == [{"id", "title"}]
+
+
+@pytest.mark.django_db
+def test_class_region_filter_and_tree(api_client):
+    for address in (
+        "서울시 강남구 테헤란로",
+        "서울시 강남구 역삼로",
+        "서울시 마포구 양화로",
+        "경기도, 성남시, 중원구",
+    ):
+        Class.objects.create(title=address, address=address)
+
+    url = reverse("class-list")
+    response = api_client.get(url, {"region": "서울특별시//강남구"})
+    assert len(response.data["data"]) == 2
+    response = api_client.get(url, {"region": ["서울특별시//마포구", "경기도"]})
+    assert len(response.data["data"]) == 2
+    response = api_client.get(url, {"region": "/강남구"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    tree_url = reverse("class-regions")
+    tree = api_client.get(tree_url).data["data"]
+    seoul = next(node for node in tree if node["name"] == "서울특별시")
+    assert seoul["count"] == 3
+    assert [(d["region"], d["count"]) for d in seoul["children"]] == [
+        ("서울특별시//강남구", 2),
+        ("서울특별시//마포구", 1),
+    ]
+    gyeonggi = next(node for node in tree if node["name"] == "경기도")
+    assert gyeonggi["children"][0]["children"][0]["region"] == "경기도/성남시/중원구"
+
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get(tree_url)
+    assert len(ctx.captured_queries) == 0
+
+    Class.objects.create(title="New", address="서울시 마포구")
+    tree = api_client.get(tree_url).data["data"]
+    assert next(node for node in tree if node["name"] == "서울특별시")["count"] == 4
+
+
+@pytest.mark.django_db
+def test_class_calendar(api_client, sample_class, django_capture_on_commit_callbacks):
+    full = Class.objects.create(title="Full", address="서울시", max_person=2)
+    for klass, person, start_date in (
+        (sample_class, 0, "2024-10-01"),
+        (sample_class, 0, "2024-10-15"),
+        (full, 2, "2024-10-15"),
+        (full, 0, "2024-11-01"),
+    ):
+        ClassDate.objects.create(
+            class_id=klass,
+            start_date=start_date,
+            start_time="10:00",
+            end_time="12:00",
+            person=person,
+        )
+    url = reverse("class-calendar")
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(url, {"month": "2024-10"})
+    assert len(ctx.captured_queries) == 1
+    calendar = response.data["data"]
+    assert len(calendar) == 31
+    assert calendar[0]["session_count"] == 1
+    assert calendar[14]["session_count"] == 2
+    assert calendar[14]["available_count"] == 1
+    assert calendar[1]["session_count"] == 0
+
+    with CaptureQueriesContext(connection) as ctx:
+        api_client.get(url, {"month": "2024-10"})
+    assert len(ctx.captured_queries) == 0
+
+    class_date = full.dates.get(start_date="2024-10-15")
+    with django_capture_on_commit_callbacks(execute=True):
+        minus_class_date_person(class_date.id, 1)
+    calendar = api_client.get(url, {"month": "2024-10"}).data["data"]
+    assert calendar[14]["available_count"] == 2
+
+    # 다른 월로 옮긴 일정은 이전 월과 새 월의 달력에 모두 반영됩니다.
+    api_client.get(url, {"month": "2024-11"})
+    class_date.refresh_from_db()
+    class_date.start_date = "2024-11-15"
+    with django_capture_on_commit_callbacks(execute=True):
+        class_date.save()
+    calendar = api_client.get(url, {"month": "2024-10"}).data["data"]
+    assert calendar[14]["session_count"] == 1
+    calendar = api_client.get(url, {"month": "2024-11"}).data["data"]
+    assert calendar[14]["session_count"] == 1
+
+    response = api_client.get(url, {"month": "2024-13"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.fixture
+def admin_client(db):
+    from django.test import Client
+
+    from users.models import User
+
+    admin = User.objects.create_superuser("admin@example.com", "adminpassword")
+    client = Client()
+    client.force_login(admin)
+    return client
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("count", [1, 5])
+def test_class_admin_changelist_query_count(admin_client, count):
+    ExchangeRate.objects.create(currency="USD", rate="1000.0000")
+    _create_classes_with_relations(count)
+    url = reverse("admin:classes_class_changelist")
+    admin_client.get(url)  # 환율/미확인 개수 캐시 적재
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = admin_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "조회되지 않은 클래스" in response.content.decode()
+    # session + user + 페이지 COUNT + 목록 (genre 는 select_related)
+    assert len(ctx.captured_queries) == 4
+
+
+@pytest.mark.django_db
+def test_class_admin_change_view_marks_viewed(admin_client, sample_class):
+    url = reverse("admin:classes_class_change", args=[sample_class.id])
+    assert get_unviewed_class_count() == 1
+
+    admin_client.get(url)
+
+    sample_class.refresh_from_db()
+    assert sample_class.is_viewed
+    assert get_unviewed_class_count() == 0
+
+
+@pytest.mark.django_db
+def test_class_images_admin_uploads_once(admin_client, sample_class):
+    url = reverse("admin:classes_classimages_add")
+    buffer = BytesIO()
+    Image.new("RGB", (10, 10), "blue").save(buffer, format="PNG")
+    images = {
+        name: SimpleUploadedFile(f"{name}.png", buffer.getvalue(), "image/png")
+        for name in ("thumbnail_image", "description_image", "detail_image")
+    }
+
+    with patch(
+        "common.services.ncp_api_conf.ObjectStorage.put_object",
+        side_effect=_put_object,
+    ) as mock_put_object:
+        response = admin_client.post(url, {"class_id": sample_class.id, **images})
+
+    assert response.status_code == 302
+    # 같은 내용의 세 이미지는 한 번만 업로드됩니다.
+    assert mock_put_object.call_count == 1
+    class_images = ClassImages.objects.get(class_id=sample_class)
+    assert class_images.thumbnail_image_urls == class_images.detail_image_urls
+    assert len(class_images.description_image_urls) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["class-list", "class-search"])
+def test_class_listings_use_batched_usd_prices(api_client, url_name):
+    ExchangeRate.objects.create(currency="USD", rate="1000.0000")
+    klass = Class.objects.create(title="Pottery", price=5500, address="서울시")
+
+    with patch(
+        "classes.views.get_prices_in_usd", wraps=get_prices_in_usd
+    ) as mock_prices:
+        response = api_client.get(reverse(url_name), {"q": "Pottery"})
+
+    assert response.status_code == status.HTTP_200_OK
+    mock_prices.assert_called_once()
+    assert response.data["data"][0]["id"] == klass.id
+    assert response.data["data"][0]["price_in_usd"] == 6
+
+
+def test_class_detail_cache_ttl_is_short_without_shared_cache(settings):
+    from classes.cache import CLASS_DETAIL_CACHE_TIMEOUT
+
+    # 테스트 환경은 LocMemCache 이므로 워커별 캐시용 짧은 TTL 이 적용됩니다.
+    assert not settings.SHARED_CACHE
+    assert CLASS_DETAIL_CACHE_TIMEOUT <= 10
+
+
+def test_unviewed_class_count_ttl_is_short_without_shared_cache(settings):
+    from classes.services import UNVIEWED_CLASS_COUNT_CACHE_TIMEOUT
+
+    assert not settings.SHARED_CACHE
+    assert UNVIEWED_CLASS_COUNT_CACHE_TIMEOUT <= 10
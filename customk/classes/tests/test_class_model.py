@@ -1,8 +1,37 @@
+import json
+from datetime import timedelta
+from io import BytesIO
 from unicodedata import category
+from unittest.mock import patch
 
 import pytest
+from django.contrib import admin
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+from PIL import Image
 
-from classes.models import Category, Class
+from classes.admin import ClassImagesAdmin
+from classes.forms import ClassImagesForm
+from classes.models import (
+    Category,
+    Class,
+    ClassDate,
+    ClassImages,
+    ClassImportProgress,
+    ClassPaymentStat,
+)
+from classes.services import (
+    generate_class_image_variants,
+    get_class_calendar,
+    get_popular_class_ids,
+)
+from common.models import StoredObject
+from common.services.images import make_webp_variants
+from payments.models import Payment
+from reviews.models import Review
+from users.models import User
 
 pytestmark = pytest.mark.django_db
 
@@ -59,3 +88,319 @@ def test_class_update_success(class_instance):
     assert updated_class.require_person == 5
     assert updated_class.price == 1000
     assert updated_class.address == "Seoul, Gangnam-gu"
+
+
+def test_rebuild_class_ratings(class_instance):
+    user = User.objects.create_user(email="rating@example.com", password="pw")
+    Review.objects.create(
+        user=user, class_id=class_instance, review="recent", rating="4.0"
+    )
+    Review.objects.create(
+        user=user,
+        class_id=class_instance,
+        review="old",
+        rating="2.0",
+        created_at=timezone.now() - timedelta(days=60),
+    )
+    Class.objects.filter(id=class_instance.id).update(
+        rating_sum=0, rating_count=0, recent_rating_sum=0, recent_rating_count=0
+    )
+
+    call_command("rebuild_class_ratings")
+
+    class_instance.refresh_from_db()
+    assert class_instance.rating_count == 2
+    assert class_instance.average_rating == 3.0
+    assert class_instance.recent_rating_count == 1
+    assert class_instance.recent_average_rating == 4.0
+
+
+def _create_payment(class_id, order_id):
+    return Payment.objects.create(
+        order_id=order_id,
+        status="completed",
+        amount=0,
+        payment_method="none",
+        user_id=1,
+        class_id=class_id,
+        class_date_id=1,
+    )
+
+
+def test_payments_update_popular_ranking():
+    classes = [
+        Class.objects.create(title=f"Class {i}", address="서울시") for i in range(5)
+    ]
+    for i, klass in enumerate(classes):
+        for n in range(i + 1):
+            _create_payment(klass.id, f"order-{klass.id}-{n}")
+
+    stat = ClassPaymentStat.objects.get(class_id=classes[-1].id)
+    assert stat.payment_count == 5
+    assert get_popular_class_ids() == {classes[-1].id}
+
+
+def test_decay_class_popularity():
+    old = ClassPaymentStat.objects.create(
+        class_id=1, date=timezone.localdate() - timedelta(days=31), payment_count=3
+    )
+    recent = ClassPaymentStat.objects.create(
+        class_id=2, date=timezone.localdate(), payment_count=1
+    )
+
+    call_command("decay_class_popularity")
+
+    assert not ClassPaymentStat.objects.filter(id=old.id).exists()
+    assert ClassPaymentStat.objects.filter(id=recent.id).exists()
+    assert get_popular_class_ids() == {2}
+
+
+def _png_bytes(width, height):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), "red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_make_webp_variants_does_not_upscale():
+    variants = make_webp_variants(_png_bytes(800, 400))
+
+    sizes = {width: Image.open(BytesIO(data)).size for width, data in variants.items()}
+    assert sizes == {320: (320, 160), 640: (640, 320), 1280: (800, 400)}
+    assert Image.open(BytesIO(variants[320])).format == "WEBP"
+
+
+def test_generate_class_image_variants(class_instance):
+    original = "https://storage/class-images/abc.png"
+    class_images = ClassImages.objects.create(
+        class_id=class_instance, thumbnail_image_urls=[original]
+    )
+
+    with (
+        patch("common.services.images.requests.get") as mock_get,
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.put_object",
+            side_effect=lambda bucket, name, data: (200, f"https://storage/{name}"),
+        ) as mock_put_object,
+    ):
+        mock_get.return_value.content = _png_bytes(500, 500)
+        generate_class_image_variants(class_images.id)
+        generate_class_image_variants(class_images.id)
+
+    class_images.refresh_from_db()
+    [variants] = class_images.thumbnail_image_variants
+    assert variants["original"] == original
+    assert variants["320"].endswith(".webp")
+    # 640/1280 은 같은 이미지를 공유하고, 두 번째 호출은 아무것도 하지 않습니다.
+    assert variants["640"] == variants["1280"] != variants["320"]
+    assert mock_put_object.call_count == 2
+
+
+def test_class_images_delete_releases_variants(
+    class_instance, django_capture_on_commit_callbacks
+):
+    original = "https://storage/class-images/abc.png"
+    class_images = ClassImages.objects.create(
+        class_id=class_instance, thumbnail_image_urls=[original]
+    )
+    with (
+        patch("common.services.images.requests.get") as mock_get,
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.put_object",
+            side_effect=lambda bucket, name, data: (200, f"https://storage/{name}"),
+        ),
+    ):
+        mock_get.return_value.content = _png_bytes(500, 500)
+        generate_class_image_variants(class_images.id)
+    # 640/1280 이 같은 객체를 공유하므로 두 객체에 참조 3개가 잡혀 있습니다.
+    assert sum(StoredObject.objects.values_list("ref_count", flat=True)) == 3
+
+    with (
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.delete_object",
+            return_value=204,
+        ) as mock_delete_object,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        class_instance.delete()
+
+    assert not StoredObject.objects.exists()
+    # 인덱스에 없는 외부 원본에는 서명된 DELETE 를 보내지 않습니다.
+    deleted = {c.args[0] for c in mock_delete_object.call_args_list}
+    assert original not in deleted
+    assert len(deleted) == 2
+
+
+def test_class_images_admin_releases_uploads_on_save_error(class_instance):
+    form = ClassImagesForm(
+        data={"class_id": class_instance.id},
+        files={
+            "thumbnail_image": SimpleUploadedFile(
+                "thumb.png", _png_bytes(10, 10), content_type="image/png"
+            )
+        },
+    )
+    assert form.is_valid()
+
+    def failing_save_model(self, request, obj, form, change):
+        # 현재 트랜잭션을 중단시키는 DB 오류를 재현합니다.
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 / 0")
+
+    with (
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.put_object",
+            side_effect=lambda bucket, name, data: (200, f"https://storage/{name}"),
+        ),
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.delete_object",
+            return_value=204,
+        ) as mock_delete_object,
+        patch.object(admin.ModelAdmin, "save_model", failing_save_model),
+        pytest.raises(DatabaseError),
+        transaction.atomic(),
+    ):
+        ClassImagesAdmin(ClassImages, admin.site).save_model(
+            None, form.instance, form, False
+        )
+
+    mock_delete_object.assert_called_once()
+    assert not StoredObject.objects.exists()
+
+
+def test_class_images_save_schedules_variants(
+    class_instance, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks() as callbacks:
+        ClassImages.objects.create(
+            class_id=class_instance, thumbnail_image_urls=["https://storage/a.png"]
+        )
+        ClassImages.objects.create(class_id=class_instance)
+
+    assert len(callbacks) == 1
+
+
+def _import_record(i, **extra):
+    return {
+        "title": f"Imported {i}",
+        "address": "서울시 마포구",
+        "price": 10000 + i,
+        "genre": "Cooking",
+        "category": ["Kimchi", "Tea"],
+        "class_type": ["Offline"],
+        "thumbnail_image_urls": [f"https://storage/{i}.png"],
+        "dates": [
+            {"start_date": "2024-10-01", "start_time": "10:00", "end_time": "12:00"},
+            {"start_date": "2024-10-02", "start_time": "10:00", "end_time": "12:00"},
+        ],
+        **extra,
+    }
+
+
+def test_import_classes_jsonl_is_resumable(
+    tmp_path, django_capture_on_commit_callbacks
+):
+    path = tmp_path / "classes.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(_import_record(i)) for i in range(5)), encoding="utf-8"
+    )
+    ClassImportProgress.objects.create(source=str(path), processed=2)
+    get_class_calendar("2024-10")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("import_classes", str(path), batch_size=2)
+
+    imported = Class.objects.filter(title__startswith="Imported")
+    assert sorted(imported.values_list("title", flat=True)) == [
+        "Imported 2",
+        "Imported 3",
+        "Imported 4",
+    ]
+    assert ClassDate.objects.filter(class_id__in=imported).count() == 6
+    assert ClassImages.objects.filter(class_id__in=imported).count() == 3
+    klass = imported.get(title="Imported 3")
+    assert klass.genre.name == "Cooking"
+    assert sorted(klass.category.values_list("name", flat=True)) == ["Kimchi", "Tea"]
+    assert ClassImportProgress.objects.get(source=str(path)).processed == 5
+    # bulk_create 로 추가된 일정도 월별 달력 캐시에 반영됩니다.
+    assert get_class_calendar("2024-10")[0]["session_count"] == 3
+
+    # 완료된 파일을 다시 실행해도 중복 등록되지 않습니다.
+    call_command("import_classes", str(path))
+    assert imported.count() == 3
+
+
+def test_import_classes_records_progress_with_batch(tmp_path):
+    path = tmp_path / "classes.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(_import_record(i)) for i in range(3)), encoding="utf-8"
+    )
+
+    # 두 번째 배치가 실패해도 첫 배치와 그 진행 상황은 함께 커밋되어 있습니다.
+    with patch.object(
+        ClassImages.objects, "bulk_create", side_effect=[[], RuntimeError]
+    ):
+        with pytest.raises(RuntimeError):
+            call_command("import_classes", str(path), batch_size=2)
+    assert ClassImportProgress.objects.get(source=str(path)).processed == 2
+
+    call_command("import_classes", str(path), batch_size=2)
+    assert sorted(
+        Class.objects.filter(title__startswith="Imported").values_list(
+            "title", flat=True
+        )
+    ) == ["Imported 0", "Imported 1", "Imported 2"]
+
+
+def test_import_classes_csv(tmp_path):
+    path = tmp_path / "classes.csv"
+    dates = json.dumps(_import_record(0)["dates"]).replace('"', '""')
+    path.write_text(
+        "title,address,price,category,class_type,dates\n"
+        f'CSV class,서울시 종로구,30000,Kimchi|Tea,Online|Offline,"{dates}"\n',
+        encoding="utf-8",
+    )
+
+    call_command("import_classes", str(path))
+
+    klass = Class.objects.get(title="CSV class")
+    assert klass.price == 30000
+    assert klass.class_type == ["Online", "Offline"]
+    assert klass.dates.count() == 2
+    assert klass.category.count() == 2
+
+
+@pytest.mark.parametrize(
+    "address, region",
+    [
+        ("경기도, 성남시, 중원구", ("경기도", "성남시", "중원구")),
+        ("서울시 강남구 테헤란로", ("서울특별시", "", "강남구")),
+        ("경기 양평군 양서면", ("경기도", "양평군", "")),
+        ("Seoul, Gangnam-gu", ("", "", "")),
+    ],
+)
+def test_class_region_is_parsed_on_save(address, region):
+    klass = Class.objects.create(title="Region", address=address)
+    assert (klass.province, klass.city, klass.district) == region
+
+    klass.address = "부산광역시 해운대구"
+    klass.save(update_fields=["address"])
+    klass.refresh_from_db()
+    assert (klass.province, klass.city, klass.district) == (
+        "부산광역시",
+        "",
+        "해운대구",
+    )
+
+
+def test_backfill_class_regions():
+    klass = Class.objects.create(title="Region", address="경기도 성남시 분당구")
+    Class.objects.filter(id=klass.id).update(province="", city="", district="")
+
+    call_command("backfill_class_regions")
+
+    klass.refresh_from_db()
+    assert (klass.province, klass.city, klass.district) == (
+        "경기도",
+        "성남시",
+        "분당구",
+    )
@@ -1,8 +1,31 @@
 from django.urls import re_path
 
-from classes.views import ClassDetailView, ClassListView
+from classes.views import (
+    ClassAvailabilityView,
+    ClassCalendarView,
+    ClassDetailCacheStatsView,
+    ClassDetailView,
+    ClassFacetView,
+    ClassListView,
+    ClassRegionView,
+    ClassSearchView,
+)
 
 urlpatterns = [
     re_path(r"^$", ClassListView.as_view(), name="class-list"),
+    re_path(r"^search/?$", ClassSearchView.as_view(), name="class-search"),
+    re_path(r"^calendar/?$", ClassCalendarView.as_view(), name="class-calendar"),
+    re_path(r"^regions/?$", ClassRegionView.as_view(), name="class-regions"),
+    re_path(r"^facets/?$", ClassFacetView.as_view(), name="class-facets"),
+    re_path(
+        r"^availability/?$",
+        ClassAvailabilityView.as_view(),
+        name="class-availability",
+    ),
+    re_path(
+        r"^cache-stats/?$",
+        ClassDetailCacheStatsView.as_view(),
+        name="class-detail-cache-stats",
+    ),
     re_path(r"^(?P<class_id>\d+)/$", ClassDetailView.as_view(), name="class-detail"),
 ]
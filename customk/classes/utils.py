@@ -1,23 +1,64 @@
-import uuid
+import re
+from typing import Optional
 
-from django.core.files.uploadedfile import UploadedFile
+METROPOLITAN_CITIES = {
+    "서울": "서울특별시",
+    "부산": "부산광역시",
+    "대구": "대구광역시",
+    "인천": "인천광역시",
+    "광주": "광주광역시",
+    "대전": "대전광역시",
+    "울산": "울산광역시",
+    "세종": "세종특별자치시",
+}
+PROVINCES = {
+    "경기": "경기도",
+    "강원": "강원특별자치도",
+    "충북": "충청북도",
+    "충남": "충청남도",
+    "전북": "전북특별자치도",
+    "전남": "전라남도",
+    "경북": "경상북도",
+    "경남": "경상남도",
+    "제주": "제주특별자치도",
+}
+METROPOLITAN_SUFFIXES = ("특별자치시", "특별시", "광역시", "시")
 
-from common.services.ncp_api_conf import ObjectStorage  # Object Storage 클라이언트
 
+def _metropolitan_city(token: str) -> Optional[str]:
+    for suffix in METROPOLITAN_SUFFIXES:
+        if token.endswith(suffix):
+            token = token[: -len(suffix)]
+            break
+    return METROPOLITAN_CITIES.get(token)
 
-def upload_image_to_object_storage(image_file: UploadedFile) -> str:
-    if image_file.name is None:
-        raise ValueError("Uploaded file does not have a valid name.")
 
-    obj_client = ObjectStorage()
-    file_name = f"{uuid.uuid4()}.{image_file.name.split('.')[-1]}"
-    bucket_name = "customk-imagebucket"
-    object_name = f"class-images/{file_name}"
+def parse_region(address: str) -> tuple[str, str, str]:
+    """
+    '도, 시, 구' 형식의 주소에서 (province, city, district) 를 추출합니다.
+    특별시/광역시는 province 로 보고 city 는 비워 둡니다. 알 수 없는 단계는 "" 입니다.
+    예) "경기도, 성남시, 중원구" -> ("경기도", "성남시", "중원구")
+        "서울시 강남구 테헤란로" -> ("서울특별시", "", "강남구")
+    """
+    tokens = [token for token in re.split(r"[,\s]+", str(address or "")) if token]
+    province = city = district = ""
+    if not tokens:
+        return province, city, district
 
-    status_code, image_url = obj_client.put_object(
-        bucket_name, object_name, image_file.read()
-    )
-    if status_code != 200:
-        raise Exception("Failed to upload image to Object Storage")
+    first = tokens[0]
+    rest = tokens[1:]
+    metropolitan = _metropolitan_city(first)
+    if metropolitan:
+        province = metropolitan
+    elif first in PROVINCES or first.endswith("도"):
+        province = PROVINCES.get(first, first)
+        if rest and rest[0].endswith(("시", "군")):
+            city = rest.pop(0)
+    elif first.endswith("시"):
+        city = first
+    else:
+        return province, city, district
 
-    return image_url
+    if rest and rest[0].endswith(("구", "군")):
+        district = rest[0]
+    return province, city, district
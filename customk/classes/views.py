@@ -1,16 +1,55 @@
 from typing import Any
 
-from django.db.models import Avg
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
-from rest_framework import status
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+    inline_serializer,
+)
+from rest_framework import serializers, status
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.conditional import get_not_modified_response, set_validators
+from common.pagination import KeysetPaginator, OffsetPaginator
+
+from .cache import (
+    cache_class_detail,
+    get_cached_class_detail,
+    get_class_detail_cache_key,
+    get_class_detail_cache_stats,
+)
 from .models import Class
-from .serializers import ClassSerializer
+from .serializers import (
+    ClassAvailabilitySerializer,
+    ClassSerializer,
+    get_requested_class_fields,
+)
+from .services import (
+    CLASS_FILTER_PARAMS,
+    filter_classes,
+    get_available_class_dates,
+    get_class_calendar,
+    get_class_detail_validators,
+    get_class_facets,
+    get_class_page_validators,
+    get_class_queryset,
+    get_class_region_tree,
+    get_popular_class_ids,
+    get_prices_in_usd,
+    search_classes,
+)
+
+class_list_paginator = KeysetPaginator(
+    ordering=("-created_at", "-id"), default_size=20, max_size=100
+)
+class_search_paginator = OffsetPaginator(default_size=20, max_size=100)
+class_availability_paginator = KeysetPaginator(
+    ordering=("start_date", "start_time", "id"), default_size=50, max_size=200
+)
 
 
 class ClassListView(APIView):
@@ -22,22 +61,139 @@ class ClassListView(APIView):
     @extend_schema(
         methods=["GET"],
         summary="클래스 목록 조회",
-        description="등록된 클래스 목록을 조회하는 API입니다.",
+        description="등록된 클래스 목록을 커서 페이지네이션 형태로 조회하는 API입니다.",
+        parameters=[
+            OpenApiParameter(
+                name="cursor",
+                description="이전 응답의 next_cursor 값",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="size",
+                description="페이지당 항목 수 (최대 100)",
+                required=False,
+                default=20,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="fields",
+                description="응답에 포함할 필드 (쉼표 구분, 예: id,title,price,thumbnail)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="expand",
+                description="fields 와 함께 포함할 중첩 필드 (dates, images, category)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="genre",
+                description="장르 이름 (여러 개 지정 가능)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                many=True,
+            ),
+            OpenApiParameter(
+                name="category",
+                description="카테고리 이름 (여러 개 지정 가능)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                many=True,
+            ),
+            OpenApiParameter(
+                name="min_price",
+                description="최소 가격",
+                required=False,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="max_price",
+                description="최대 가격",
+                required=False,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="class_type",
+                description="클래스 유형 (여러 개 지정 가능)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                many=True,
+            ),
+            OpenApiParameter(
+                name="region",
+                description="지역 경로 '도/시/구' (지역 트리의 region 값, 여러 개 지정 가능)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                many=True,
+            ),
+        ],
         responses={
             200: OpenApiResponse(
-                description="클래스 목록 조회 성공", response=ClassSerializer(many=True)
+                description="클래스 목록 조회 성공",
+                response=inline_serializer(
+                    name="ClassListResponse",
+                    fields={
+                        "status": serializers.CharField(),
+                        "message": serializers.CharField(),
+                        "data": ClassSerializer(many=True),
+                        "next_cursor": serializers.CharField(
+                            allow_null=True, help_text="다음 페이지 커서"
+                        ),
+                    },
+                ),
             ),
+            304: OpenApiResponse(description="변경 없음 (ETag/Last-Modified 일치)"),
+            400: OpenApiResponse(description="잘못된 필터 또는 커서"),
         },
     )
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        classes = Class.objects.annotate(average_rating=Avg("reviews__rating"))
-        serializer = ClassSerializer(classes, many=True)
+        try:
+            fields = get_requested_class_fields(request.query_params)
+            classes = filter_classes(get_class_queryset(fields), request.query_params)
+            page, next_cursor = class_list_paginator.paginate(
+                classes,
+                cursor=request.query_params.get("cursor"),
+                size=request.query_params.get("size"),
+            )
+        except ValueError as e:
+            return Response(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        etag, last_modified = get_class_page_validators(
+            page, next_cursor, request.get_full_path()
+        )
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = ClassSerializer(
+            page,
+            many=True,
+            context={"fields": fields, "prices_in_usd": get_prices_in_usd(page)},
+        )
         response_data = {
             "status": "success",
             "message": "Event fetched successfully",
             "data": serializer.data,
+            "next_cursor": next_cursor,
         }
-        return Response(response_data, status=status.HTTP_200_OK)
+        return set_validators(
+            Response(response_data, status=status.HTTP_200_OK), etag, last_modified
+        )
 
     @extend_schema(
         methods=["POST"],
@@ -150,6 +306,7 @@ class ClassDetailView(APIView):
             200: OpenApiResponse(
                 description="클래스 조회 성공", response=ClassSerializer
             ),
+            304: OpenApiResponse(description="변경 없음 (ETag/Last-Modified 일치)"),
             404: OpenApiResponse(description="클래스가 존재하지 않음"),
         },
     )
@@ -160,20 +317,424 @@ class ClassDetailView(APIView):
                 {"status": "error", "message": "Class ID not provided"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        # URL 에서 받은 문자열 그대로는 인기 클래스 id(int) 집합과 비교되지 않습니다.
+        class_id = int(class_id)
+        cache_key = get_class_detail_cache_key(
+            class_id, class_id in get_popular_class_ids()
+        )
+        entry = get_cached_class_detail(cache_key)
+        if entry is not None:
+            not_modified = get_not_modified_response(
+                request, entry["etag"], entry["last_modified"]
+            )
+            if not_modified is not None:
+                return not_modified
+            return set_validators(
+                Response(
+                    {
+                        "status": "success",
+                        "message": "Class fetched successfully",
+                        "data": entry["data"],
+                    },
+                    status=200,
+                ),
+                entry["etag"],
+                entry["last_modified"],
+            )
+
+        validators = get_class_detail_validators(class_id)
+        if validators is None:
+            return Response(
+                {"status": "error", "message": "Class not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        etag, last_modified = validators
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
         try:
-            class_instance = Class.objects.annotate(
-                average_rating=Avg("reviews__rating")
-            ).get(id=class_id)
+            class_instance = get_class_queryset().get(id=class_id)
 
             serializer = ClassSerializer(class_instance)
+            cache_class_detail(cache_key, serializer.data, etag, last_modified)
             response_data = {
                 "status": "success",
                 "message": "Class fetched successfully",
                 "data": serializer.data,
             }
-            return Response(response_data, status=200)
+            return set_validators(
+                Response(response_data, status=200), etag, last_modified
+            )
         except Class.DoesNotExist:
             return Response(
                 {"status": "error", "message": "Class not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
+
+
+class ClassSearchView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        methods=["GET"],
+        summary="클래스 검색",
+        description="제목, 설명, 주소를 대상으로 클래스를 검색하고 관련도 순으로 반환하는 API입니다. 목록 조회와 같은 필터를 함께 사용할 수 있습니다.",
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                description="검색어",
+                required=True,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="page",
+                description="페이지 번호",
+                required=False,
+                default=1,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="size",
+                description="페이지당 항목 수 (최대 100)",
+                required=False,
+                default=20,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="fields",
+                description="응답에 포함할 필드 (쉼표 구분, 예: id,title,price,thumbnail)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="expand",
+                description="fields 와 함께 포함할 중첩 필드 (dates, images, category)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(
+                description="클래스 검색 성공",
+                response=inline_serializer(
+                    name="ClassSearchResponse",
+                    fields={
+                        "status": serializers.CharField(),
+                        "message": serializers.CharField(),
+                        "data": ClassSerializer(many=True),
+                        "current_page": serializers.IntegerField(),
+                        "has_next": serializers.BooleanField(),
+                    },
+                ),
+            ),
+            400: OpenApiResponse(description="검색어 누락 또는 잘못된 요청"),
+        },
+    )
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"status": "error", "message": "Search query not provided"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            fields = get_requested_class_fields(request.query_params)
+            classes = search_classes(
+                filter_classes(get_class_queryset(fields), request.query_params),
+                query,
+            )
+            page, current_page, has_next = class_search_paginator.paginate(
+                classes,
+                page=request.query_params.get("page"),
+                size=request.query_params.get("size"),
+            )
+        except ValueError as e:
+            return Response(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = ClassSerializer(
+            page,
+            many=True,
+            context={"fields": fields, "prices_in_usd": get_prices_in_usd(page)},
+        )
+        response_data = {
+            "status": "success",
+            "message": "Classes searched successfully",
+            "data": serializer.data,
+            "current_page": current_page,
+            "has_next": has_next,
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class ClassFacetView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        methods=["GET"],
+        summary="클래스 필터 항목별 개수 조회",
+        description="현재 필터 조건에서 장르, 카테고리, 가격대, 클래스 유형별 클래스 수를 조회하는 API입니다. 목록 조회와 같은 필터 파라미터를 사용합니다.",
+        parameters=[
+            OpenApiParameter(
+                name=name,
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                many=name in ("genre", "category", "class_type", "region"),
+            )
+            for name in CLASS_FILTER_PARAMS
+        ],
+        responses={
+            200: OpenApiResponse(
+                description="필터 항목별 개수 조회 성공",
+                response=inline_serializer(
+                    name="ClassFacetResponse",
+                    fields={
+                        "status": serializers.CharField(),
+                        "message": serializers.CharField(),
+                        "data": serializers.DictField(
+                            child=serializers.ListField(child=serializers.DictField()),
+                            help_text="genre, category, price, class_type 별 개수",
+                        ),
+                    },
+                ),
+            ),
+            400: OpenApiResponse(description="잘못된 필터"),
+        },
+    )
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        try:
+            facets = get_class_facets(request.query_params)
+        except ValueError as e:
+            return Response(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        response_data = {
+            "status": "success",
+            "message": "Class facets fetched successfully",
+            "data": facets,
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class ClassAvailabilityView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        methods=["GET"],
+        summary="예약 가능한 클래스 일정 조회",
+        description="기간 내 잔여 좌석이 있는 클래스 일정만 시작일 순으로 조회하는 API입니다. 기간은 최대 31일입니다.",
+        parameters=[
+            OpenApiParameter(
+                name="start_date",
+                description="조회 시작일 (YYYY-MM-DD)",
+                required=True,
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="end_date",
+                description="조회 종료일 (YYYY-MM-DD, 기본값은 시작일)",
+                required=False,
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="genre",
+                description="장르 이름 (여러 개 지정 가능)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                many=True,
+            ),
+            OpenApiParameter(
+                name="category",
+                description="카테고리 이름 (여러 개 지정 가능)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                many=True,
+            ),
+            OpenApiParameter(
+                name="cursor",
+                description="이전 응답의 next_cursor 값",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name="size",
+                description="페이지당 항목 수 (최대 200)",
+                required=False,
+                default=50,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(
+                description="예약 가능한 일정 조회 성공",
+                response=inline_serializer(
+                    name="ClassAvailabilityResponse",
+                    fields={
+                        "status": serializers.CharField(),
+                        "message": serializers.CharField(),
+                        "data": ClassAvailabilitySerializer(many=True),
+                        "next_cursor": serializers.CharField(allow_null=True),
+                    },
+                ),
+            ),
+            400: OpenApiResponse(description="잘못된 기간 또는 커서"),
+        },
+    )
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        try:
+            class_dates = get_available_class_dates(request.query_params)
+            page, next_cursor = class_availability_paginator.paginate(
+                class_dates,
+                cursor=request.query_params.get("cursor"),
+                size=request.query_params.get("size"),
+            )
+        except ValueError as e:
+            return Response(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = ClassAvailabilitySerializer(page, many=True)
+        response_data = {
+            "status": "success",
+            "message": "Available class dates fetched successfully",
+            "data": serializer.data,
+            "next_cursor": next_cursor,
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
+class ClassDetailCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        methods=["GET"],
+        summary="클래스 상세 캐시 통계",
+        description=(
+            "클래스 상세 응답 캐시의 적중/미스 횟수를 조회하는 관리자용 API입니다. "
+            "REDIS_URL 이 없어 워커별 LocMemCache 를 쓰는 경우 scope 가 worker 이며, "
+            "요청을 처리한 gunicorn 워커 한 곳의 집계만 반환합니다."
+        ),
+        responses={
+            200: OpenApiResponse(description="캐시 통계 조회 성공"),
+            403: OpenApiResponse(description="관리자 권한 없음"),
+        },
+    )
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(
+            {
+                "status": "success",
+                "message": "Cache stats fetched successfully",
+                "data": get_class_detail_cache_stats(),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class ClassRegionView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        methods=["GET"],
+        summary="지역 트리 조회",
+        description=(
+            "도 > 시 > 구 지역 트리와 지역별 클래스 수를 조회하는 API입니다. "
+            "각 노드의 region 값을 클래스 목록의 region 필터에 그대로 사용할 수 있습니다."
+        ),
+        responses={
+            200: OpenApiResponse(
+                description="지역 트리 조회 성공",
+                response=inline_serializer(
+                    name="ClassRegionResponse",
+                    fields={
+                        "status": serializers.CharField(),
+                        "message": serializers.CharField(),
+                        "data": serializers.ListField(
+                            child=serializers.DictField(),
+                            help_text="name, region, count, children",
+                        ),
+                    },
+                ),
+            ),
+        },
+    )
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(
+            {
+                "status": "success",
+                "message": "Regions fetched successfully",
+                "data": get_class_region_tree(),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class ClassCalendarView(APIView):
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        methods=["GET"],
+        summary="월별 일정 캘린더 조회",
+        description="월의 날짜별 전체 일정 수와 잔여 좌석이 있는 일정 수를 조회하는 API입니다.",
+        parameters=[
+            OpenApiParameter(
+                name="month",
+                description="조회할 월 (YYYY-MM, 기본값은 이번 달)",
+                required=False,
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(
+                description="캘린더 조회 성공",
+                response=inline_serializer(
+                    name="ClassCalendarResponse",
+                    fields={
+                        "status": serializers.CharField(),
+                        "message": serializers.CharField(),
+                        "data": serializers.ListField(
+                            child=serializers.DictField(),
+                            help_text="date, session_count, available_count",
+                        ),
+                    },
+                ),
+            ),
+            400: OpenApiResponse(description="잘못된 월 형식"),
+        },
+    )
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        try:
+            calendar = get_class_calendar(request.query_params.get("month"))
+        except ValueError as e:
+            return Response(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "status": "success",
+                "message": "Calendar fetched successfully",
+                "data": calendar,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,70 @@
+import threading
+import time
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+T = TypeVar("T")
+
+# 프로세스별 캐시에서는 다른 워커의 무효화를 받지 못하므로 짧은 TTL 로 최신성을 보장합니다.
+LOCAL_CACHE_TIMEOUT = 10
+
+
+def shared_cache_timeout(timeout: int) -> int:
+    return timeout if settings.SHARED_CACHE else min(timeout, LOCAL_CACHE_TIMEOUT)
+
+
+def _new_version() -> int:
+    # 버전 키가 캐시에서 밀려나도 이전 버전과 겹치지 않도록 시각 기반 값으로 시작합니다.
+    return time.time_ns()
+
+
+def get_cache_versions(keys: Iterable[str]) -> dict[str, int]:
+    """
+    캐시 키에 넣을 버전 값을 한 번에 읽고, 없는 버전 키는 새로 만듭니다.
+    """
+    keys = list(keys)
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _new_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return versions
+
+
+def get_cache_version(key: str) -> int:
+    return get_cache_versions([key])[key]
+
+
+def bump_cache_version(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _new_version(), timeout=None)
+
+
+class ProcessCache(Generic[T]):
+    """
+    loader 결과를 프로세스 메모리에 ttl 초 동안 보관합니다.
+    같은 프로세스에서의 변경은 invalidate() 로 즉시 반영하고,
+    다른 워커 프로세스의 변경은 ttl 이 지나면 반영됩니다.
+    """
+
+    def __init__(self, loader: Callable[[], T], ttl: float):
+        self.loader = loader
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._expires_at = 0.0
+
+    def get(self) -> T:
+        with self._lock:
+            if time.monotonic() >= self._expires_at:
+                self._value = self.loader()
+                self._expires_at = time.monotonic() + self.ttl
+            return self._value  # type: ignore[return-value]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._expires_at = 0.0
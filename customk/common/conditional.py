@@ -0,0 +1,37 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def get_not_modified_response(
+    request: Request, etag: str, last_modified: Optional[datetime]
+) -> Optional[HttpResponse]:
+    """
+    If-None-Match / If-Modified-Since 가 현재 버전과 일치하면 304 응답을 반환합니다.
+    직렬화 전에 호출해 변경되지 않은 리소스는 serializer 를 실행하지 않도록 합니다.
+    """
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[datetime]
+) -> Response:
+    response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
@@ -0,0 +1,112 @@
+import statistics
+import time
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from classes.models import Class
+from common.pagination import ListPaginator
+from reviews.models import Review
+from users.models import User
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "리뷰 목록으로 페이지 깊이별 OFFSET / OFFSET+COUNT / keyset(before) 조회 시간을 "
+        "비교합니다. --seed 로 만든 데이터는 측정 후 롤백됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed", type=int, default=0, help="측정 전에 임시로 추가할 리뷰 수"
+        )
+        parser.add_argument("--size", type=int, default=20)
+        parser.add_argument(
+            "--pages", type=int, nargs="+", default=[1, 10, 100, 1000, 5000]
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be positive")
+        try:
+            with transaction.atomic():
+                if options["seed"]:
+                    self.seed(options["seed"])
+                self.run(options["size"], options["pages"], options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def seed(self, count: int) -> None:
+        user = User.objects.create_user(
+            email="pagination-benchmark@example.com", password=None
+        )
+        klass = Class.objects.create(
+            title="pagination benchmark",
+            description="",
+            max_person=1,
+            require_person=1,
+            price=0,
+            address="",
+        )
+        Review.objects.bulk_create(
+            (
+                Review(user=user, class_id=klass, review=f"review {i}", rating="4.0")
+                for i in range(count)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Review._meta.db_table}")
+        self.stdout.write(f"리뷰 {count}개를 임시로 추가했습니다.")
+
+    def run(self, size: int, pages: list[int], repeat: int) -> None:
+        queryset = Review.objects.all()
+        offset_paginator = ListPaginator(max_size=size, with_total=False)
+        counted_paginator = ListPaginator(max_size=size, with_total=True)
+        total = queryset.count()
+
+        self.stdout.write(
+            f"{'page':>8} {'offset':>10} {'offset+count':>14} {'keyset':>10}  (ms)"
+        )
+        for page in pages:
+            offset = (page - 1) * size
+            if offset >= total:
+                self.stdout.write(f"{page:>8} 전체 {total}개를 넘어서는 페이지입니다.")
+                continue
+            # keyset 은 직전 페이지 마지막 id 를 before 로 받은 상황을 가정합니다.
+            before = (
+                queryset.order_by("-id").values_list("id", flat=True)[offset - 1]
+                if offset
+                else None
+            )
+            params = {"page": page, "size": size}
+            keyset_params = {"before": before, "size": size}
+
+            offset_ms = self.measure(
+                lambda: offset_paginator.get_page(queryset, params), repeat
+            )
+            counted_ms = self.measure(
+                lambda: counted_paginator.get_page(queryset, params), repeat
+            )
+            keyset_ms = self.measure(
+                lambda: offset_paginator.get_page(queryset, keyset_params), repeat
+            )
+            self.stdout.write(
+                f"{page:>8} {offset_ms:>10.2f} {counted_ms:>14.2f} {keyset_ms:>10.2f}"
+            )
+
+    @staticmethod
+    def measure(func: Callable[[], Any], repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
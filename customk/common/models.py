@@ -8,3 +8,19 @@ class CommonModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class StoredObject(models.Model):
+    """
+    ObjectStorage 에 올린 객체의 내용 주소(SHA-256) 인덱스입니다.
+    같은 내용은 한 번만 업로드하고, ref_count 가 0 이 될 때만 실제 객체를 삭제합니다.
+    """
+
+    object_name = models.CharField(max_length=255, unique=True)
+    url = models.CharField(max_length=500, unique=True)
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.object_name} ({self.ref_count} refs)"
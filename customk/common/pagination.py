@@ -0,0 +1,239 @@
+import base64
+import binascii
+import datetime
+import json
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Mapping, Optional, Sequence
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.db.models import Model, Q, QuerySet
+
+
+class PaginationError(ValueError):
+    pass
+
+
+def parse_size(raw_size: Optional[str], default: int, max_size: int) -> int:
+    if raw_size in (None, ""):
+        return default
+    try:
+        size = int(raw_size)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        raise PaginationError("Invalid page size")
+    if size < 1:
+        raise PaginationError("Invalid page size")
+    return min(size, max_size)
+
+
+def parse_page(raw_page: Optional[str]) -> int:
+    if raw_page in (None, ""):
+        return 1
+    try:
+        page = int(raw_page)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        raise PaginationError("Page input error")
+    if page < 1:
+        raise PaginationError("Page input error")
+    return page
+
+
+def _cursor_value(value: Any) -> Any:
+    # DjangoJSONEncoder 는 마이크로초를 밀리초로 자르므로 커서에는 전체 정밀도를 보존합니다.
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_cursor_value(value) for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise PaginationError("Invalid cursor")
+    if not isinstance(values, list):
+        raise PaginationError("Invalid cursor")
+    return values
+
+
+class KeysetPaginator:
+    """
+    (created_at, id) 처럼 유일한 정렬 키를 기준으로 커서 페이지네이션을 수행합니다.
+    OFFSET 을 사용하지 않으므로 깊은 페이지도 인덱스 범위 스캔 한 번으로 조회됩니다.
+    """
+
+    def __init__(
+        self, ordering: Sequence[str], default_size: int = 20, max_size: int = 100
+    ):
+        self.ordering = tuple(ordering)
+        self.default_size = default_size
+        self.max_size = max_size
+
+    @staticmethod
+    def _field_name(order: str) -> str:
+        return order.lstrip("-")
+
+    def _after(self, values: Sequence[Any]) -> Q:
+        condition = Q()
+        equal = Q()
+        for order, value in zip(self.ordering, values):
+            name = self._field_name(order)
+            lookup = "lt" if order.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def paginate(
+        self,
+        queryset: QuerySet,
+        cursor: Optional[str] = None,
+        size: Optional[str] = None,
+    ) -> tuple[list[Model], Optional[str]]:
+        page_size = parse_size(size, self.default_size, self.max_size)
+
+        queryset = queryset.order_by(*self.ordering)
+        try:
+            if cursor:
+                values = decode_cursor(cursor)
+                if len(values) != len(self.ordering):
+                    raise PaginationError("Invalid cursor")
+                queryset = queryset.filter(self._after(values))
+            items = list(queryset[: page_size + 1])
+        except (ValidationError, TypeError, ValueError):
+            raise PaginationError("Invalid cursor")
+
+        if len(items) <= page_size:
+            return items, None
+
+        items = items[:page_size]
+        last = items[-1]
+        next_cursor = encode_cursor(
+            [getattr(last, self._field_name(order)) for order in self.ordering]
+        )
+        return items, next_cursor
+
+
+class OffsetPaginator:
+    """
+    page/size 기반 페이지네이션. 전체 개수 대신 size + 1 개를 조회해 다음 페이지 여부를 판단합니다.
+    """
+
+    def __init__(self, default_size: int = 15, max_size: int = 100):
+        self.default_size = default_size
+        self.max_size = max_size
+
+    def paginate(
+        self,
+        queryset: QuerySet,
+        page: Optional[str] = None,
+        size: Optional[str] = None,
+    ) -> tuple[list[Model], int, bool]:
+        page_number = parse_page(page)
+        page_size = parse_size(size, self.default_size, self.max_size)
+        offset = (page_number - 1) * page_size
+
+        items = list(queryset[offset : offset + page_size + 1])
+        return items[:page_size], page_number, len(items) > page_size
+
+
+def count_pages(total_count: int, size: int) -> int:
+    return -(-total_count // size)
+
+
+@dataclass
+class Page:
+    items: list[Any]
+    has_next: bool
+    next_before: Optional[int]
+    current_page: Optional[int] = None
+    total_count: Optional[int] = None
+    total_pages: Optional[int] = None
+
+    def metadata(self) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        if self.total_count is not None:
+            data["total_count"] = self.total_count
+            data["total_pages"] = self.total_pages
+        if self.current_page is not None:
+            data["current_page"] = self.current_page
+        data["next_before"] = self.next_before
+        return data
+
+
+class ListPaginator:
+    """
+    id 내림차순 목록용 페이지네이션.
+    ?page= 는 OFFSET 으로, ?before=<id> 는 id 범위 조건(keyset)으로 조회합니다.
+    어느 모드든 응답의 next_before 로 다음 페이지를 keyset 으로 이어갈 수 있고,
+    with_total=False 이면 COUNT(*) 대신 size + 1 개를 읽어 다음 페이지 여부만 판단합니다.
+    keyset_only=True 이면 깊은 OFFSET 스캔을 막기 위해 ?page= 를 거부합니다.
+    """
+
+    def __init__(
+        self,
+        default_size: int = 15,
+        max_size: int = 100,
+        with_total: bool = True,
+        keyset_only: bool = False,
+    ):
+        self.default_size = default_size
+        self.max_size = max_size
+        self.with_total = with_total
+        self.keyset_only = keyset_only
+
+    def get_page(self, queryset: QuerySet, params: Mapping[str, Any]) -> Page:
+        size = parse_size(params.get("size"), self.default_size, self.max_size)
+        before = params.get("before")
+        if self.keyset_only and params.get("page") not in (None, ""):
+            raise PaginationError("Page is not supported, use before")
+        total_count = queryset.count() if self.with_total else None
+
+        current_page = None
+        if before not in (None, ""):
+            try:
+                queryset = queryset.filter(id__lt=int(before))
+            except (TypeError, ValueError):
+                raise PaginationError("Invalid before")
+            offset = 0
+        elif self.keyset_only:
+            offset = 0
+        else:
+            current_page = parse_page(params.get("page"))
+            offset = (current_page - 1) * size
+
+        items = list(queryset.order_by("-id")[offset : offset + size + 1])
+        has_next = len(items) > size
+        items = items[:size]
+        return Page(
+            items=items,
+            has_next=has_next,
+            next_before=items[-1].id if has_next else None,
+            current_page=current_page,
+            total_count=total_count,
+            total_pages=(
+                count_pages(total_count, size) if total_count is not None else None
+            ),
+        )
+
+
+def estimate_count(model: type[Model]) -> int:
+    """
+    pg_class.reltuples 로 테이블 전체 행 수를 추정합니다.
+    아직 ANALYZE 되지 않은 테이블(-1)만 COUNT(*) 로 셉니다.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < 0:
+        return model._default_manager.count()
+    return row[0]
@@ -1,6 +1,71 @@
+from typing import Collection, Mapping, Optional
+
+from django.core.files.uploadedfile import UploadedFile
 from rest_framework import serializers
 
 
 class ErrorResponseSerializer(serializers.Serializer):
     error = serializers.CharField(help_text="에러 메시지")
     details = serializers.JSONField(help_text="상세 에러 정보", required=False)
+
+
+class ImageUploadField(serializers.Field):
+    """
+    base64 문자열(data:image/...;base64,...) 또는 multipart 로 전송된 이미지 파일을 받습니다.
+    """
+
+    default_error_messages = {
+        "invalid": "Expected a base64 image string or an image file.",
+        "not_image": "Uploaded file is not an image.",
+    }
+
+    def to_internal_value(self, data):
+        if isinstance(data, UploadedFile):
+            if not (data.content_type or "").startswith("image/"):
+                self.fail("not_image")
+            return data
+        if isinstance(data, str) and data:
+            return data
+        self.fail("invalid")
+
+    def to_representation(self, value):
+        return value
+
+
+def _split_fields(raw: Optional[str]) -> set[str]:
+    return {name.strip() for name in (raw or "").split(",") if name.strip()}
+
+
+def parse_requested_fields(
+    params: Mapping[str, str],
+    available: Collection[str],
+    expandable: Collection[str] = (),
+) -> Optional[frozenset[str]]:
+    """
+    ?fields=id,title&expand=dates 형태의 요청 필드를 해석합니다.
+    fields 가 없으면 None(전체 필드)을, 알 수 없는 필드가 있으면 ValueError 를 반환합니다.
+    expand 는 fields 에 더해 포함할 중첩 필드만 지정할 수 있습니다.
+    """
+    fields = _split_fields(params.get("fields"))
+    expand = _split_fields(params.get("expand"))
+
+    unknown = (fields - set(available)) | (expand - set(expandable))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    if not fields:
+        return None
+    return frozenset(fields | expand)
+
+
+class DynamicFieldsMixin:
+    """
+    context["fields"] 에 지정된 필드만 남깁니다. 제거된 SerializerMethodField 와
+    중첩 serializer 는 직렬화 시 호출되지 않습니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = self.context.get("fields")
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
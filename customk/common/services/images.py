@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Callable, Mapping, Optional
+
+import requests
+from django.db import connections, transaction
+from PIL import Image, ImageOps
+
+from common.services.uploads import delete_uploaded_objects, store_objects
+from config.logger import logger
+
+VARIANT_WIDTHS = (320, 640, 1280)
+WEBP_QUALITY = 80
+DOWNLOAD_TIMEOUT = 10
+
+# Pillow 리사이즈는 CPU 를 쓰므로 요청 스레드와 분리된 작은 풀에서 처리합니다.
+image_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-variants")
+
+
+def make_webp_variants(image_data: bytes) -> dict[int, bytes]:
+    """
+    VARIANT_WIDTHS 너비의 WebP 이미지를 만듭니다. 원본보다 크게 확대하지 않으므로
+    원본이 작으면 여러 너비가 같은 이미지를 공유할 수 있습니다.
+    """
+    with Image.open(BytesIO(image_data)) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        encoded: dict[int, bytes] = {}
+        variants = {}
+        for width in VARIANT_WIDTHS:
+            target_width = min(width, image.width)
+            if target_width not in encoded:
+                height = max(1, round(image.height * target_width / image.width))
+                resized = image.resize((target_width, height), Image.LANCZOS)
+                buffer = BytesIO()
+                resized.save(buffer, format="WEBP", quality=WEBP_QUALITY)
+                encoded[target_width] = buffer.getvalue()
+            variants[width] = encoded[target_width]
+        return variants
+
+
+def create_image_variants(image_url: str, directory: str) -> dict[str, str]:
+    """
+    업로드된 원본을 내려받아 WebP 파생 이미지를 올리고 {"original", "320", ...} URL 을 반환합니다.
+    """
+    response = requests.get(image_url, timeout=DOWNLOAD_TIMEOUT)
+    response.raise_for_status()
+    variants = make_webp_variants(response.content)
+
+    # 같은 바이트를 공유하는 너비는 내용 주소가 같으므로 한 번만 업로드됩니다.
+    variant_urls = store_objects(
+        [(data, "webp") for data in variants.values()], directory
+    )
+    return {
+        "original": image_url,
+        **{str(width): url for width, url in zip(variants, variant_urls)},
+    }
+
+
+def image_variant_urls(variants: Optional[Mapping[str, str]]) -> list[str]:
+    # 너비마다 참조를 하나씩 잡았으므로 같은 URL 을 공유해도 중복을 그대로 둡니다.
+    return [url for key, url in (variants or {}).items() if key != "original"]
+
+
+def release_image_variants(variants: Optional[Mapping[str, str]]) -> None:
+    delete_uploaded_objects(image_variant_urls(variants))
+
+
+def needs_image_variants(image_url: str, variants: Optional[Mapping[str, Any]]) -> bool:
+    return bool(image_url) and (variants or {}).get("original") != image_url
+
+
+def _run_image_task(task: Callable[..., None], *args: Any) -> None:
+    try:
+        task(*args)
+    except Exception as e:
+        logger.error(f"Image variant task {task.__name__}{args} failed: {str(e)}")
+    finally:
+        connections.close_all()
+
+
+def schedule_image_task(task: Callable[..., None], *args: Any) -> None:
+    """
+    트랜잭션이 커밋된 뒤 image_executor 에서 task 를 실행합니다.
+    """
+    transaction.on_commit(lambda: image_executor.submit(_run_image_task, task, *args))
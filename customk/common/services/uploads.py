@@ -0,0 +1,183 @@
+import hashlib
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Optional, Sequence, TypeVar, Union
+
+from django.core.files.uploadedfile import UploadedFile
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from common.models import StoredObject
+from common.services.ncp_api_conf import ObjectStorage
+from config.logger import logger
+
+T = TypeVar("T")
+ObjectData = Union[bytes, UploadedFile]
+
+BUCKET_NAME = "customk-imagebucket"
+# 내용 주소 도입 이전에 uuid4 이름으로 올린 객체. 인덱스에 없어도 이 형태만 직접 삭제합니다.
+LEGACY_OBJECT_URL = re.compile(
+    rf"^https://kr\.object\.ncloudstorage\.com/{BUCKET_NAME}/[\w-]+/"
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.\w+$"
+)
+UPLOAD_MAX_WORKERS = 8
+
+# 요청마다 스레드를 만들지 않도록 프로세스 전체에서 하나의 제한된 풀을 공유합니다.
+upload_executor = ThreadPoolExecutor(
+    max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="object-upload"
+)
+
+
+def file_extension(image_file: UploadedFile) -> str:
+    if not image_file.name:
+        raise ValueError("Uploaded file does not have a valid name.")
+    return image_file.name.rsplit(".", 1)[-1].lower()
+
+
+def _digest(data: ObjectData) -> str:
+    hasher = hashlib.sha256()
+    if isinstance(data, bytes):
+        hasher.update(data)
+    else:
+        data.seek(0)
+        for chunk in data.chunks():
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _size(data: ObjectData) -> int:
+    return len(data) if isinstance(data, bytes) else data.size
+
+
+def _put_object(object_name: str, data: ObjectData) -> str:
+    # 파일 객체는 requests 가 블록 단위로 읽어 전송하므로 메모리에 한 번에 올리지 않습니다.
+    if not isinstance(data, bytes):
+        data.seek(0)
+    status_code, image_url = ObjectStorage().put_object(BUCKET_NAME, object_name, data)
+    if status_code != 200:
+        raise ValueError(f"Failed to upload image. Status code: {status_code}")
+    return image_url
+
+
+def _acquire(object_name: str, count: int) -> Optional[str]:
+    stored = StoredObject.objects.filter(object_name=object_name)
+    if not stored.update(ref_count=F("ref_count") + count):
+        return None
+    return stored.values_list("url", flat=True).first()
+
+
+def _register(object_name: str, url: str, size: int, count: int) -> None:
+    try:
+        with transaction.atomic():
+            StoredObject.objects.create(
+                object_name=object_name, url=url, size=size, ref_count=count
+            )
+    except IntegrityError:
+        # 같은 내용을 동시에 올린 요청이 먼저 등록했습니다. 키가 같으므로 참조만 늘립니다.
+        _acquire(object_name, count)
+
+
+def store_objects(files: Sequence[tuple[ObjectData, str]], directory: str) -> list[str]:
+    """
+    (내용, 확장자) 목록을 SHA-256 내용 주소로 저장하고 입력 순서대로 URL 을 반환합니다.
+    인덱스에 이미 있는 내용은 PUT 없이 참조 수만 늘리고, 새 내용만 병렬로 업로드합니다.
+    """
+    names = [f"{directory}/{_digest(data)}.{ext.lower()}" for data, ext in files]
+    data_by_name = {name: data for name, (data, _) in zip(names, files)}
+    counts = Counter(names)
+
+    urls = {}
+    for name, count in counts.items():
+        url = _acquire(name, count)
+        if url is not None:
+            urls[name] = url
+
+    missing = [name for name in counts if name not in urls]
+    try:
+        uploaded = upload_concurrently(
+            lambda name: _put_object(name, data_by_name[name]), missing
+        )
+    except Exception:
+        for name, url in urls.items():
+            release_object(url, counts[name])
+        raise
+
+    for name, url in zip(missing, uploaded):
+        _register(name, url, _size(data_by_name[name]), counts[name])
+        urls[name] = url
+    return [urls[name] for name in names]
+
+
+def store_object(data: ObjectData, ext: str, directory: str) -> str:
+    return store_objects([(data, ext)], directory)[0]
+
+
+def upload_file_to_object_storage(image_file: UploadedFile, directory: str) -> str:
+    """
+    multipart 로 받은 파일을 메모리에 한 번에 읽지 않고 ObjectStorage 로 스트리밍합니다.
+    큰 파일은 Django 업로드 핸들러가 임시 파일에 저장하므로 워커 메모리를 거의 쓰지 않습니다.
+    """
+    return store_object(image_file, file_extension(image_file), directory)
+
+
+def release_object(image_url: str, count: int = 1) -> int:
+    """
+    참조를 count 만큼 해제하고, 남은 참조가 없으면 ObjectStorage 에서 삭제합니다.
+    인덱스에 없는 객체는 우리 버킷의 uuid 이름(내용 주소 도입 이전)일 때만 바로 삭제하고,
+    가져오기로 들어온 외부 URL 등은 서명된 DELETE 를 보내지 않고 해제된 것으로 봅니다.
+    delete_object 와 같이 성공 시 204 를 반환합니다.
+    """
+    with transaction.atomic():
+        stored = StoredObject.objects.select_for_update().filter(url=image_url).first()
+        if stored is None:
+            if not LEGACY_OBJECT_URL.match(image_url):
+                logger.info(f"Skipping delete of unmanaged object {image_url}")
+                return 204
+            return ObjectStorage().delete_object(image_url)
+        if stored.ref_count > count:
+            stored.ref_count -= count
+            stored.save(update_fields=["ref_count"])
+            return 204
+
+        # 행 잠금을 쥔 채로 삭제해야 같은 내용을 새로 올리는 요청과 엇갈리지 않습니다.
+        status_code = ObjectStorage().delete_object(image_url)
+        if status_code in (200, 204):
+            stored.delete()
+        return status_code
+
+
+def delete_uploaded_objects(
+    image_urls: Iterable[str], delete: Callable[[str], int] = release_object
+) -> None:
+    for image_url in image_urls:
+        try:
+            status_code = delete(image_url)
+            if status_code not in (200, 204):
+                logger.error(
+                    f"Failed to delete orphaned object {image_url}: {status_code}"
+                )
+        except Exception as e:
+            logger.error(f"Failed to delete orphaned object {image_url}: {str(e)}")
+
+
+def upload_concurrently(upload: Callable[[T], str], items: Sequence[T]) -> list[str]:
+    """
+    items 를 공유 스레드 풀에서 동시에 업로드하고 입력 순서대로 URL 을 반환합니다.
+    하나라도 실패하면 이미 올라간 객체를 삭제한 뒤 첫 번째 예외를 다시 발생시킵니다.
+    """
+    futures = [upload_executor.submit(upload, item) for item in items]
+
+    image_urls = []
+    error = None
+    for future in futures:
+        try:
+            image_urls.append(future.result())
+        except Exception as e:
+            error = error or e
+
+    if error is not None:
+        # 아직 인덱스에 등록하기 전이므로 참조 해제가 아니라 방금 올린 객체를 직접 지웁니다.
+        delete_uploaded_objects(image_urls, ObjectStorage().delete_object)
+        raise error
+    return image_urls
@@ -23,6 +23,7 @@ DJANGO_SYSTEM_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 CUSTOM_USER_APPS = [
@@ -106,6 +107,32 @@ DATABASES = {
     }
 }
 
+# gunicorn 워커들이 캐시 무효화를 공유하도록 배포 환경에서는 REDIS_URL 을 지정합니다.
+# 지정하지 않으면 워커(프로세스)마다 따로 동작하는 LocMemCache 를 사용합니다.
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": os.getenv(
+                "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+            ),
+            "LOCATION": os.getenv("CACHE_LOCATION", ""),
+        }
+    }
+# 워커 간에 공유되지 않는 캐시에서는 무효화가 다른 워커에 전달되지 않으므로
+# 캐시 TTL 을 짧게 잡아 오래된 응답이 남는 시간을 제한합니다.
+SHARED_CACHE = CACHES["default"]["BACKEND"] not in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
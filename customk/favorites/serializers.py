@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
-from classes.models import Class
 from classes.serializers import ClassSerializer
+from classes.services import get_class_queryset
 
 from .models import Favorite
 
@@ -14,8 +14,12 @@ class FavoriteSerializer(serializers.ModelSerializer):
         fields = ["id", "user", "class_id", "klass"]
 
     def get_klass(self, obj):
-        try:
-            class_instance = Class.objects.get(id=obj.class_id)
-            return ClassSerializer(class_instance).data
-        except Class.DoesNotExist:
+        # 목록 조회 시 뷰에서 미리 불러온 {class_id: Class} 를 context 로 전달합니다.
+        classes = self.context.get("classes")
+        if classes is None:
+            class_instance = get_class_queryset().filter(id=obj.class_id).first()
+        else:
+            class_instance = classes.get(obj.class_id)
+        if class_instance is None:
             return None
+        return ClassSerializer(class_instance).data
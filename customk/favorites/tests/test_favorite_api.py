@@ -1,10 +1,14 @@
 # ruff: noqa: F811
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
+from classes.models import Class, ClassDate
 from classes.tests.conftest import sample_class
 from favorites.models import Favorite
+from favorites.services import add_favorite_class
 from users.tests.conftest import (
     access_token,
     api_client_with_token,
@@ -47,3 +51,27 @@ def test_delete_favorite(
         ).count()
         == 0
     )
+
+
+@pytest.mark.parametrize("count", [1, 5])
+def test_get_favorites_query_count_is_constant(
+    api_client_with_token, sample_user, count
+):
+    for i in range(count):
+        klass = Class.objects.create(title=f"Class {i}", address="서울시")
+        ClassDate.objects.create(
+            class_id=klass,
+            start_date="2024-09-01",
+            start_time="10:00",
+            end_time="12:00",
+        )
+        add_favorite_class(user_id=sample_user.id, class_id=klass.id)
+    url = reverse("favorite")
+    api_client_with_token.get(url)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client_with_token.get(url, {"page": 1, "size": 10})
+
+    assert len(response.json()["results"]) == count
+    # user + count + favorites + classes + dates + images + category
+    assert len(ctx.captured_queries) == 7
@@ -11,11 +11,15 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from classes.serializers import ClassSerializer
+from classes.services import get_class_queryset
+from common.pagination import ListPaginator, PaginationError
 
 from .models import Favorite
 from .serializers import FavoriteSerializer
 from .services import add_favorite_class, delete_favorite_class
 
+favorite_paginator = ListPaginator(default_size=10)
+
 
 class FavoriteView(APIView):
     @extend_schema(
@@ -39,6 +43,13 @@ class FavoriteView(APIView):
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
             ),
+            OpenApiParameter(
+                name="before",
+                description="이전 응답의 next_before 값 (지정하면 page 대신 id 기준으로 이어서 조회)",
+                required=False,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
         ],
         responses={
             200: inline_serializer(
@@ -47,6 +58,9 @@ class FavoriteView(APIView):
                     "total_count": serializers.IntegerField(),
                     "total_pages": serializers.IntegerField(),
                     "current_page": serializers.IntegerField(),
+                    "next_before": serializers.IntegerField(
+                        allow_null=True, help_text="다음 페이지 before 값"
+                    ),
                     "results": ClassSerializer(many=True),
                 },
             ),
@@ -54,29 +68,25 @@ class FavoriteView(APIView):
         },
     )
     def get(self, request: Request, *args, **kwargs) -> Response:
-        page = int(request.GET.get("page", "1"))
-        size = int(request.GET.get("size", "10"))
-        offset = (page - 1) * size
         user = request.user
-        if page < 1:
-            return Response("page input error", status=status.HTTP_400_BAD_REQUEST)
-
-        total_count = Favorite.objects.filter(user_id=user.id).count()
-        total_pages = (total_count // size) + 1
+        try:
+            page = favorite_paginator.get_page(
+                Favorite.objects.filter(user_id=user.id), request.GET
+            )
+        except PaginationError as e:
+            return Response(str(e), status=status.HTTP_400_BAD_REQUEST)
 
-        favorites = Favorite.objects.filter(user_id=user.id).order_by("-id")[
-            offset : offset + size
-        ]
+        favorites = page.items
+        classes = get_class_queryset().in_bulk(
+            [favorite.class_id for favorite in favorites]
+        )
 
-        serializer = FavoriteSerializer(favorites, many=True)
+        serializer = FavoriteSerializer(
+            favorites, many=True, context={"classes": classes}
+        )
 
         return Response(
-            {
-                "total_count": total_count,
-                "total_pages": total_pages,
-                "current_page": page,
-                "results": serializer.data,
-            },
+            {**page.metadata(), "results": serializer.data},
             status=status.HTTP_200_OK,
         )
 
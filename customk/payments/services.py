@@ -2,6 +2,7 @@ import base64
 import logging
 import os
 from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Mapping
 
 import requests
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
@@ -9,10 +10,13 @@ from django.db import transaction
 from django.utils import timezone
 
 from classes.models import Class, ClassDate
+from common.pagination import ListPaginator, Page
 from payments.models import Payment, ReferralCode
 
 logger = logging.getLogger(__name__)
 
+payment_paginator = ListPaginator(default_size=10)
+
 
 def generate_access_token() -> str | None:
     logger.info("Generating access token")
@@ -43,23 +47,16 @@ def generate_access_token() -> str | None:
         return None
 
 
-def get_payment_datas(user_id: int, offset: int, size: int):
+def get_payment_datas(user_id: int, params: Mapping[str, Any]) -> Page:
     logger.info("get payment datas")
-    payments_query = Payment.objects.filter(user_id=user_id).order_by("-id")
-
-    class_ids = payments_query.values_list("class_id", flat=True).distinct()
-    class_date_ids = payments_query.values_list("class_date_id", flat=True).distinct()
-
-    classes = Class.objects.filter(id__in=class_ids)
-    class_dates = ClassDate.objects.filter(id__in=class_date_ids)
-
-    class_dict = {c.id: c for c in classes}
-    class_date_dict = {cd.id: cd for cd in class_dates}
-
-    total_count = payments_query.count()
-    total_pages = (total_count // size) + 1
+    page = payment_paginator.get_page(Payment.objects.filter(user_id=user_id), params)
+    payments = page.items
 
-    payments = payments_query[offset : offset + size]
+    # 현재 페이지의 결제에 필요한 클래스/일정만 조회합니다.
+    class_dict = Class.objects.in_bulk({payment.class_id for payment in payments})
+    class_date_dict = ClassDate.objects.in_bulk(
+        {payment.class_date_id for payment in payments}
+    )
 
     for payment in payments:
         setattr(payment, "related_class", class_dict.get(payment.class_id))
@@ -67,14 +64,14 @@ def get_payment_datas(user_id: int, offset: int, size: int):
             payment, "related_class_date", class_date_dict.get(payment.class_date_id)
         )
 
-    return total_count, total_pages, payments
+    return page
 
 
 def add_class_date_person(class_date_id, person) -> bool:
     try:
         class_date = ClassDate.objects.select_for_update().get(id=class_date_id)
         class_date.person += person
-        class_date.save()
+        class_date.save(update_fields=["person", "updated_at"])
         return True
     except ObjectDoesNotExist:
         return False
@@ -86,7 +83,7 @@ def minus_class_date_person(class_date_id, person) -> bool:
         class_date = ClassDate.objects.select_for_update().get(id=class_date_id)
         if class_date.person > 0:
             class_date.person -= person
-            class_date.save()
+            class_date.save(update_fields=["person", "updated_at"])
         return True
     except ObjectDoesNotExist:
         return False
@@ -1,6 +1,7 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from classes.services import record_class_payment
 from notifications.models import PaymentNotification
 
 from .models import Payment
@@ -13,3 +14,9 @@ def create_payment_notification(sender, instance, created, **kwargs):
             message=f"새로운 결제가 생성되었습니다: 주문 ID {instance.order_id}, 금액 {instance.amount} {instance.currency}",
             payment=instance,
         )
+
+
+@receiver(post_save, sender=Payment)
+def record_class_popularity(sender, instance, created, **kwargs):
+    if created:
+        record_class_payment(instance.class_id, instance.created_at)
@@ -10,6 +10,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.pagination import PaginationError
 from payments.serializers import BasePaymentSerializer, PaymentPostAPISerializer
 from payments.services import get_payment_datas
 
@@ -36,6 +37,13 @@ class PaymentView(APIView):
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
             ),
+            OpenApiParameter(
+                name="before",
+                description="이전 응답의 next_before 값 (지정하면 page 대신 id 기준으로 이어서 조회)",
+                required=False,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
         ],
         responses={
             200: inline_serializer(
@@ -44,6 +52,9 @@ class PaymentView(APIView):
                     "total_count": serializers.IntegerField(),
                     "total_pages": serializers.IntegerField(),
                     "current_page": serializers.IntegerField(),
+                    "next_before": serializers.IntegerField(
+                        allow_null=True, help_text="다음 페이지 before 값"
+                    ),
                     "results": BasePaymentSerializer(many=True),
                 },
             ),
@@ -51,26 +62,17 @@ class PaymentView(APIView):
         },
     )
     def get(self, request: Request, *args, **kwargs) -> Response:
-        page = int(request.GET.get("page", "1"))
-        size = int(request.GET.get("size", "10"))
-        offset = (page - 1) * size
-
         user = request.user
 
-        if page < 1:
-            return Response("page input error", status=status.HTTP_400_BAD_REQUEST)
-
-        total_count, total_pages, payments = get_payment_datas(user.id, offset, size)
+        try:
+            page = get_payment_datas(user.id, request.GET)
+        except PaginationError as e:
+            return Response(str(e), status=status.HTTP_400_BAD_REQUEST)
 
-        serializer = BasePaymentSerializer(payments, many=True)
+        serializer = BasePaymentSerializer(page.items, many=True)
 
         return Response(
-            {
-                "total_count": total_count,
-                "total_pages": total_pages,
-                "current_page": page,
-                "results": serializer.data,
-            },
+            {**page.metadata(), "results": serializer.data},
             status=status.HTTP_200_OK,
         )
 
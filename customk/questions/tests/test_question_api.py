@@ -67,3 +67,64 @@ def test_question_delete(api_client, sample_user, sample_class, question):
     assert response.status_code == status.HTTP_200_OK
     assert response.data["status"] == "success"
     assert response.data["message"] == "Question or Answer deleted successfully"
+
+
+@pytest.mark.django_db
+def test_question_list_pagination_modes(api_client, sample_user, sample_class):
+    from questions.models import Question
+
+    ids = [
+        Question.objects.create(
+            user_id=sample_user,
+            class_id=sample_class,
+            question=f"question {i}",
+            question_title=f"title {i}",
+        ).id
+        for i in range(6)
+    ]
+    api_client.force_authenticate(user=sample_user)
+    url = reverse("all-questions")
+
+    response = api_client.get(url, {"page": 2, "size": 3})
+    assert response.data["total_count"] == 6
+    # 정확히 나누어떨어지면 빈 페이지를 더하지 않습니다.
+    assert response.data["total_pages"] == 2
+    assert response.data["current_page"] == 2
+    assert response.data["next_before"] is None
+
+    response = api_client.get(url, {"size": 4})
+    assert [q["id"] for q in response.data["questions"]] == ids[:1:-1]
+    next_before = response.data["next_before"]
+    assert next_before == ids[2]
+
+    response = api_client.get(url, {"size": 4, "before": next_before})
+    assert [q["id"] for q in response.data["questions"]] == ids[1::-1]
+    assert "current_page" not in response.data
+    assert response.data["next_before"] is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params, expected_status",
+    [
+        ({"size": 1000000}, status.HTTP_200_OK),
+        ({"size": 0}, status.HTTP_400_BAD_REQUEST),
+        ({"page": "x"}, status.HTTP_400_BAD_REQUEST),
+        ({"before": "x"}, status.HTTP_400_BAD_REQUEST),
+    ],
+)
+def test_question_list_validates_pagination(
+    api_client, sample_user, question, params, expected_status
+):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    api_client.force_authenticate(user=sample_user)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(reverse("all-questions"), params)
+
+    assert response.status_code == expected_status
+    if expected_status == status.HTTP_200_OK:
+        # size 는 최대값(100)으로 제한되고 다음 페이지 확인용으로 1개를 더 읽습니다.
+        assert "LIMIT 101" in ctx.captured_queries[-1]["sql"]
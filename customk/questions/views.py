@@ -13,9 +13,12 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from classes.models import Class
+from common.pagination import ListPaginator, PaginationError
 from questions.models import Question
 from questions.serializers import QuestionSerializer
 
+question_paginator = ListPaginator(default_size=15)
+
 
 class AllQuestionsListView(APIView):
     @extend_schema(
@@ -39,6 +42,13 @@ class AllQuestionsListView(APIView):
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
             ),
+            OpenApiParameter(
+                name="before",
+                description="이전 응답의 next_before 값 (지정하면 page 대신 id 기준으로 이어서 조회)",
+                required=False,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
         ],
         responses={
             200: OpenApiResponse(
@@ -49,6 +59,9 @@ class AllQuestionsListView(APIView):
                         "total_count": serializers.IntegerField(),
                         "total_pages": serializers.IntegerField(),
                         "current_page": serializers.IntegerField(),
+                        "next_before": serializers.IntegerField(
+                            allow_null=True, help_text="다음 페이지 before 값"
+                        ),
                         "questions": serializers.ListSerializer(
                             child=QuestionSerializer()
                         ),
@@ -58,30 +71,15 @@ class AllQuestionsListView(APIView):
         },
     )
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        page = int(request.query_params.get("page", 1))
-        size = int(request.query_params.get("size", 15))
-        offset = (page - 1) * size
-
-        if page < 1:
-            return Response(
-                {"message": "Page input error"}, status=status.HTTP_400_BAD_REQUEST
-            )
-
         user_id = request.user.id
         questions = Question.objects.filter(user_id=user_id)
+        try:
+            page = question_paginator.get_page(questions, request.query_params)
+        except PaginationError as e:
+            return Response({"message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        total_count = questions.count()
-        total_pages = (total_count // size) + (1 if total_count % size > 0 else 0)
-
-        questions = questions.order_by("-id")[offset : offset + size]
-
-        serializer = QuestionSerializer(questions, many=True)
-        response_data = {
-            "total_count": total_count,
-            "total_pages": total_pages,
-            "current_page": page,
-            "questions": serializer.data,
-        }
+        serializer = QuestionSerializer(page.items, many=True)
+        response_data = {**page.metadata(), "questions": serializer.data}
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -115,6 +113,13 @@ class QuestionListView(APIView):
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
             ),
+            OpenApiParameter(
+                name="before",
+                description="이전 응답의 next_before 값 (지정하면 page 대신 id 기준으로 이어서 조회)",
+                required=False,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
         ],
         responses={
             200: OpenApiResponse(
@@ -125,6 +130,9 @@ class QuestionListView(APIView):
                         "total_count": serializers.IntegerField(),
                         "total_pages": serializers.IntegerField(),
                         "current_page": serializers.IntegerField(),
+                        "next_before": serializers.IntegerField(
+                            allow_null=True, help_text="다음 페이지 before 값"
+                        ),
                         "questions": serializers.ListSerializer(
                             child=QuestionSerializer()
                         ),
@@ -137,34 +145,14 @@ class QuestionListView(APIView):
     def get(
         self, request: Request, class_id: int, *args: Any, **kwargs: Any
     ) -> Response:
-        page = int(request.query_params.get("page", 1))
-        size = int(request.query_params.get("size", 15))
-        offset = (page - 1) * size
-
-        if page < 1:
-            return Response("Page input error", status=status.HTTP_400_BAD_REQUEST)
-
+        questions = Question.objects.filter(class_id=class_id, user_id=request.user.id)
         try:
-            questions = Question.objects.filter(
-                class_id=class_id, user_id=request.user.id
-            )
-        except Question.DoesNotExist:
-            return Response(
-                {"message": "Class not found."}, status=status.HTTP_404_NOT_FOUND
-            )
+            page = question_paginator.get_page(questions, request.query_params)
+        except PaginationError as e:
+            return Response(str(e), status=status.HTTP_400_BAD_REQUEST)
 
-        total_count = questions.count()
-        total_pages = (total_count // size) + (1 if total_count % size > 0 else 0)
-
-        questions = questions.order_by("-id")[offset : offset + size]
-
-        serializer = QuestionSerializer(questions, many=True)
-        response_data = {
-            "total_count": total_count,
-            "total_pages": total_pages,
-            "current_page": page,
-            "questions": serializer.data,
-        }
+        serializer = QuestionSerializer(page.items, many=True)
+        response_data = {**page.metadata(), "questions": serializer.data}
 
         return Response(response_data, status=status.HTTP_200_OK)
 
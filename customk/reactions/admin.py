@@ -1,16 +1,35 @@
-from typing import Dict
-
 from django.contrib import admin
 
 from .models import Reaction
+from .services import apply_reaction_change, delete_reactions
 
 
 @admin.register(Reaction)
 class ReactionModel(admin.ModelAdmin):  # type: ignore
     list_display = ("id", "review", "reaction", "get_review_reactions")
+    list_select_related = ("review",)
 
     def get_review_reactions(self, obj: Reaction) -> str:
-        reactions: Dict[str, int] = Reaction.get_review_reactions(obj.review)
-        return f"Likes: {reactions['likes_count']}, Dislikes: {reactions['dislikes_count']}"
+        review = obj.review
+        return f"Likes: {review.likes_count}, Dislikes: {review.dislikes_count}"
 
     get_review_reactions.short_description = "Review Reactions"  # type: ignore
+
+    def save_model(self, request, obj, form, change):
+        previous = (
+            Reaction.objects.filter(pk=obj.pk)
+            .values_list("review_id", "reaction")
+            .first()
+            if change
+            else None
+        )
+        super().save_model(request, obj, form, change)
+        if previous is not None:
+            apply_reaction_change(previous[0], previous[1], Reaction.NO_REACTION)
+        apply_reaction_change(obj.review_id, Reaction.NO_REACTION, obj.reaction)
+
+    def delete_model(self, request, obj):
+        delete_reactions(Reaction.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        delete_reactions(queryset)
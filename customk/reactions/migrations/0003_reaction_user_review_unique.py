@@ -0,0 +1,60 @@
+# Generated by Django 5.1 on 2026-10-18 07:47
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Subquery, Value, Window
+from django.db.models.functions import Coalesce, RowNumber
+
+LIKE = 1
+DISLIKE = -1
+
+
+def remove_duplicate_reactions(apps, schema_editor):
+    Reaction = apps.get_model("reactions", "Reaction")
+    Review = apps.get_model("reviews", "Review")
+
+    # 사용자별로 가장 최근에 수정된 반응 하나만 남깁니다.
+    duplicate_ids = list(
+        Reaction.objects.annotate(
+            row_number=Window(
+                RowNumber(),
+                partition_by=[F("user_id"), F("review_id")],
+                order_by=[F("updated_at").desc(), F("id").desc()],
+            )
+        )
+        .filter(row_number__gt=1)
+        .values_list("id", flat=True)
+    )
+    if not duplicate_ids:
+        return
+    Reaction.objects.filter(id__in=duplicate_ids).delete()
+
+    def count(reaction):
+        subquery = (
+            Reaction.objects.filter(review=OuterRef("pk"), reaction=reaction)
+            .order_by()
+            .values("review")
+            .annotate(value=Count("id"))
+            .values("value")
+        )
+        return Coalesce(Subquery(subquery), Value(0))
+
+    Review.objects.update(likes_count=count(LIKE), dislikes_count=count(DISLIKE))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reactions", "0002_alter_reaction_created_at"),
+        ("reviews", "0008_review_reaction_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_reactions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="reaction",
+            constraint=models.UniqueConstraint(
+                fields=("user", "review"), name="reaction_user_review_unique"
+            ),
+        ),
+    ]
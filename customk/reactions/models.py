@@ -1,10 +1,6 @@
-from typing import Dict
-
 from django.db import models
-from django.db.models import Count, Q
 
 from common.models import CommonModel
-from reviews.models import Review
 
 
 class Reaction(CommonModel):
@@ -23,10 +19,9 @@ class Reaction(CommonModel):
 
     reaction = models.IntegerField(choices=REACTON_CHOICES, default=NO_REACTION)
 
-    @staticmethod
-    def get_review_reactions(review: Review) -> Dict[str, int]:
-        reactions = Reaction.objects.filter(review=review).aggregate(
-            likes_count=Count("pk", filter=Q(reaction=Reaction.LIKE)),
-            dislikes_count=Count("pk", filter=Q(reaction=Reaction.DISLIKE)),
-        )
-        return reactions
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "review"], name="reaction_user_review_unique"
+            )
+        ]
@@ -0,0 +1,149 @@
+from typing import Dict, Optional
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from reviews.models import Review
+from users.models import User
+
+from .models import Reaction
+
+REACTION_COUNTER_FIELDS = {
+    Reaction.LIKE: "likes_count",
+    Reaction.DISLIKE: "dislikes_count",
+}
+
+
+def apply_reaction_change(
+    review_id: int, old: int, new: int
+) -> Optional[Dict[str, int]]:
+    """
+    old -> new 로 바뀐 반응만큼 Review 의 좋아요/싫어요 카운터를 증감하고,
+    UPDATE ... RETURNING 으로 갱신된 카운터를 반환합니다. 리뷰가 없으면 None.
+    """
+    deltas = {
+        field: (new == value) - (old == value)
+        for value, field in REACTION_COUNTER_FIELDS.items()
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {Review._meta.db_table} SET "
+            "likes_count = likes_count + %(likes_count)s, "
+            "dislikes_count = dislikes_count + %(dislikes_count)s "
+            "WHERE id = %(review_id)s RETURNING likes_count, dislikes_count",
+            {**deltas, "review_id": review_id},
+        )
+        row = cursor.fetchone()
+    return {"likes_count": row[0], "dislikes_count": row[1]} if row else None
+
+
+def delete_reactions(reactions: QuerySet[Reaction]) -> int:
+    """
+    반응을 삭제하고, 삭제된 행을 리뷰별로 묶어 카운터를 한 번의 UPDATE 로 뺍니다.
+    DELETE ... RETURNING 결과를 그대로 쓰므로 동시에 바뀐 반응도 정확히 반영됩니다.
+    """
+    ids_sql, params = reactions.order_by().values("id").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH deleted AS (DELETE FROM {Reaction._meta.db_table} "
+            f"WHERE id IN ({ids_sql}) RETURNING review_id, reaction), "
+            "counts AS (SELECT review_id, "
+            "COUNT(*) FILTER (WHERE reaction = %s) AS likes, "
+            "COUNT(*) FILTER (WHERE reaction = %s) AS dislikes "
+            "FROM deleted GROUP BY review_id), "
+            f"updated AS (UPDATE {Review._meta.db_table} AS r "
+            "SET likes_count = r.likes_count - counts.likes, "
+            "dislikes_count = r.dislikes_count - counts.dislikes "
+            "FROM counts WHERE r.id = counts.review_id) "
+            "SELECT COUNT(*) FROM deleted",
+            [*params, Reaction.LIKE, Reaction.DISLIKE],
+        )
+        return cursor.fetchone()[0]
+
+
+class _ReactionInsertRace(Exception):
+    pass
+
+
+def _upsert_reaction(user_id: int, review_id: int, reaction_type: int) -> int:
+    """
+    기존 반응이 있으면 잠가서 바꾸고 없으면 새로 만드는 한 문장을 실행하고 이전 값을
+    반환합니다. 새로 만들었으면 NO_REACTION 입니다.
+    """
+    table = Reaction._meta.db_table
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH changed AS (UPDATE {table} AS r "
+            "SET reaction = %(reaction)s, updated_at = %(now)s "
+            f"FROM (SELECT id, reaction FROM {table} "
+            "WHERE user_id = %(user_id)s AND review_id = %(review_id)s "
+            "FOR UPDATE) AS old "
+            "WHERE r.id = old.id RETURNING old.reaction), "
+            f"inserted AS (INSERT INTO {table} "
+            "(user_id, review_id, reaction, created_at, updated_at) "
+            "SELECT %(user_id)s, %(review_id)s, %(reaction)s, %(now)s, %(now)s "
+            "WHERE NOT EXISTS (SELECT 1 FROM changed) "
+            "ON CONFLICT (user_id, review_id) DO NOTHING "
+            f"RETURNING {Reaction.NO_REACTION} AS reaction) "
+            "SELECT reaction FROM changed UNION ALL SELECT reaction FROM inserted",
+            {
+                "user_id": user_id,
+                "review_id": review_id,
+                "reaction": reaction_type,
+                "now": now,
+            },
+        )
+        row = cursor.fetchone()
+    if row is None:
+        # 문장 스냅샷 이후 다른 트랜잭션이 만든 반응과 충돌해 아무것도 바꾸지 않았습니다.
+        raise _ReactionInsertRace
+    return row[0]
+
+
+def _update_reaction(user_id: int, review_id: int, reaction_type: int) -> Optional[int]:
+    """
+    기존 반응을 잠그고 새 값으로 바꾼 뒤 이전 값을 반환합니다. 반응이 없으면 None.
+    """
+    table = Reaction._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} AS r SET reaction = %s, updated_at = %s "
+            f"FROM (SELECT id, reaction FROM {table} "
+            "WHERE user_id = %s AND review_id = %s FOR UPDATE) AS old "
+            "WHERE r.id = old.id RETURNING old.reaction",
+            [reaction_type, timezone.now(), user_id, review_id],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+@transaction.atomic
+def set_review_reaction(
+    user: User, review_id: int, reaction_type: int, create: bool = True
+) -> Optional[Dict[str, int]]:
+    """
+    사용자의 리뷰 반응을 저장하고 카운터를 같은 트랜잭션에서 갱신해 반환합니다.
+    create=False 이고 기존 반응이 없으면 None 을 반환합니다.
+
+    ON CONFLICT DO UPDATE 는 덮어쓴 이전 값을 돌려주지 않으므로, 한 문장의 CTE 에서
+    기존 행을 잠가 바꾸며 이전 값을 받고 없을 때만 INSERT 합니다. 스냅샷 이후 다른
+    트랜잭션이 먼저 만든 행과 충돌하면 다시 실행하며, 그 행은 이미 커밋되었으므로
+    다음 시도에서는 보입니다. 카운터 UPDATE 는 반응 행을 잠근 뒤의 스냅샷에서
+    실행되어야 하므로 별도 문장으로 둡니다.
+    """
+    if create:
+        while True:
+            try:
+                with transaction.atomic():
+                    old = _upsert_reaction(user.id, review_id, reaction_type)
+                break
+            except _ReactionInsertRace:
+                continue
+    else:
+        old = _update_reaction(user.id, review_id, reaction_type)
+        if old is None:
+            return None
+
+    return apply_reaction_change(review_id, old, reaction_type)
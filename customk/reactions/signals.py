@@ -0,0 +1,16 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from users.models import User
+
+from .models import Reaction
+from .services import delete_reactions
+
+
+@receiver(pre_delete, sender=User)
+def delete_user_reactions(sender, instance, **kwargs):
+    # 탈퇴 시 반응이 연쇄 삭제되기 전에 리뷰별로 묶어 카운터를 맞춥니다. 작성자와 함께
+    # 지워지는 리뷰의 반응은 카운터를 맞출 필요가 없으므로 연쇄 삭제에 맡깁니다.
+    delete_reactions(
+        Reaction.objects.filter(user=instance).exclude(review__user=instance)
+    )
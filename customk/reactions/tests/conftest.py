@@ -0,0 +1,12 @@
+import pytest
+
+from reviews.models import Review
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def sample_review(sample_user, sample_class):
+    return Review.objects.create(
+        user=sample_user, class_id=sample_class, review="good", rating="4.5"
+    )
@@ -0,0 +1,198 @@
+# ruff: noqa: F811
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Q
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from classes.tests.conftest import sample_class
+from reactions.models import Reaction
+from reactions.services import delete_reactions, set_review_reaction
+from reviews.models import Review
+from users.models import User
+from users.tests.conftest import (
+    access_token,
+    api_client_with_token,
+    refresh_token,
+    sample_user,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def _react(client, review, reaction, method="post"):
+    url = reverse("react-to-review", kwargs={"class_id": review.class_id_id})
+    url += f"?review_id={review.id}"
+    return getattr(client, method)(url, {"reaction": reaction}, format="json")
+
+
+def _count_reactions(review):
+    # Review 의 카운터 컬럼과 비교하기 위해 반응 행을 직접 집계합니다.
+    return Reaction.objects.filter(review=review).aggregate(
+        likes_count=Count("pk", filter=Q(reaction=Reaction.LIKE)),
+        dislikes_count=Count("pk", filter=Q(reaction=Reaction.DISLIKE)),
+    )
+
+
+def test_react_updates_counters(api_client_with_token, sample_review):
+    response = _react(api_client_with_token, sample_review, Reaction.LIKE)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"likes_count": 1, "dislikes_count": 0}
+
+    response = _react(api_client_with_token, sample_review, Reaction.DISLIKE, "patch")
+    assert response.json()["data"] == {"likes_count": 0, "dislikes_count": 1}
+
+    response = _react(
+        api_client_with_token, sample_review, Reaction.NO_REACTION, "patch"
+    )
+    assert response.json()["data"] == {"likes_count": 0, "dislikes_count": 0}
+    assert Reaction.objects.filter(review=sample_review).count() == 1
+
+
+def test_react_does_not_aggregate(api_client_with_token, sample_review):
+    _react(api_client_with_token, sample_review, Reaction.LIKE)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = _react(api_client_with_token, sample_review, Reaction.DISLIKE)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not any("COUNT(" in q["sql"] for q in ctx.captured_queries)
+
+
+def test_patch_without_reaction(api_client_with_token, sample_review):
+    response = _react(api_client_with_token, sample_review, Reaction.LIKE, "patch")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    sample_review.refresh_from_db()
+    assert sample_review.likes_count == 0
+
+
+def test_counters_match_aggregate_after_cascade(sample_review):
+    users = [
+        User.objects.create_user(email=f"user{i}@example.com", password="pw")
+        for i in range(4)
+    ]
+    for user in users[:3]:
+        set_review_reaction(user, sample_review.id, Reaction.LIKE)
+    set_review_reaction(users[3], sample_review.id, Reaction.DISLIKE)
+    users[0].delete()
+    users[3].delete()
+
+    review = Review.objects.get(id=sample_review.id)
+    assert _count_reactions(review) == {
+        "likes_count": review.likes_count,
+        "dislikes_count": review.dislikes_count,
+    }
+    assert (review.likes_count, review.dislikes_count) == (2, 0)
+
+
+def test_user_delete_adjusts_counters_in_one_statement(sample_review):
+    user = User.objects.create_user(email="leaver@example.com", password="pw")
+    fan = User.objects.create_user(email="fan@example.com", password="pw")
+    own_review = Review.objects.create(
+        user=user, class_id=sample_review.class_id, review="mine", rating="4.0"
+    )
+    set_review_reaction(user, sample_review.id, Reaction.LIKE)
+    set_review_reaction(user, own_review.id, Reaction.DISLIKE)
+    set_review_reaction(fan, own_review.id, Reaction.LIKE)
+
+    with CaptureQueriesContext(connection) as ctx:
+        user.delete()
+
+    sample_review.refresh_from_db()
+    assert (sample_review.likes_count, sample_review.dislikes_count) == (0, 0)
+    assert not Review.objects.filter(id=own_review.id).exists()
+    reaction_deletes = [
+        q["sql"]
+        for q in ctx.captured_queries
+        if q["sql"].startswith(("DELETE", "WITH")) and "reactions_reaction" in q["sql"]
+    ]
+    # 남는 리뷰의 카운터를 맞추는 문장과, 작성 리뷰/사용자 기준 fast-delete 만 실행됩니다.
+    assert len(reaction_deletes) == 3
+    assert all(
+        "review_id, reaction" in sql or " IN (" in sql for sql in reaction_deletes
+    )
+
+
+def test_delete_reactions_adjusts_counters(sample_review):
+    users = [
+        User.objects.create_user(email=f"user{i}@example.com", password="pw")
+        for i in range(3)
+    ]
+    set_review_reaction(users[0], sample_review.id, Reaction.LIKE)
+    set_review_reaction(users[1], sample_review.id, Reaction.LIKE)
+    set_review_reaction(users[2], sample_review.id, Reaction.DISLIKE)
+
+    assert delete_reactions(Reaction.objects.exclude(user=users[0])) == 2
+
+    sample_review.refresh_from_db()
+    assert (sample_review.likes_count, sample_review.dislikes_count) == (1, 0)
+    assert Reaction.objects.get().user == users[0]
+
+
+def test_reaction_is_unique_per_user(sample_user, sample_review):
+    Reaction.objects.create(user=sample_user, review=sample_review)
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Reaction.objects.create(user=sample_user, review=sample_review)
+
+
+def test_repeated_post_upserts_single_reaction(api_client_with_token, sample_review):
+    _react(api_client_with_token, sample_review, Reaction.LIKE)
+    with CaptureQueriesContext(connection) as ctx:
+        response = _react(api_client_with_token, sample_review, Reaction.LIKE)
+
+    assert response.json()["data"] == {"likes_count": 1, "dislikes_count": 0}
+    assert Reaction.objects.filter(review=sample_review).count() == 1
+    assert sum("ON CONFLICT" in q["sql"] for q in ctx.captured_queries) == 1
+
+
+def test_set_reaction_upserts_and_returns_counters_in_two_statements(
+    sample_user, sample_review
+):
+    set_review_reaction(sample_user, sample_review.id, Reaction.LIKE)
+
+    with CaptureQueriesContext(connection) as ctx:
+        counters = set_review_reaction(sample_user, sample_review.id, Reaction.DISLIKE)
+
+    assert counters == {"likes_count": 0, "dislikes_count": 1}
+    statements = [q["sql"] for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]]
+    # 이전 값을 받는 upsert 한 번과 RETURNING 으로 카운터를 받는 UPDATE 한 번
+    assert len(statements) == 2
+    assert "ON CONFLICT" in statements[0]
+    assert statements[1].startswith("UPDATE") and "RETURNING" in statements[1]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_reactions_keep_counters_exact(sample_class):
+    review = Review.objects.create(
+        user=User.objects.create_user(email="author@example.com", password="pw"),
+        class_id=sample_class,
+        review="good",
+        rating="4.5",
+    )
+    users = [
+        User.objects.create_user(email=f"user{i}@example.com", password="pw")
+        for i in range(4)
+    ]
+
+    def react(i: int) -> None:
+        try:
+            reaction = Reaction.LIKE if i % 3 else Reaction.DISLIKE
+            set_review_reaction(users[i % len(users)], review.id, reaction)
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(react, range(24)))
+
+    review.refresh_from_db()
+    assert Reaction.objects.filter(review=review).count() == len(users)
+    assert _count_reactions(review) == {
+        "likes_count": review.likes_count,
+        "dislikes_count": review.dislikes_count,
+    }
@@ -9,7 +9,10 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Reaction, Review
+from reviews.models import Review
+
+from .models import Reaction
+from .services import set_review_reaction
 
 
 class ReactToReviewView(APIView):
@@ -53,7 +56,7 @@ class ReactToReviewView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        review = get_object_or_404(Review, pk=review_id)
+        review = get_object_or_404(Review.objects.only("id"), pk=review_id)
         user = request.user
 
         if not user.is_authenticated:
@@ -73,11 +76,7 @@ class ReactToReviewView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        reaction, created = Reaction.objects.get_or_create(user=user, review=review)
-        reaction.reaction = reaction_type
-        reaction.save()
-
-        reactions = Reaction.get_review_reactions(review)
+        reactions = set_review_reaction(user, review.id, reaction_type)
         response_data = {
             "status": "success",
             "message": "리뷰 반응이 성공적으로 추가되었습니다.",
@@ -122,7 +121,7 @@ class ReactToReviewView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        review = get_object_or_404(Review, pk=review_id)
+        review = get_object_or_404(Review.objects.only("id"), pk=review_id)
         user = request.user
 
         if not user.is_authenticated:
@@ -142,20 +141,16 @@ class ReactToReviewView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            reaction = Reaction.objects.get(user=user, review=review)
-            reaction.reaction = reaction_type
-            reaction.save()
-
-            reactions = Reaction.get_review_reactions(review)
-            response_data = {
-                "status": "success",
-                "message": "리뷰 반응이 성공적으로 수정/삭제되었습니다.",
-                "data": reactions,
-            }
-            return Response(response_data, status=status.HTTP_200_OK)
-        except Reaction.DoesNotExist:
+        reactions = set_review_reaction(user, review.id, reaction_type, create=False)
+        if reactions is None:
             return Response(
                 {"status": "error", "message": "리뷰에 대한 반응이 존재하지 않습니다."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+        response_data = {
+            "status": "success",
+            "message": "리뷰 반응이 성공적으로 수정/삭제되었습니다.",
+            "data": reactions,
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
@@ -1,8 +1,6 @@
 from django.contrib import admin
 from django.core.exceptions import ValidationError
 
-from reactions.models import Reaction
-
 from .models import Review, ReviewImage
 
 
@@ -18,6 +16,7 @@ class ReviewAdmin(admin.ModelAdmin):  # type: ignore
     list_display = ("user", "class_id", "rating", "created_at", "likes_count")
     list_filter = ("rating", "created_at", "class_id")
     search_fields = ("user__name", "class_id__title", "review")
+    list_select_related = ("user", "class_id")
     inlines = [ReviewImageInline]
     fieldsets = (
         ("기본 정보", {"fields": ("user", "class_id", "rating")}),
@@ -28,10 +27,10 @@ class ReviewAdmin(admin.ModelAdmin):  # type: ignore
     )
 
     def likes_count(self, obj: Review) -> int:
-        reactions = Reaction.get_review_reactions(obj)
-        return reactions["likes_count"]
+        return obj.likes_count
 
     likes_count.short_description = "좋아요 수"  # type: ignore
+    likes_count.admin_order_field = "likes_count"  # type: ignore
 
 
 @admin.register(ReviewImage)
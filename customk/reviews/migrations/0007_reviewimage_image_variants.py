@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-18 07:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reviews", "0006_alter_reviewimage_image_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reviewimage",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.1 on 2026-10-18 07:45
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+LIKE = 1
+DISLIKE = -1
+
+
+def backfill_reaction_counters(apps, schema_editor):
+    Review = apps.get_model("reviews", "Review")
+    Reaction = apps.get_model("reactions", "Reaction")
+
+    def count(reaction):
+        subquery = (
+            Reaction.objects.filter(review=OuterRef("pk"), reaction=reaction)
+            .order_by()
+            .values("review")
+            .annotate(value=Count("id"))
+            .values("value")
+        )
+        return Coalesce(Subquery(subquery), Value(0))
+
+    Review.objects.update(likes_count=count(LIKE), dislikes_count=count(DISLIKE))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reviews", "0007_reviewimage_image_variants"),
+        ("reactions", "0002_alter_reaction_created_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="review",
+            name="dislikes_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="review",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_reaction_counters, migrations.RunPython.noop),
+    ]
@@ -23,6 +23,9 @@ class Review(CommonModel):
             MaxValueValidator(Decimal("5.0")),
         ],
     )
+    # reactions.services 가 반응이 바뀔 때마다 F() 로 증감합니다.
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
+    dislikes_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self) -> str:
         return f"Review: {self.review}, Rating: {self.rating}"
@@ -31,6 +34,7 @@ class Review(CommonModel):
 class ReviewImage(models.Model):
     review = models.ForeignKey(Review, related_name="images", on_delete=models.CASCADE)
     image_url = models.CharField()
+    image_variants = models.JSONField(blank=True, default=dict, editable=False)
 
     def __str__(self) -> str:
         return f"Image for Review {self.review.id}: {self.image_url}"
@@ -1,22 +1,36 @@
 import base64
-import uuid
+from typing import Union
 
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
 from rest_framework import serializers
 
 from classes.models import Class
-from common.services.ncp_api_conf import ObjectStorage
+from common.serializers import ImageUploadField
+from common.services.images import release_image_variants
+from common.services.uploads import (
+    release_object,
+    store_object,
+    upload_file_to_object_storage,
+)
 from config.logger import logger
 from users.serializers.user_serializer import UserSerializer
 
 from .models import Review, ReviewImage
 
 
-def upload_image_to_object_storage(base64_image: str) -> str:
-    obj_client = ObjectStorage()
+def upload_image_to_object_storage(image: Union[str, UploadedFile]) -> str:
+    if isinstance(image, UploadedFile):
+        try:
+            return upload_file_to_object_storage(image, "reply-images")
+        except Exception as e:
+            logger.error(f"Unexpected error during ObjectStorage upload: {str(e)}")
+            raise serializers.ValidationError(
+                {"reply_image": "An unexpected error occurred"}
+            )
 
     try:
-        formatted, img_str = base64_image.split(";base64,")
+        formatted, img_str = image.split(";base64,")
         ext = formatted.split("/")[-1]
         decoded_image = base64.b64decode(img_str)
     except (ValueError, IndexError) as e:
@@ -25,19 +39,8 @@ def upload_image_to_object_storage(base64_image: str) -> str:
             {"reply_image_base64": "Invalid base64 image format"}
         )
 
-    file_name = f"{uuid.uuid4()}.{ext}"
-
-    bucket_name = "customk-imagebucket"
-    object_name = f"reply-images/{file_name}"
     try:
-        status_code, image_url = obj_client.put_object(
-            bucket_name, object_name, decoded_image
-        )
-        if status_code != 200:
-            error_message = f"Failed to upload image. Status code: {status_code}"
-            logger.error(error_message)
-            raise serializers.ValidationError({"reply_image": error_message})
-        return image_url
+        return store_object(decoded_image, ext, "reply-images")
     except Exception as e:
         logger.error(f"Unexpected error during ObjectStorage upload: {str(e)}")
         raise serializers.ValidationError(
@@ -48,7 +51,7 @@ def upload_image_to_object_storage(base64_image: str) -> str:
 class ReviewImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = ReviewImage
-        fields = ["id", "image_url"]
+        fields = ["id", "image_url", "image_variants"]
 
     def get_image_url(self, obj):
         return obj.image_url
@@ -64,6 +67,9 @@ class ReviewImageSerializer(serializers.ModelSerializer):
 
 class ReviewSerializer(serializers.ModelSerializer):
     images = ReviewImageSerializer(many=True, required=False)
+    image_files = serializers.ListField(
+        child=ImageUploadField(), write_only=True, required=False
+    )
     user = UserSerializer(read_only=True)
     class_id = serializers.PrimaryKeyRelatedField(read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
@@ -74,6 +80,7 @@ class ReviewSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         images_data64 = validated_data.pop("images", [])
+        image_files = validated_data.pop("image_files", [])
         class_id = validated_data.pop("class_id")
 
         try:
@@ -83,22 +90,23 @@ class ReviewSerializer(serializers.ModelSerializer):
 
         review = Review.objects.create(class_id=class_instance, **validated_data)
 
-        for image_data64 in images_data64:
-            image_url = upload_image_to_object_storage(image_data64["image_url"])
+        images = [image_data64["image_url"] for image_data64 in images_data64]
+        for image in images + image_files:
+            image_url = upload_image_to_object_storage(image)
             ReviewImage.objects.create(review=review, image_url=image_url)
 
         return review
 
     def update(self, instance, validated_data):
         images_data64 = validated_data.pop("images", [])
+        image_files = validated_data.pop("image_files", [])
 
         instance.review = validated_data.get("review", instance.review)
         instance.rating = validated_data.get("rating", instance.rating)
         instance.save()
 
         for image_instance in instance.images.all():
-            obj = ObjectStorage()
-            obj_status_code = obj.delete_object(image_instance.image_url)
+            obj_status_code = release_object(image_instance.image_url)
 
             if obj_status_code != 204:
                 raise ValidationError(
@@ -106,10 +114,12 @@ class ReviewSerializer(serializers.ModelSerializer):
                         "review_image": f"Failed to delete existing image. Status code: {obj_status_code}"
                     }
                 )
+            release_image_variants(image_instance.image_variants)
             image_instance.delete()
 
-        for image_data64 in images_data64:
-            image_url = upload_image_to_object_storage(image_data64["image_url"])
+        images = [image_data64["image_url"] for image_data64 in images_data64]
+        for image in images + image_files:
+            image_url = upload_image_to_object_storage(image)
             ReviewImage.objects.create(review=instance, image_url=image_url)
 
         return instance
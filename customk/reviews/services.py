@@ -0,0 +1,36 @@
+from django.db.models import QuerySet
+
+from common.services.images import (
+    create_image_variants,
+    needs_image_variants,
+    release_image_variants,
+)
+
+from .models import Review, ReviewImage
+
+
+def get_review_queryset() -> QuerySet[Review]:
+    """
+    목록 직렬화용 쿼리셋. 작성자는 JOIN 으로, 이미지는 페이지 단위 쿼리 한 번으로 읽습니다.
+    좋아요/싫어요 수는 Review 컬럼에 저장되어 있으므로 따로 집계하지 않습니다.
+    """
+    return Review.objects.select_related("user").prefetch_related("images")
+
+
+def generate_review_image_variants(review_image_id: int) -> None:
+    """
+    리뷰 이미지 원본의 WebP 파생 이미지를 만들어 image_variants 에 기록합니다.
+    """
+    review_image = ReviewImage.objects.filter(id=review_image_id).first()
+    if review_image is None or not needs_image_variants(
+        review_image.image_url, review_image.image_variants
+    ):
+        return
+
+    variants = create_image_variants(review_image.image_url, "reply-images")
+    updated = ReviewImage.objects.filter(
+        id=review_image_id, image_url=review_image.image_url
+    ).update(image_variants=variants)
+    if not updated:
+        # 처리 중 이미지가 바뀌거나 삭제되었으면 방금 올린 파생 이미지의 참조를 돌려줍니다.
+        release_image_variants(variants)
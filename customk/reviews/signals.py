@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from classes.services import apply_review_ratings
+from common.services.images import needs_image_variants, schedule_image_task
+
+from .models import Review, ReviewImage
+from .services import generate_review_image_variants
+
+
+@receiver(pre_save, sender=Review)
+def remember_previous_rating(sender, instance, **kwargs):
+    instance._previous_rating = (
+        Review.objects.filter(pk=instance.pk)
+        .values_list("class_id", "rating", "created_at")
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=Review)
+def update_class_rating_on_save(sender, instance, created, **kwargs):
+    changes = []
+    previous = getattr(instance, "_previous_rating", None)
+    if previous is not None:
+        class_id, rating, created_at = previous
+        changes.append((class_id, rating, created_at, -1))
+    changes.append((instance.class_id_id, instance.rating, instance.created_at, 1))
+    apply_review_ratings(changes)
+
+
+@receiver(post_delete, sender=Review)
+def update_class_rating_on_delete(sender, instance, **kwargs):
+    apply_review_ratings(
+        [(instance.class_id_id, instance.rating, instance.created_at, -1)]
+    )
+
+
+@receiver(post_save, sender=ReviewImage)
+def schedule_review_image_variants(sender, instance, **kwargs):
+    if needs_image_variants(instance.image_url, instance.image_variants):
+        schedule_image_task(generate_review_image_variants, instance.id)
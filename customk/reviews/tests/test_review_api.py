@@ -1,6 +1,9 @@
 # ruff: noqa: F811
 
+from unittest.mock import patch
+
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework import status
 
@@ -12,12 +15,16 @@ def test_all_reviews_list(api_client, review, sample_user):
     api_client.force_authenticate(user=sample_user)
 
     url = reverse("all-reviews")
-    response = api_client.get(url, {"page": 1, "size": 10})
+    response = api_client.get(url, {"size": 10})
 
     assert response.status_code == status.HTTP_200_OK
     assert "total_count" in response.data
     assert "reviews" in response.data
 
+    # 전체 목록은 keyset 전용이므로 OFFSET 페이지 번호를 받지 않습니다.
+    response = api_client.get(url, {"page": 2, "size": 10})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 @pytest.mark.django_db
 def test_review_list(api_client, sample_class, review):
@@ -45,6 +52,50 @@ def test_review_update(api_client, sample_class, review, sample_user):
     assert response.data["review"]["rating"] == "5.0"
 
 
+@pytest.mark.django_db
+def test_review_update_releases_image_variants(
+    api_client, sample_class, review, sample_user
+):
+    from io import BytesIO
+
+    from PIL import Image
+
+    from common.models import StoredObject
+    from common.services.uploads import store_object
+    from reviews.models import ReviewImage
+    from reviews.services import generate_review_image_variants
+
+    buffer = BytesIO()
+    Image.new("RGB", (500, 500), "red").save(buffer, format="PNG")
+    with (
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.put_object",
+            side_effect=lambda bucket, name, body: (200, f"https://storage/{name}"),
+        ),
+        patch("common.services.images.requests.get") as mock_get,
+    ):
+        mock_get.return_value.content = buffer.getvalue()
+        image = ReviewImage.objects.create(
+            review=review, image_url=store_object(buffer.getvalue(), "png", "reply")
+        )
+        generate_review_image_variants(image.id)
+    assert sum(StoredObject.objects.values_list("ref_count", flat=True)) == 4
+
+    api_client.force_authenticate(user=sample_user)
+    url = reverse(
+        "review-update-delete",
+        kwargs={"class_id": sample_class.id, "review_id": review.id},
+    )
+    with patch(
+        "common.services.ncp_api_conf.ObjectStorage.delete_object",
+        return_value=204,
+    ):
+        response = api_client.patch(url, {"review": "Updated"}, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not StoredObject.objects.exists()
+
+
 @pytest.mark.django_db
 def test_review_delete(api_client, sample_class, review, sample_user):
     api_client.force_authenticate(user=sample_user)
@@ -80,3 +131,231 @@ def test_photo_review_list(api_client, sample_class, review_image):
 
     assert response.status_code == status.HTTP_200_OK
     assert "images" in response.data
+
+
+@pytest.mark.django_db
+def test_review_writes_maintain_class_rating(
+    api_client, sample_class, review, sample_user
+):
+    sample_class.refresh_from_db()
+    assert sample_class.rating_count == 1
+    assert sample_class.average_rating == 4.5
+    assert sample_class.recent_rating_count == 1
+
+    api_client.force_authenticate(user=sample_user)
+    url = reverse(
+        "review-update-delete",
+        kwargs={"class_id": sample_class.id, "review_id": review.id},
+    )
+    api_client.patch(url, {"rating": "3.0"}, format="json")
+    sample_class.refresh_from_db()
+    assert sample_class.rating_count == 1
+    assert sample_class.average_rating == 3.0
+
+    api_client.delete(url)
+    sample_class.refresh_from_db()
+    assert sample_class.rating_count == 0
+    assert sample_class.rating_sum == 0
+    assert sample_class.average_rating is None
+
+
+@pytest.mark.django_db
+def test_review_create_with_multipart_images(api_client, sample_class, sample_user):
+    api_client.force_authenticate(user=sample_user)
+    url = reverse("review-list", kwargs={"class_id": sample_class.id})
+    data = {
+        "review": "Multipart review",
+        "rating": "4.0",
+        "image_files": [
+            SimpleUploadedFile("a.png", b"first", content_type="image/png"),
+            SimpleUploadedFile("b.jpg", b"second", content_type="image/jpeg"),
+        ],
+    }
+
+    with patch(
+        "common.services.ncp_api_conf.ObjectStorage.put_object",
+        side_effect=lambda bucket, name, body: (200, f"https://storage/{name}"),
+    ) as mock_put_object:
+        response = api_client.post(url, data, format="multipart")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(response.data["review"]["images"]) == 2
+    assert all(hasattr(c.args[2], "read") for c in mock_put_object.call_args_list)
+
+
+@pytest.mark.django_db
+def test_review_create_rejects_non_image_file(api_client, sample_class, sample_user):
+    api_client.force_authenticate(user=sample_user)
+    url = reverse("review-list", kwargs={"class_id": sample_class.id})
+    data = {
+        "review": "Multipart review",
+        "rating": "4.0",
+        "image_files": [
+            SimpleUploadedFile("a.txt", b"text", content_type="text/plain"),
+        ],
+    }
+
+    response = api_client.post(url, data, format="multipart")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url_name", ["all-reviews", "review-list"])
+def test_review_list_reads_reaction_counters(
+    api_client, sample_class, sample_user, url_name
+):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from reactions.models import Reaction
+    from reactions.services import set_review_reaction
+    from reviews.models import Review
+    from users.models import User
+
+    reviews = [
+        Review.objects.create(
+            user=sample_user, class_id=sample_class, review=f"review {i}", rating="4.0"
+        )
+        for i in range(5)
+    ]
+    for i in range(3):
+        user = User.objects.create_user(email=f"fan{i}@example.com", password="pw")
+        set_review_reaction(user, reviews[0].id, Reaction.LIKE)
+        set_review_reaction(user, reviews[1].id, Reaction.DISLIKE)
+
+    api_client.force_authenticate(user=sample_user)
+    kwargs = {"class_id": sample_class.id} if url_name == "review-list" else {}
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get(reverse(url_name, kwargs=kwargs), {"size": 10})
+
+    assert response.status_code == status.HTTP_200_OK
+    counters = {
+        item["review"]["id"]: (
+            item["review"]["likes_count"],
+            item["review"]["dislikes_count"],
+        )
+        for item in response.data["reviews"]
+    }
+    assert counters[reviews[0].id] == (3, 0)
+    assert counters[reviews[1].id] == (0, 3)
+    assert not any("reactions_reaction" in q["sql"] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_all_reviews_keyset_pagination(api_client, sample_class, sample_user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from reviews.models import Review
+
+    ids = [
+        Review.objects.create(
+            user=sample_user, class_id=sample_class, review=f"review {i}", rating="4.0"
+        ).id
+        for i in range(5)
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE reviews_review")
+    api_client.force_authenticate(user=sample_user)
+    url = reverse("all-reviews")
+
+    seen, before = [], None
+    with CaptureQueriesContext(connection) as ctx:
+        while True:
+            params = {"size": 2, **({"before": before} if before else {})}
+            response = api_client.get(url, params)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data["total_count"] == 5
+            seen += [item["review"]["id"] for item in response.data["reviews"]]
+            before = response.data["next_before"]
+            if before is None:
+                break
+
+    assert seen == sorted(ids, reverse=True)
+    assert not any("COUNT(" in q["sql"] for q in ctx.captured_queries)
+    assert not any("OFFSET" in q["sql"] for q in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_all_reviews_rejects_invalid_before(api_client, sample_user):
+    api_client.force_authenticate(user=sample_user)
+
+    response = api_client.get(reverse("all-reviews"), {"before": "abc"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_benchmark_pagination_rolls_back_seed():
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    from reviews.models import Review
+
+    out = StringIO()
+    call_command(
+        "benchmark_pagination",
+        "--seed=30",
+        "--size=5",
+        "--pages",
+        "1",
+        "4",
+        "--repeat=1",
+        stdout=out,
+    )
+
+    lines = out.getvalue().splitlines()
+    assert lines[1].split()[:4] == ["page", "offset", "offset+count", "keyset"]
+    assert [line.split()[0] for line in lines[2:]] == ["1", "4"]
+    assert not Review.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, expected_queries",
+    [
+        # 페이지 + 이미지 prefetch + 전체 개수 추정
+        ("all-reviews", 3),
+        # 클래스 확인 + COUNT + 페이지 + 이미지 prefetch
+        ("review-list", 4),
+    ],
+)
+def test_review_list_query_count_is_constant(
+    api_client, sample_class, sample_user, url_name, expected_queries
+):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from reviews.models import Review, ReviewImage
+    from users.models import User
+
+    api_client.force_authenticate(user=sample_user)
+    kwargs = {"class_id": sample_class.id} if url_name == "review-list" else {}
+    url = reverse(url_name, kwargs=kwargs)
+
+    counts = []
+    for batch in range(2):
+        for i in range(1 if batch == 0 else 10):
+            user = User.objects.create_user(
+                email=f"writer{batch}-{i}@example.com", password="pw"
+            )
+            review = Review.objects.create(
+                user=user, class_id=sample_class, review="content", rating="4.0"
+            )
+            for n in range(2):
+                ReviewImage.objects.create(
+                    review=review, image_url=f"http://example.com/{review.id}/{n}.jpg"
+                )
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(url, {"size": 20})
+
+        assert response.status_code == status.HTTP_200_OK
+        reviews = [item["review"] for item in response.data["reviews"]]
+        assert all(len(review["images"]) == 2 for review in reviews)
+        assert all(review["user"]["email"] for review in reviews)
+        counts.append(len(ctx.captured_queries))
+
+    assert counts == [expected_queries, expected_queries]
@@ -15,33 +15,42 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from classes.models import Class
-from reactions.models import Reaction
+from common.pagination import ListPaginator, PaginationError, estimate_count
 from reviews.models import Review
 from reviews.serializers import ReviewSerializer
 
 from .models import ReviewImage
 from .serializers import ReviewImageSerializer
+from .services import get_review_queryset
+
+all_reviews_paginator = ListPaginator(
+    default_size=15, with_total=False, keyset_only=True
+)
+review_paginator = ListPaginator(default_size=15)
+review_image_paginator = ListPaginator(default_size=10)
 
 
 class AllReviewsListView(APIView):
     @extend_schema(
         methods=["GET"],
         summary="전체 리뷰 목록 조회",
-        description="전체 리뷰 목록을 페이지네이션 형태로 조회하는 API입니다.",
+        description=(
+            "전체 리뷰 목록을 최신순으로 조회하는 API입니다. "
+            "다음 페이지는 응답의 next_before 값을 before 로 전달해 조회합니다."
+        ),
         parameters=[
             OpenApiParameter(
-                name="page",
-                description="페이지 번호",
+                name="size",
+                description="페이지당 항목 수",
                 required=False,
-                default=1,
+                default=15,
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
             ),
             OpenApiParameter(
-                name="size",
-                description="페이지당 항목 수",
+                name="before",
+                description="이전 응답의 next_before 값 (생략하면 첫 페이지)",
                 required=False,
-                default=15,
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
             ),
@@ -53,27 +62,16 @@ class AllReviewsListView(APIView):
                     name="AllReviewListResponse",
                     fields={
                         "total_count": serializers.IntegerField(
-                            help_text="전체 리뷰 수"
-                        ),
-                        "total_pages": serializers.IntegerField(
-                            help_text="전체 페이지 수"
+                            help_text="전체 리뷰 수 (통계 기반 추정치)"
                         ),
-                        "current_page": serializers.IntegerField(
-                            help_text="현재 페이지 번호"
+                        "next_before": serializers.IntegerField(
+                            allow_null=True, help_text="다음 페이지 before 값"
                         ),
                         "reviews": serializers.ListSerializer(
                             child=inline_serializer(
                                 name="AllReviewData",
                                 fields={
-                                    "review": inline_serializer(
-                                        name="AllReviewDetail",
-                                        fields={
-                                            **ReviewSerializer().fields,
-                                            "likes_count": serializers.IntegerField(
-                                                help_text="해당 리뷰의 좋아요 수"
-                                            ),
-                                        },
-                                    ),
+                                    "review": ReviewSerializer(),
                                 },
                             ),
                             help_text="리뷰 목록",
@@ -81,39 +79,23 @@ class AllReviewsListView(APIView):
                     },
                 ),
             ),
-            400: OpenApiResponse(description="잘못된 페이지 번호 입력"),
+            400: OpenApiResponse(description="잘못된 before/size 입력 또는 page 사용"),
         },
     )
     def get(self, request: Any, *args: Any, **kwargs: Any) -> Response:
-        page = int(request.GET.get("page", "1"))
-        size = int(request.GET.get("size", "15"))
-        offset = (page - 1) * size
-
-        if page < 1:
-            return Response("Page input error", status=400)
-
-        reviews = Review.objects.all()
-        total_count = reviews.count()
-        total_pages = (total_count // size) + (1 if total_count % size > 0 else 0)
-
-        reviews = reviews.order_by("-id")[offset : offset + size]
-
-        review_data = []
-        for review in reviews:
-            reactions = Reaction.get_review_reactions(review)
-            review_data.append(
-                {
-                    "review": {
-                        **ReviewSerializer(review).data,
-                        "likes_count": reactions["likes_count"],
-                    }
-                }
-            )
+        try:
+            page = all_reviews_paginator.get_page(get_review_queryset(), request.GET)
+        except PaginationError as e:
+            return Response(str(e), status=400)
+
+        review_data = [
+            {"review": ReviewSerializer(review).data} for review in page.items
+        ]
 
         response_data = {
-            "total_count": total_count,
-            "total_pages": total_pages,
-            "current_page": page,
+            # 전체 COUNT(*) 대신 pg_class 통계의 추정치를 사용합니다.
+            "total_count": estimate_count(Review),
+            "next_before": page.next_before,
             "reviews": review_data,
         }
         return Response(response_data, status=200)
@@ -153,6 +135,13 @@ class ReviewListView(APIView):
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
             ),
+            OpenApiParameter(
+                name="before",
+                description="이전 응답의 next_before 값 (지정하면 page 대신 id 기준으로 이어서 조회)",
+                required=False,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
         ],
         responses={
             200: OpenApiResponse(
@@ -169,19 +158,14 @@ class ReviewListView(APIView):
                         "current_page": serializers.IntegerField(
                             help_text="현재 페이지 번호"
                         ),
+                        "next_before": serializers.IntegerField(
+                            allow_null=True, help_text="다음 페이지 before 값"
+                        ),
                         "reviews": serializers.ListSerializer(
                             child=inline_serializer(
                                 name="ReviewData",
                                 fields={
-                                    "review": inline_serializer(
-                                        name="ReviewDetail",
-                                        fields={
-                                            **ReviewSerializer().fields,
-                                            "likes_count": serializers.IntegerField(
-                                                help_text="해당 리뷰의 좋아요 수"
-                                            ),
-                                        },
-                                    ),
+                                    "review": ReviewSerializer(),
                                 },
                             ),
                             help_text="리뷰 목록",
@@ -194,45 +178,26 @@ class ReviewListView(APIView):
         },
     )
     def get(self, request: Any, class_id: int, *args: Any, **kwargs: Any) -> Response:
-        class_instance = get_object_or_404(Class, id=class_id)
-
-        page = int(request.GET.get("page", "1"))
-        size = int(request.GET.get("size", "15"))
-        offset = (page - 1) * size
-
-        if page < 1:
-            return Response("Page input error", status=status.HTTP_400_BAD_REQUEST)
-
-        reviews = Review.objects.filter(class_id=class_instance.id)
-        total_count = reviews.count()
-        total_pages = (total_count // size) + (1 if total_count % size > 0 else 0)
+        class_instance = get_object_or_404(Class.objects.only("id"), id=class_id)
 
-        reviews = reviews.order_by("-id")[offset : offset + size]
+        try:
+            page = review_paginator.get_page(
+                get_review_queryset().filter(class_id=class_instance.id), request.GET
+            )
+        except PaginationError as e:
+            return Response(str(e), status=status.HTTP_400_BAD_REQUEST)
 
-        if not reviews.exists():
+        if not page.items:
             return Response(
                 {"message": "No reviews found for this class."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        review_data = []
-        for review in reviews:
-            reactions = Reaction.get_review_reactions(review)
-            review_data.append(
-                {
-                    "review": {
-                        **ReviewSerializer(review).data,
-                        "likes_count": reactions["likes_count"],
-                    }
-                }
-            )
+        review_data = [
+            {"review": ReviewSerializer(review).data} for review in page.items
+        ]
 
-        response_data = {
-            "total_count": total_count,
-            "total_pages": total_pages,
-            "current_page": page,
-            "reviews": review_data,
-        }
+        response_data = {**page.metadata(), "reviews": review_data}
         return Response(response_data, status=status.HTTP_200_OK)
 
     @extend_schema(
@@ -264,18 +229,13 @@ class ReviewListView(APIView):
         },
     )
     def post(self, request: Any, class_id: int, *args: Any, **kwargs: Any) -> Response:
-        try:
-            class_instance = Class.objects.get(id=class_id)
-        except Class.DoesNotExist:
+        if not Class.objects.filter(id=class_id).exists():
             return Response(
                 {"class_id": "Invalid class ID."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        data = request.data.copy()
-        data["user"] = request.user.id
-        data["class_id"] = class_instance.id
-
-        serializer = ReviewSerializer(data=data)
+        # multipart 요청의 request.data 를 복사하면 업로드 파일까지 깊은 복사되므로 그대로 넘깁니다.
+        serializer = ReviewSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save(user=request.user, class_id=class_id)
             return Response(
@@ -408,6 +368,13 @@ class ReviewImageListView(generics.ListAPIView):
                 type=OpenApiTypes.INT,
                 location=OpenApiParameter.QUERY,
             ),
+            OpenApiParameter(
+                name="before",
+                description="이전 응답의 next_before 값 (지정하면 page 대신 id 기준으로 이어서 조회)",
+                required=False,
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+            ),
         ],
         responses={
             200: OpenApiResponse(
@@ -418,6 +385,9 @@ class ReviewImageListView(generics.ListAPIView):
                         "total_count": serializers.IntegerField(),
                         "total_pages": serializers.IntegerField(),
                         "current_page": serializers.IntegerField(),
+                        "next_before": serializers.IntegerField(
+                            allow_null=True, help_text="다음 페이지 before 값"
+                        ),
                         "images": serializers.ListSerializer(
                             child=inline_serializer(
                                 name="PhotoReviewImageData",
@@ -436,34 +406,22 @@ class ReviewImageListView(generics.ListAPIView):
     def get(
         self, request: Request, class_id: int, review_id: int, *args: Any, **kwargs: Any
     ) -> Response:
-        page = int(request.GET.get("page", "1"))
-        size = int(request.GET.get("size", "10"))
-        offset = (page - 1) * size
-
-        if page < 1:
-            return Response("Page input error", status=status.HTTP_400_BAD_REQUEST)
-
         review_images = ReviewImage.objects.filter(
             review_id=review_id, review__class_id=class_id
         )
-        total_count = review_images.count()
-        total_pages = (total_count // size) + (1 if total_count % size > 0 else 0)
-
-        review_images = review_images.order_by("-id")[offset : offset + size]
+        try:
+            page = review_image_paginator.get_page(review_images, request.GET)
+        except PaginationError as e:
+            return Response(str(e), status=status.HTTP_400_BAD_REQUEST)
 
-        if not review_images.exists():
+        if not page.items:
             return Response(
                 {"message": "No images found for this review."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = ReviewImageSerializer(review_images, many=True)
-        response_data = {
-            "total_count": total_count,
-            "total_pages": total_pages,
-            "current_page": page,
-            "images": serializer.data,
-        }
+        serializer = ReviewImageSerializer(page.items, many=True)
+        response_data = {**page.metadata(), "images": serializer.data}
         return Response(response_data, status=status.HTTP_200_OK)
 
 
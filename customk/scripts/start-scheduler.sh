@@ -0,0 +1,8 @@
+#!/bin/sh
+
+# 최근 30일 기준 집계는 시간이 지나면서 바뀌므로 하루에 한 번 다시 계산하고 오래된 통계를 정리합니다.
+while true; do
+  python manage.py rebuild_class_ratings
+  python manage.py decay_class_popularity
+  sleep 86400
+done
@@ -1,24 +1,37 @@
 import base64
-import uuid
+from typing import Union
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed
 
-from common.services.ncp_api_conf import ObjectStorage
+from common.serializers import ImageUploadField
+from common.services.uploads import (
+    release_object,
+    store_object,
+    upload_file_to_object_storage,
+)
 from config.logger import logger
 from users.models import User
 
 
-def upload_image_to_object_storage(base64_image: str) -> str:
-    obj_client = ObjectStorage()
+def upload_image_to_object_storage(image: Union[str, UploadedFile]) -> str:
+    if isinstance(image, UploadedFile):
+        try:
+            return upload_file_to_object_storage(image, "profile-images")
+        except Exception as e:
+            logger.error(f"Unexpected error during ObjectStorage upload: {str(e)}")
+            raise serializers.ValidationError(
+                {"profile_image": "An unexpected error occurred"}
+            )
 
     try:
-        formatted, img_str = base64_image.split(";base64,")
+        formatted, img_str = image.split(";base64,")
         ext = formatted.split("/")[-1]
         decoded_image = base64.b64decode(img_str)
     except (ValueError, IndexError):
@@ -26,19 +39,8 @@ def upload_image_to_object_storage(base64_image: str) -> str:
             {"profile_image_base64": "Invalid base64 image format"}
         )
 
-    file_name = f"{uuid.uuid4()}.{ext}"
-
-    bucket_name = "customk-imagebucket"
-    object_name = f"profile-images/{file_name}"
     try:
-        status_code, image_url = obj_client.put_object(
-            bucket_name, object_name, decoded_image
-        )
-        if status_code != 200:
-            error_message = f"Failed to upload image. Status code: {status_code}"
-            logger.error(error_message)
-            raise serializers.ValidationError({"profile_image": error_message})
-        return image_url
+        return store_object(decoded_image, ext, "profile-images")
     except Exception as e:
         logger.error(f"Unexpected error during ObjectStorage upload: {str(e)}")
         raise serializers.ValidationError(
@@ -50,7 +52,7 @@ class UserSerializer(serializers.ModelSerializer):
     email = serializers.EmailField()
     name = serializers.CharField(required=False)
     password = serializers.CharField(write_only=True)
-    profile_image = serializers.CharField(write_only=True, required=False)
+    profile_image = ImageUploadField(write_only=True, required=False)
     profile_image_url = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
@@ -101,7 +103,7 @@ class UserInfoSerializer(serializers.ModelSerializer):
 
 
 class UserUpdateSerializer(serializers.ModelSerializer):
-    profile_image = serializers.CharField(write_only=True, required=False)
+    profile_image = ImageUploadField(write_only=True, required=False)
     profile_image_url = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
@@ -116,8 +118,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         base64_image = validated_data.pop("profile_image", None)
 
         if instance.profile_image:
-            obj = ObjectStorage()
-            obj_status_code = obj.delete_object(instance.profile_image)
+            obj_status_code = release_object(instance.profile_image)
 
             if obj_status_code != 204:
                 raise ValidationError(
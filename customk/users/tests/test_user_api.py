@@ -52,6 +52,39 @@ def test_signup(api_client):
         mock_put_object.assert_called_once()
 
 
+def test_signup_with_multipart_image(api_client):
+    url = reverse("signup")
+    image_path = os.path.join(os.path.dirname(__file__), "testimage.png")
+
+    with (
+        open(image_path, "rb") as image_file,
+        patch(
+            "common.services.ncp_api_conf.ObjectStorage.put_object"
+        ) as mock_put_object,
+    ):
+        mock_put_object.return_value = (
+            200,
+            "https://mock-storage-url.com/profile-images/testimage.png",
+        )
+        data = {
+            "name": "testname",
+            "email": "multipart@example.com",
+            "password": "strongpassword",
+            "profile_image": image_file,
+        }
+        response = api_client.post(url, data, format="multipart")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        bucket, object_name, body = mock_put_object.call_args.args
+        assert object_name.startswith("profile-images/")
+        assert object_name.endswith(".png")
+        # 디코딩된 bytes 가 아니라 업로드 파일 객체를 그대로 스트리밍합니다.
+        assert hasattr(body, "read")
+
+    user = User.objects.get(email="multipart@example.com")
+    assert user.profile_image.endswith("testimage.png")
+
+
 def test_login(api_client, sample_user):
     url = reverse("login")
     data = {"email": "test@example.com", "password": "strongpassword"}
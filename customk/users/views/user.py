@@ -12,7 +12,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from common.services.ncp_api_conf import ObjectStorage
+from common.services.uploads import release_object
 from config.logger import logger
 from users.serializers.user_serializer import (
     UserInfoSerializer,
@@ -119,9 +119,8 @@ class UserDetailView(APIView):
             token = RefreshToken(refresh_token)  # type: ignore
             token.blacklist()
 
-        obj = ObjectStorage()
         if user.profile_image:
-            obj_status_code = obj.delete_object(user.profile_image)
+            obj_status_code = release_object(user.profile_image)
 
             if obj_status_code != 204:
                 return Response(